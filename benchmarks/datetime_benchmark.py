@@ -0,0 +1,67 @@
+"""
+Benchmarks parsing and formatting timestamps with DateTimeField and
+DateField.
+
+Usage: python benchmarks/datetime_benchmark.py [count]
+"""
+from __future__ import print_function
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+from pyserializer import dateparse
+from pyserializer.fields import DateField, DateTimeField
+
+
+def make_timestamps(count):
+    start = datetime(2015, 1, 1)
+    return [
+        (start + timedelta(seconds=i * 37)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        for i in range(count)
+    ]
+
+
+def run(label, func, values):
+    start = time.time()
+    for value in values:
+        func(value)
+    elapsed = time.time() - start
+    print('%-40s %8.3fs %12.0f values/s' % (
+        label, elapsed, len(values) / elapsed))
+
+
+def main(count):
+    timestamps = make_timestamps(count)
+    field = DateTimeField()
+    print('%d timestamps' % count)
+    run('strptime', lambda value: datetime.strptime(
+        value, '%Y-%m-%dT%H:%M:%SZ'), timestamps)
+    run('DateTimeField.to_python (iso-8601)', field.to_python, timestamps)
+    # Force the regex parser, used when `fromisoformat` is not available
+    # or does not accept the value.
+    fromisoformat = dateparse.datetime_fromisoformat
+    dateparse.datetime_fromisoformat = None
+    try:
+        run('DateTimeField.to_python (regex)', field.to_python, timestamps)
+    finally:
+        dateparse.datetime_fromisoformat = fromisoformat
+    values = [field.to_python(value) for value in timestamps]
+    run('strftime', lambda value: value.strftime(
+        '%Y-%m-%dT%H:%M:%SZ'), values)
+    run('DateTimeField.to_native (iso-8601)', field.to_native, values)
+    field = DateTimeField(format='%Y-%m-%dT%H:%M:%SZ')
+    run('DateTimeField.to_native (compiled)', field.to_native, values)
+    # A column repeating a few hundred dates
+    dates = [values[i % 300].date() for i in range(count)]
+    run('date.strftime (repeated)', lambda value: value.strftime(
+        '%d/%m/%Y'), dates)
+    field = DateField(format='%d/%m/%Y')
+    run('DateField.to_native (compiled)', field.to_native, dates)
+    field = DateField(format='%d/%m/%Y', cache_size=1000)
+    run('DateField.to_native (cached)', field.to_native, dates)
+    print('cache hit rate: %.4f' % field.cache.hit_rate)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,64 @@
+"""
+Benchmarks serializing a list of objects in several processes with the
+`parallel` option.
+
+Usage: python benchmarks/parallel_benchmark.py [count]
+"""
+from __future__ import print_function
+
+import sys
+import time
+import multiprocessing
+from datetime import datetime, timedelta
+
+from pyserializer import fields
+from pyserializer.serializers import Serializer
+
+
+class Event(object):
+
+    def __init__(self, index, start):
+        self.id = index
+        self.name = 'event %d' % index
+        self.price = index * 1.5
+        self.starts_at = start + timedelta(minutes=index)
+        self.ends_at = start + timedelta(minutes=index + 90)
+        self.tags = ['tag%d' % (index % 10), 'tag%d' % (index % 7)]
+
+
+class EventSerializer(Serializer):
+    id = fields.IntegerField()
+    name = fields.CharField()
+    price = fields.FloatField()
+    starts_at = fields.DateTimeField(format='%d/%m/%Y %H:%M')
+    ends_at = fields.DateTimeField()
+    summary = fields.MethodField('get_summary')
+
+    def get_summary(self, obj):
+        return '%s (%s)' % (obj.name, ', '.join(sorted(obj.tags)))
+
+
+def run(label, count, **kwargs):
+    start = datetime(2015, 1, 1)
+    events = [Event(index, start) for index in range(count)]
+    start = time.time()
+    EventSerializer(events, many=True, **kwargs).data
+    elapsed = time.time() - start
+    print('%-40s %8.3fs %12.0f objects/s' % (
+        label, elapsed, count / elapsed))
+    return elapsed
+
+
+def main(count):
+    print('%d objects, %d CPUs' % (count, multiprocessing.cpu_count()))
+    elapsed = run('serial', count)
+    workers = 1
+    while workers <= multiprocessing.cpu_count():
+        parallel_elapsed = run('parallel=%d' % workers, count,
+                               parallel=workers)
+        print('%-40s %8.2fx' % ('speedup', elapsed / parallel_elapsed))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,372 @@
+import asyncio
+import inspect
+import operator
+from collections import OrderedDict, deque
+from itertools import islice
+
+from pyserializer import constants
+from pyserializer.compiler import json_encoder, takes_own_value
+from pyserializer.fields import Field
+from pyserializer.serializers import Serializer
+from pyserializer.utils import filter_list, get_source_accessor
+
+
+__all__ = [
+    'AsyncSerializer',
+]
+
+
+# The kinds of fields, how their value is computed
+VALUE = 'value'
+OWN_VALUE = 'own_value'
+NESTED = 'nested'
+
+
+async def await_value(value, semaphore):
+    """
+    Awaits the value while holding the semaphore.
+    """
+    async with semaphore:
+        return await value
+
+
+async def await_and_convert(value, convert, semaphore):
+    """
+    Awaits the value while holding the semaphore, and converts the result.
+    """
+    async with semaphore:
+        value = await value
+    return convert(value)
+
+
+def is_async_iterable(obj):
+    """
+    True if the object is an async iterable, eg: an async database cursor.
+    """
+    return hasattr(obj, '__aiter__')
+
+
+async def read_objects(iterator, count):
+    """
+    Returns a list of the next `count` objects of a sync or async iterator,
+    fewer if the iterator is exhausted.
+    """
+    if not hasattr(iterator, '__anext__'):
+        return list(islice(iterator, count))
+    objs = []
+    while len(objs) < count:
+        try:
+            objs.append(await iterator.__anext__())
+        except StopAsyncIteration:
+            break
+    return objs
+
+
+class JsonChunkIterator(object):
+    """
+    The async iterator of JSON chunks returned by
+    `AsyncSerializer.aiter_json`.
+
+    The objects are read from the instance and serialized in batches of
+    `yield_every` objects, whose awaitable values are awaited concurrently.
+    The event loop runs other tasks between the batches, even when the
+    objects have no awaitable values.
+    """
+
+    def __init__(self, serializer, chunk_size, yield_every):
+        self.serializer = serializer
+        self.chunk_size = chunk_size
+        self.yield_every = yield_every
+        self.semaphore = None
+        self.iterator = None
+        self.chunks = deque()
+        self.chunk = ['[']
+        self.size = 1
+        self.separator = ''
+        self.finished = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.chunks:
+            if self.finished:
+                raise StopAsyncIteration
+            await self.serialize_batch()
+        return self.chunks.popleft()
+
+    async def serialize_batch(self):
+        """
+        Serializes the next batch of objects, and adds the chunks which are
+        complete to `chunks`.
+        """
+        serializer = self.serializer
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(serializer.max_concurrency)
+            instance = serializer.instance
+            if not serializer.many or instance is None:
+                self.chunks.append(json_encoder.encode(
+                    await serializer.ato_native(instance, self.semaphore)
+                ))
+                self.finished = True
+                return
+            if is_async_iterable(instance):
+                self.iterator = instance.__aiter__()
+            else:
+                self.iterator = iter(instance)
+        objs = await read_objects(self.iterator, self.yield_every)
+        for data in await serializer.ato_native(objs, self.semaphore):
+            encoded = json_encoder.encode(data)
+            self.chunk.append(self.separator)
+            self.chunk.append(encoded)
+            self.separator = ', '
+            self.size += len(encoded) + 2
+            if self.size >= self.chunk_size:
+                self.chunks.append(''.join(self.chunk))
+                self.chunk = []
+                self.size = 0
+        if len(objs) < self.yield_every:
+            self.chunk.append(']')
+            self.chunks.append(''.join(self.chunk))
+            self.finished = True
+        else:
+            # Let the other tasks run between the batches
+            await asyncio.sleep(0)
+
+
+class AsyncSerializer(Serializer):
+    """
+    A serializer which can be serialized from a coroutine, with
+    `await serializer.adata()`.
+
+    `MethodField` methods can be coroutine functions, and the sources of
+    the fields can be awaitable, eg: an attribute holding a future or a
+    coroutine method of the object. The awaitables of all the objects are
+    awaited concurrently, at most `max_concurrency` at once, and their
+    results are put back in the order of the fields and the objects.
+    Values which are not awaitable are serialized the same way as by
+    `Serializer`.
+    Requires Python 3.5+.
+    """
+
+    # The maximum number of awaitables awaited at once
+    max_concurrency = 100
+
+    def __init__(self, instance=None, *args, max_concurrency=None, **kwargs):
+        """
+        :param instance: The object to be serialized. With `many=True` it
+            can also be an async iterable, eg: an async database cursor.
+        :param max_concurrency: The maximum number of awaitables awaited at
+            once by `adata`. Defaults to the `max_concurrency` attribute of
+            the class.
+        """
+        if is_async_iterable(instance):
+            # `Serializer` only accepts iterables with many=True
+            super(AsyncSerializer, self).__init__(None, *args, **kwargs)
+            self.instance = instance
+        else:
+            super(AsyncSerializer, self).__init__(instance, *args, **kwargs)
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        self._async_fields = None
+
+    def get_async_fields(self):
+        """
+        Returns a list of `(kind, field_name, field, getter)` tuples, the
+        fields of the serializer bound to the instance, with the function
+        which gets the source value of the field from an object.
+        The fields are bound once per serializer instance.
+        """
+        if self._async_fields is None:
+            plan = self.plan
+            fields = []
+            for field_name, field in zip(plan.fields.keys(),
+                                         plan.bind_fields(self)):
+                if not isinstance(field, Field):
+                    kind = NESTED
+                    if field.source:
+                        getter = get_source_accessor(
+                            field.source,
+                            field.allow_blank_source
+                        )
+                    else:
+                        getter = operator.attrgetter(field_name)
+                elif takes_own_value(field):
+                    kind = OWN_VALUE
+                    getter = None
+                else:
+                    kind = VALUE
+                    getter = get_source_accessor(
+                        field.source or field_name,
+                        self.allow_blank_source
+                    )
+                fields.append((kind, field_name, field, getter))
+            self._async_fields = fields
+        return self._async_fields
+
+    def make_output(self, values):
+        """
+        Returns the serialized object of the `output_type` of the
+        serializer from the list of the values of its fields.
+        """
+        plan = self.plan
+        if plan.output_type == constants.TUPLE:
+            return tuple(values)
+        if plan.output_type == constants.NAMEDTUPLE:
+            return plan.row_class(*values)
+        items = zip(plan.fields.keys(), values)
+        if plan.output_type == constants.DICT:
+            return dict(items)
+        return OrderedDict(items)
+
+    def prepare_row(self, obj, semaphore):
+        """
+        Serializes the values of an object which are not awaitable.
+        Returns a tuple of the list of the values of the fields and a list
+        of `(index, coroutine)` tuples, the coroutines which compute the
+        values of the fields at these indexes.
+        """
+        values = []
+        pending = []
+        for index, (kind, field_name, field, getter) in enumerate(
+                self.get_async_fields()):
+            if kind == OWN_VALUE:
+                value = field.field_to_native(obj, field_name)
+                if inspect.isawaitable(value):
+                    pending.append((index, await_value(value, semaphore)))
+            elif kind == VALUE:
+                if obj is None:
+                    value = field.empty
+                else:
+                    value = getter(obj)
+                    if inspect.iscoroutinefunction(value):
+                        value = value()
+                    if inspect.isawaitable(value):
+                        pending.append((index, await_and_convert(
+                            value,
+                            field.to_native,
+                            semaphore
+                        )))
+                    else:
+                        value = field.to_native(value)
+            else:
+                value = getter(obj)
+                if inspect.isawaitable(value):
+                    pending.append((index, self.aserialize_nested(
+                        field,
+                        value,
+                        semaphore
+                    )))
+                else:
+                    value = self.serialize_nested(field, value, semaphore)
+                    if inspect.isawaitable(value):
+                        pending.append((index, value))
+            values.append(value)
+        return values, pending
+
+    def serialize_nested(self, field, value, semaphore):
+        """
+        Serializes the value of a nested serializer. Returns a coroutine if
+        the nested serializer is an `AsyncSerializer`.
+        """
+        value = filter_list(value)
+        if value is None or value == []:
+            return [] if field.many else None
+        if isinstance(field, AsyncSerializer):
+            return field.ato_native(value, semaphore)
+        return field.to_native(value)
+
+    async def aserialize_nested(self, field, value, semaphore):
+        """
+        Awaits the value of a nested serializer and serializes it.
+        """
+        value = await await_value(value, semaphore)
+        value = self.serialize_nested(field, value, semaphore)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    async def complete_row(self, values, pending):
+        """
+        Awaits the pending values of an object and returns the serialized
+        object.
+        """
+        results = await asyncio.gather(*[
+            coroutine for index, coroutine in pending
+        ])
+        for (index, coroutine), result in zip(pending, results):
+            values[index] = result
+        return self.make_output(values)
+
+    async def ato_native(self, obj, semaphore=None):
+        """
+        Serializes objects from a coroutine, the same way as `to_native`.
+        The awaitable values of all the objects are awaited concurrently.
+
+        :param obj: The python object passed in to be serialized.
+        :param semaphore: (optional) The `asyncio.Semaphore` limiting the
+            number of awaitables awaited at once. Defaults to a new
+            semaphore of `max_concurrency`.
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+        if not isinstance(obj, (list, tuple)):
+            values, pending = self.prepare_row(obj, semaphore)
+            if pending:
+                return await self.complete_row(values, pending)
+            return self.make_output(values)
+        output = []
+        indexes = []
+        coroutines = []
+        for item in obj:
+            if isinstance(item, (list, tuple)):
+                coroutine = self.ato_native(item, semaphore)
+            else:
+                values, pending = self.prepare_row(item, semaphore)
+                if not pending:
+                    output.append(self.make_output(values))
+                    continue
+                coroutine = self.complete_row(values, pending)
+            indexes.append(len(output))
+            coroutines.append(coroutine)
+            output.append(None)
+        if coroutines:
+            results = await asyncio.gather(*coroutines)
+            for index, result in zip(indexes, results):
+                output[index] = result
+        return output
+
+    async def adata(self):
+        """
+        Returns the serialized data on the serializer, from a coroutine.
+        Caches the data once created, the same way as `data`.
+        """
+        if not self._data:
+            instance = self.instance
+            if self.many and is_async_iterable(instance):
+                objs = []
+                async for obj in instance:
+                    objs.append(obj)
+                instance = objs
+            elif (self.many and instance is not None and
+                    not isinstance(instance, (list, tuple))):
+                instance = list(instance)
+            self._data = await self.ato_native(instance)
+        return self._data
+
+    def aiter_json(self, chunk_size=65536, yield_every=1000):
+        """
+        Returns an async iterator which serializes `instance` to JSON,
+        yielding the encoded string in chunks, eg: for a streaming ASGI
+        response. With `many=True` the instance can be an iterable or an
+        async iterable, eg: an async database cursor. The objects are
+        serialized and written out incrementally, so the whole list is
+        never held in memory. The output is the same as
+        `json.dumps(await serializer.adata())`.
+
+        :param chunk_size: The approximate size, in characters, of the
+            chunks yielded.
+        :param yield_every: The number of objects serialized at once. The
+            event loop runs other tasks after each batch of objects.
+        """
+        return JsonChunkIterator(self, chunk_size, yield_every)
@@ -0,0 +1,118 @@
+import six
+from datetime import datetime
+
+from pyserializer.compiler import takes_own_value
+from pyserializer.dateparse import get_fixed_timezone
+from pyserializer.fields import Field
+from pyserializer.utils import get_source_accessor
+
+# NumPy is an optional dependency: `pip install pyserializer[numpy]`
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = [
+    'get_dtype',
+    'to_numpy',
+]
+
+
+OBJECT_DTYPE = 'O'
+
+# The kinds of dtypes which can not hold missing values, integers and bools
+NOT_NULLABLE_KINDS = 'iub'
+
+
+def require_numpy():
+    """
+    Raises `ImportError` if NumPy is not installed.
+    """
+    if numpy is None:
+        raise ImportError(
+            'NumPy is required to export NumPy arrays. Install it with '
+            '`pip install pyserializer[numpy]`.'
+        )
+
+
+def get_field_dtype(field):
+    """
+    Returns the NumPy dtype of a field. Fields without a `numpy_dtype`,
+    fields which get their own value and nested serializers are exported
+    as objects.
+    """
+    if isinstance(field, Field) and not takes_own_value(field):
+        return field.numpy_dtype or OBJECT_DTYPE
+    return OBJECT_DTYPE
+
+
+def get_dtype(fields):
+    """
+    Returns the structured NumPy dtype of the fields.
+
+    :param fields: An ordered mapping of field names to fields.
+    """
+    require_numpy()
+    return numpy.dtype([
+        (str(field_name), get_field_dtype(field))
+        for field_name, field in six.iteritems(fields)
+    ])
+
+
+def to_naive_utc(value):
+    """
+    Converts an aware datetime to a naive datetime in UTC, as NumPy
+    datetimes have no timezone.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(get_fixed_timezone(0)).replace(tzinfo=None)
+    return value
+
+
+def to_numpy(serializer, objs):
+    """
+    Exports a list of objects to a NumPy structured array, with the dtype
+    derived from the fields of the serializer.
+
+    Fields with a `numpy_dtype` are filled in bulk from the values of the
+    objects. `None` values become `NaN` in float columns and `NaT` in
+    datetime columns. Integer and bool columns which contain `None` are
+    exported as objects instead, holding the values as they are. The
+    other fields hold their serialized values as objects.
+
+    :param serializer: The serializer the objects are exported with.
+    :param objs: A list of the objects.
+    """
+    plan = serializer.plan
+    columns = []
+    for (field_name, field), bound_field in zip(
+            six.iteritems(plan.fields), plan.bind_fields(serializer)):
+        field_dtype = numpy.dtype(get_field_dtype(field))
+        if field_dtype.kind == OBJECT_DTYPE:
+            column = plan.get_column_function(field_name, bound_field)(objs)
+        else:
+            get = get_source_accessor(
+                field.source or field_name,
+                serializer.allow_blank_source
+            )
+            column = [None if obj is None else get(obj) for obj in objs]
+            if field_dtype.kind == 'M':
+                column = [to_naive_utc(value) for value in column]
+            elif (field_dtype.kind in NOT_NULLABLE_KINDS and
+                    any(value is None for value in column)):
+                field_dtype = numpy.dtype(OBJECT_DTYPE)
+        columns.append((str(field_name), field_dtype, column))
+    array = numpy.empty(len(objs), dtype=numpy.dtype([
+        (field_name, field_dtype)
+        for field_name, field_dtype, column in columns
+    ]))
+    for field_name, field_dtype, column in columns:
+        if field_dtype.kind != OBJECT_DTYPE:
+            array[field_name] = column
+            continue
+        # Assign one by one, NumPy would broadcast lists into the array
+        target = array[field_name]
+        for index, value in enumerate(column):
+            target[index] = value
+    return array
@@ -0,0 +1,627 @@
+import six
+import json
+import threading
+import operator
+from collections import OrderedDict, namedtuple
+
+from pyserializer import constants
+from pyserializer.fields import Field
+from pyserializer.utils import (
+    get_source_accessor,
+    is_mapping,
+    filter_list
+)
+
+
+__all__ = [
+    'SerializationPlan',
+    'iter_source_paths',
+]
+
+
+# Encodes the field keys and values for the JSON serialize functions.
+# Uses the same defaults as `json.dumps`.
+json_encoder = json.JSONEncoder()
+
+
+def takes_own_value(field):
+    """
+    True if the field overrides `field_to_native` to get its own value
+    from the object, else False. These fields have to be bound to the
+    serializer instance.
+    """
+    return type(field).field_to_native is not Field.field_to_native
+
+
+def is_batched(field):
+    """
+    True if the values of the field are computed for a list of objects at
+    once with its `field_to_native_many` method: fields which get their own
+    value and are `batched`, eg: `MethodField(concurrent=True)`, and nested
+    serializers with batched fields.
+    """
+    if isinstance(field, Field):
+        return (
+            takes_own_value(field) and
+            bool(getattr(field, 'batched', False))
+        )
+    plan = getattr(field, 'plan', None)
+    return plan is not None and bool(plan.batched_fields)
+
+
+def iter_source_paths(fields, prefix=(), many=False):
+    """
+    Returns a generator of the source paths read by the fields, including
+    the fields of the nested serializers. Yields `(names, is_relation,
+    many)` tuples: the tuple of the names of the path, `True` if the path
+    leads to a related object which is read further, either by a nested
+    serializer or a dotted source, and `True` if the path goes through a
+    `many=True` nested serializer.
+    Fields which get their own value, eg: `MethodField`, are skipped as the
+    paths they read are not known.
+
+    :param fields: An ordered mapping of field names to fields.
+    :param prefix: The names of the path of the nested serializer the
+        fields belong to.
+    :param many: `True` if the fields belong to a `many=True` nested
+        serializer.
+    """
+    for field_name, field in six.iteritems(fields):
+        if isinstance(field, Field) and takes_own_value(field):
+            continue
+        names = prefix + tuple((field.source or field_name).split('.'))
+        for length in range(len(prefix) + 1, len(names)):
+            yield names[:length], True, many
+        if isinstance(field, Field):
+            yield names, False, many
+            continue
+        # Nested serializer
+        nested_many = many or field.many
+        yield names, True, nested_many
+        for path in iter_source_paths(
+                field._get_fields_without_copying(),
+                names,
+                nested_many):
+            yield path
+
+
+class Missing(object):
+    """
+    Marks a source path which could not be resolved.
+    Holds the `AttributeError` raised while resolving the path.
+    """
+    __slots__ = ('error',)
+
+    def __init__(self, error):
+        self.error = error
+
+
+def resolve(obj, names):
+    """
+    Resolves the names one after another starting from obj, the same way
+    `get_object_by_source` does. Returns a `Missing` instance instead of
+    raising when a name can not be resolved.
+    """
+    if obj.__class__ is Missing:
+        return obj
+    try:
+        for name in names:
+            if is_mapping(obj):
+                obj = obj.get(name)
+            else:
+                obj = getattr(obj, name)
+    except AttributeError as e:
+        return Missing(e)
+    return obj
+
+
+def unwrap(value, allow_blank_source):
+    """
+    Returns the resolved value, `None` for a missing value if
+    `allow_blank_source` is set, else raises the original `AttributeError`.
+    """
+    if value.__class__ is Missing:
+        if not allow_blank_source:
+            raise value.error
+        return None
+    return value
+
+
+class SerializationPlan(object):
+    """
+    A compiled serialization plan for the fields of a serializer.
+
+    The plan generates the source of a specialized Python function for the
+    fields, with the field accessors and converters bound as locals, so
+    serializing an object does not have to walk the fields again.
+    Sources are resolved through precompiled accessors, see
+    :func:`~pyserializer.utils.get_source_accessor`. When several fields
+    share a dotted source prefix (eg: `provider.profile.name` and
+    `provider.profile.npi`) the shared intermediate objects are resolved
+    only once per object.
+    The values of batched fields, see :func:`is_batched`, can be computed
+    for a list of objects beforehand, and passed to the serialize function
+    as `prefetched`.
+    Plans are compiled once per serializer class and shared by its
+    instances.
+    """
+
+    def __init__(self,
+                 fields,
+                 allow_blank_source=False,
+                 name='Serializer',
+                 output_type=constants.DEFAULT_OUTPUT_TYPE):
+        """
+        :param fields: An ordered mapping of field names to fields.
+        :param allow_blank_source: The `allow_blank_source` value of the
+            serializer the plan is compiled for.
+        :param name: The name of the serializer class. Used in the filename
+            of the generated code and the name of the namedtuple class.
+        :param output_type: The type of the serialized objects. One of
+            `constants.OUTPUT_TYPES`.
+        """
+        if output_type not in constants.OUTPUT_TYPES:
+            raise ValueError(
+                '`output_type` must be one of %s.' % (constants.OUTPUT_TYPES,)
+            )
+        self.fields = OrderedDict(fields)
+        self.allow_blank_source = allow_blank_source
+        self.name = name
+        self.output_type = output_type
+        self.row_class = None
+        if output_type == constants.NAMEDTUPLE:
+            self.row_class = namedtuple(
+                name,
+                list(self.fields.keys()),
+                rename=True
+            )
+        self.batched_fields = [
+            index for index, field in enumerate(self.fields.values())
+            if is_batched(field)
+        ]
+        self.prefixes = self.get_shared_prefixes()
+        self.accessors = {}
+        self.source = self.generate_source(accessors=self.accessors)
+        self.factory = self.compile(self.source, self.accessors)
+        self._json_factory = None
+        self._json_factory_lock = threading.Lock()
+
+    def get_source_paths(self):
+        """
+        Returns a list of `(index, names)` tuples, the source path of each
+        field which is resolved by the plan.
+        """
+        paths = []
+        for index, (field_name, field) in enumerate(
+                six.iteritems(self.fields)):
+            if not isinstance(field, Field):
+                source = field.source
+            elif not takes_own_value(field):
+                source = field.source or field_name
+            else:
+                source = None
+            if source:
+                paths.append((index, tuple(source.split('.'))))
+        return paths
+
+    def get_shared_prefixes(self):
+        """
+        Builds a prefix tree of the field sources and returns a dict of the
+        intermediate paths shared by more than one field, mapped to the name
+        of the local they are resolved into.
+        """
+        tree = {}
+        for index, names in self.get_source_paths():
+            for length in range(1, len(names) + 1):
+                node = tree.setdefault(names[:length], [0, False])
+                node[0] += 1
+                if length < len(names):
+                    node[1] = True
+        shared = sorted(
+            prefix for prefix, (count, intermediate) in six.iteritems(tree)
+            if count > 1 and intermediate
+        )
+        return dict(
+            (prefix, 'prefix_%d' % i) for i, prefix in enumerate(shared)
+        )
+
+    def get_value_expression(self,
+                             index,
+                             source,
+                             allow_blank_source,
+                             body,
+                             resolved,
+                             accessors):
+        """
+        Returns the expression which gets the value of a field by source.
+        Appends the lines resolving any shared intermediate objects the
+        source needs, and which are not in the `resolved` set yet, to the
+        body. Accessors of the source are added to the `accessors` dict.
+        """
+        names = tuple(source.split('.'))
+        local, parent = None, 'obj'
+        for length in range(1, len(names) + 1):
+            prefix = names[:length]
+            if prefix not in self.prefixes:
+                break
+            local = self.prefixes[prefix]
+            if local not in resolved:
+                body.append('%s = resolve(%s, %r)' % (
+                    local, parent, prefix[-1:]))
+                resolved.add(local)
+            parent = local
+        else:
+            # The source itself is a shared intermediate
+            return 'unwrap(%s, %r)' % (local, allow_blank_source)
+        if local is None:
+            return '%s(obj)' % self.add_accessor(
+                index, source, allow_blank_source, accessors)
+        return 'unwrap(resolve(%s, %r), %r)' % (
+            local, names[length - 1:], allow_blank_source)
+
+    def generate_source(self, as_json=False, accessors=None):
+        """
+        Returns the source of the factory function, which binds the fields
+        of a serializer as locals and returns the serialize function.
+
+        :param as_json: If `True` the serialize function returns the object
+            encoded as JSON instead of the `output_type` of the plan. The
+            JSON encoded keys are inlined in the generated code. Objects of
+            the tuple output types are encoded as JSON arrays, the same way
+            as by `json.dumps`.
+        :param accessors: (optional) The dict the accessors used by the
+            generated code are added to, which has to be passed to `compile`
+            with the source.
+
+        The serialize function takes the object and an optional tuple of
+        the prefetched values of the batched fields.
+        """
+        bindings = []
+        body = []
+        chunks = []
+        keys = []
+        # The state of one call, so that sources can be generated by
+        # concurrent threads
+        resolved = set()
+        if accessors is None:
+            accessors = {}
+        as_array = self.output_type in (constants.TUPLE, constants.NAMEDTUPLE)
+        start, end = ('[', ']') if as_array else ('{', '}')
+        for index, (field_name, field) in enumerate(
+                six.iteritems(self.fields)):
+            key = repr(field_name)
+            if as_json:
+                target = 'chunk_%d' % index
+                separator = start if index == 0 else ', '
+                if as_array:
+                    chunks.append(repr(separator))
+                else:
+                    chunks.append(repr(
+                        separator + json_encoder.encode(field_name) + ': '
+                    ))
+                chunks.append(target)
+                encode = 'encode_value(%s)'
+            else:
+                target = 'value_%d' % index
+                encode = '%s'
+            keys.append((key, target))
+            bindings.append('field_%d = fields[%d]' % (index, index))
+            if not isinstance(field, Field):
+                # Nested serializer
+                if field.source:
+                    getter = self.get_value_expression(
+                        index,
+                        field.source,
+                        field.allow_blank_source,
+                        body,
+                        resolved,
+                        accessors
+                    )
+                else:
+                    getter = 'getattr(obj, %s)' % key
+                if as_json:
+                    blank = "'[]'" if field.many else "'null'"
+                    method = 'to_json'
+                else:
+                    blank = '[]' if field.many else 'None'
+                    method = 'to_native'
+                lines = [
+                    '%s = filter_list(%s)' % (target, getter),
+                    'if %s is None or %s == []:' % (target, target),
+                    '    %s = %s' % (target, blank),
+                    'else:',
+                    '    %s = field_%d.%s(%s)' % (
+                        target, index, method, target),
+                ]
+                if index in self.batched_fields:
+                    lines = [
+                        'if prefetched is not None:',
+                        '    %s = %s' % (target, encode % (
+                            'prefetched[%d]'
+                            % self.batched_fields.index(index))),
+                        'else:',
+                    ] + ['    ' + line for line in lines]
+                body.extend(lines)
+            elif takes_own_value(field):
+                # The field takes care of getting its own value
+                bindings.append(
+                    'field_to_native_%d = field_%d.field_to_native'
+                    % (index, index)
+                )
+                getter = 'field_to_native_%d(obj, %s)' % (index, key)
+                if index in self.batched_fields:
+                    getter = '%s if prefetched is None else prefetched[%d]' % (
+                        getter, self.batched_fields.index(index))
+                body.append('%s = %s' % (target, encode % getter))
+            else:
+                bindings.extend([
+                    'to_native_%d = field_%d.to_native' % (index, index),
+                    'empty_%d = field_%d.empty' % (index, index),
+                ])
+                getter = self.get_value_expression(
+                    index,
+                    field.source or field_name,
+                    self.allow_blank_source,
+                    body,
+                    resolved,
+                    accessors
+                )
+                body.append('%s = %s' % (
+                    target,
+                    encode % ('empty_%d if obj is None else to_native_%d(%s)'
+                              % (index, index, getter))
+                ))
+        lines = ['def bind(fields):']
+        lines.extend('    ' + line for line in bindings)
+        lines.append('    def serialize(obj, prefetched=None):')
+        lines.extend('        ' + line for line in body)
+        if as_json:
+            chunks.append(repr(end))
+            if len(chunks) == 1:
+                chunks.insert(0, repr(start))
+            lines.append('        return %s' % ' + '.join(chunks))
+        else:
+            lines.extend(
+                '        ' + line for line in self.generate_return(keys)
+            )
+        lines.append('    return serialize')
+        return '\n'.join(lines) + '\n'
+
+    def generate_return(self, keys):
+        """
+        Returns the lines which build the serialized object of the
+        `output_type` of the plan and return it.
+
+        :param keys: A list of `(key, local)` tuples, the repr of the key and
+            the name of the local holding the value of each field.
+        """
+        values = ''.join('%s, ' % local for key, local in keys)
+        if self.output_type == constants.DICT:
+            return ['return {%s}' % ', '.join(
+                '%s: %s' % (key, local) for key, local in keys)]
+        if self.output_type == constants.TUPLE:
+            return ['return (%s)' % values]
+        if self.output_type == constants.NAMEDTUPLE:
+            return ['return row_class(%s)' % values]
+        lines = ['output = OrderedDict()']
+        lines.extend('output[%s] = %s' % (key, local) for key, local in keys)
+        lines.append('return output')
+        return lines
+
+    def add_accessor(self, index, source, allow_blank_source, accessors):
+        """
+        Adds the source accessor of a field to the `accessors` dict.
+        Returns the name the accessor is bound to in the generated code.
+        """
+        name = 'get_%d' % index
+        accessors[name] = get_source_accessor(source, allow_blank_source)
+        return name
+
+    def compile(self, source, accessors):
+        """
+        Compiles the generated source and returns the factory function.
+
+        :param accessors: The dict of the accessors added while generating
+            the source.
+        """
+        namespace = {
+            'OrderedDict': OrderedDict,
+            'encode_value': json_encoder.encode,
+            'row_class': self.row_class,
+            'filter_list': filter_list,
+            'resolve': resolve,
+            'unwrap': unwrap,
+        }
+        namespace.update(accessors)
+        code = compile(source, '<serialization plan %s>' % self.name, 'exec')
+        six.exec_(code, namespace)
+        return namespace['bind']
+
+    @property
+    def json_factory(self):
+        """
+        The factory function of the JSON serialize function.
+        Compiled on first use, once, even when first used by concurrent
+        threads.
+        """
+        if self._json_factory is None:
+            with self._json_factory_lock:
+                if self._json_factory is None:
+                    accessors = {}
+                    source = self.generate_source(
+                        as_json=True,
+                        accessors=accessors
+                    )
+                    self._json_factory = self.compile(source, accessors)
+        return self._json_factory
+
+    def bind_fields(self, serializer):
+        """
+        Returns a tuple of the fields of the plan bound to the serializer.
+
+        The fields are bound to the serializer with `Field.bind`, so their
+        `parent` and `field_name` are set as when the fields are used
+        directly. The fields of the plan are not modified, the bound fields
+        are held by the serialize functions only.
+
+        :param serializer: The serializer instance the fields belong to.
+        """
+        fields = []
+        for field_name, field in six.iteritems(self.fields):
+            if isinstance(field, Field):
+                field = field.bind(
+                    parent=serializer,
+                    field_name=field_name,
+                    allow_blank_source=self.allow_blank_source
+                )
+            fields.append(field)
+        return tuple(fields)
+
+    def bind(self, serializer):
+        """
+        Binds the plan to a serializer instance.
+        Returns a function which serializes a single object.
+
+        :param serializer: The serializer instance the fields belong to.
+        """
+        return self.factory(self.bind_fields(serializer))
+
+    def bind_json(self, serializer):
+        """
+        Binds the plan to a serializer instance.
+        Returns a function which serializes a single object and returns it
+        encoded as JSON.
+
+        :param serializer: The serializer instance the fields belong to.
+        """
+        return self.json_factory(self.bind_fields(serializer))
+
+    def bind_batched(self, serializer):
+        """
+        Binds the batched fields of the plan to a serializer instance.
+        Returns a function which computes the values of the batched fields
+        for a list of objects, each field with its `field_to_native_many`
+        method, and returns a list of the tuples of values to pass as
+        `prefetched` for each object. Returns `None` if the plan has no
+        batched fields.
+
+        :param serializer: The serializer instance the fields belong to.
+        """
+        if not self.batched_fields:
+            return None
+        field_names = list(self.fields.keys())
+        bound_fields = self.bind_fields(serializer)
+        fields = [
+            (field_names[index], bound_fields[index])
+            for index in self.batched_fields
+        ]
+
+        def call_batched(objs):
+            columns = [
+                field.field_to_native_many(objs, field_name)
+                for field_name, field in fields
+            ]
+            return list(zip(*columns))
+        return call_batched
+
+    def get_column_function(self, field_name, field):
+        """
+        Returns a function which serializes the field for a list of objects
+        and returns the list of the serialized values.
+
+        :param field_name: The name of the field.
+        :param field: The field, bound to the serializer.
+        """
+        if is_batched(field):
+            return lambda objs: field.field_to_native_many(objs, field_name)
+
+        if not isinstance(field, Field):
+            # Nested serializer
+            if field.source:
+                get = get_source_accessor(
+                    field.source,
+                    field.allow_blank_source
+                )
+            else:
+                get = operator.attrgetter(field_name)
+            many = field.many
+            to_native = field.to_native
+
+            def column(objs):
+                values = []
+                for obj in objs:
+                    value = filter_list(get(obj))
+                    if value is None or value == []:
+                        value = [] if many else None
+                    else:
+                        value = to_native(value)
+                    values.append(value)
+                return values
+            return column
+
+        if takes_own_value(field):
+            field_to_native = field.field_to_native
+            return lambda objs: [
+                field_to_native(obj, field_name) for obj in objs
+            ]
+
+        get = get_source_accessor(
+            field.source or field_name,
+            self.allow_blank_source
+        )
+        to_native_many = field.to_native_many
+        empty = field.empty
+
+        def column(objs):
+            values = to_native_many(
+                [get(obj) for obj in objs if obj is not None]
+            )
+            if len(values) == len(objs):
+                return values
+            # Fill in the empty values of the `None` objects
+            values = iter(values)
+            return [empty if obj is None else next(values) for obj in objs]
+        return column
+
+    def bind_columns(self, serializer):
+        """
+        Binds the plan to a serializer instance.
+        Returns a function which serializes a list of objects column by
+        column, and returns a dict of the field names mapped to the lists
+        of serialized values. Each field converts its whole column with
+        `to_native_many`.
+
+        :param serializer: The serializer instance the fields belong to.
+        """
+        columns = [
+            (field_name, self.get_column_function(field_name, field))
+            for field_name, field in zip(
+                self.fields.keys(),
+                self.bind_fields(serializer)
+            )
+        ]
+
+        def serialize_columns(objs):
+            output = constants.DICT_CLASS()
+            for field_name, column in columns:
+                output[field_name] = column(objs)
+            return output
+        return serialize_columns
+
+    def rows_from_columns(self, columns, count):
+        """
+        Zips a dict of columns returned by the `bind_columns` function into
+        a list of serialized objects of the `output_type` of the plan.
+
+        :param columns: The dict of columns.
+        :param count: The number of serialized objects.
+        """
+        keys = list(columns.keys())
+        rows = zip(*columns.values()) if keys else [()] * count
+        if self.output_type == constants.TUPLE:
+            return list(rows)
+        if self.output_type == constants.NAMEDTUPLE:
+            return [self.row_class(*row) for row in rows]
+        if self.output_type == constants.DICT:
+            return [dict(zip(keys, row)) for row in rows]
+        return [OrderedDict(zip(keys, row)) for row in rows]
@@ -0,0 +1,123 @@
+import os
+import time
+import threading
+
+# `concurrent.futures` is in the standard library from Python 3.2 onwards,
+# use the `futures` backport on Python 2
+try:
+    from concurrent.futures import ThreadPoolExecutor, TimeoutError
+except ImportError:
+    ThreadPoolExecutor = None
+    TimeoutError = None
+
+
+__all__ = [
+    'get_thread_pool',
+    'discard_thread_pool',
+    'call_concurrently',
+]
+
+
+# The number of threads of a pool when `max_workers` is not set
+DEFAULT_MAX_WORKERS = 8
+
+# Cache of `max_workers -> ThreadPoolExecutor`, with the id of the process
+# the pools were created in
+_thread_pools = {}
+_thread_pools_pid = None
+_thread_pools_lock = threading.Lock()
+
+
+def get_thread_pool(max_workers=None):
+    """
+    Returns the thread pool shared by the calls with the same number of
+    workers. The pools are created on first use, and created again in a
+    process forked from the process which created them.
+
+    :param max_workers: The number of threads of the pool. Defaults to
+        `DEFAULT_MAX_WORKERS`.
+    """
+    global _thread_pools_pid
+    if ThreadPoolExecutor is None:
+        raise ImportError(
+            '`concurrent` requires `concurrent.futures`. Install it with '
+            '`pip install futures` on Python 2.'
+        )
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    with _thread_pools_lock:
+        if _thread_pools_pid != os.getpid():
+            # The threads of the pools are not copied by `fork`
+            _thread_pools.clear()
+            _thread_pools_pid = os.getpid()
+        pool = _thread_pools.get(max_workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            _thread_pools[max_workers] = pool
+    return pool
+
+
+def discard_thread_pool(pool):
+    """
+    Removes a pool from the shared pools, so that the next calls get a new
+    pool. The pool is not shut down, as other threads may have just got it
+    from `get_thread_pool`. Its threads exit once the pool is garbage
+    collected and their running calls return.
+    """
+    with _thread_pools_lock:
+        for max_workers, shared_pool in list(_thread_pools.items()):
+            if shared_pool is pool:
+                del _thread_pools[max_workers]
+
+
+def call_concurrently(func,
+                      items,
+                      max_workers=None,
+                      timeout=None,
+                      fallback=None):
+    """
+    Calls the function for each item on a shared thread pool, and returns
+    the list of the results in the order of the items.
+
+    Exceptions raised by the function are raised again. The calls which
+    have not returned within `timeout` seconds of being submitted, whether
+    running or still queued, return the fallback instead. A running call
+    can not be interrupted and keeps running in the background, so the
+    pool is discarded from the shared pools, and the next calls run on a
+    new pool.
+
+    :param func: The function, called with one item.
+    :param items: A list of items.
+    :param max_workers: The number of threads of the pool.
+    :param timeout: (optional) The number of seconds all the calls may
+        take.
+    :param fallback: The result of the calls which time out.
+    """
+    pool = get_thread_pool(max_workers)
+    futures = [pool.submit(func, item) for item in items]
+    deadline = None if timeout is None else time.time() + timeout
+    try:
+        return [
+            wait_for_result(future, deadline, fallback) for future in futures
+        ]
+    finally:
+        # Do not run the calls left after an exception or a timeout
+        for future in futures:
+            future.cancel()
+        if not all(future.done() for future in futures):
+            discard_thread_pool(pool)
+
+
+def wait_for_result(future, deadline, fallback):
+    """
+    Returns the result of a call made by `call_concurrently`, or the
+    fallback if the call has not returned by the `deadline` timestamp.
+    """
+    if deadline is None:
+        return future.result()
+    try:
+        return future.result(max(deadline - time.time(), 0))
+    except TimeoutError:
+        if future.done():
+            # The function itself raised a `TimeoutError`
+            return future.result()
+        return fallback
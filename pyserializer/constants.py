@@ -1,3 +1,8 @@
+import sys
+import six
+from collections import OrderedDict
+
+
 # Default datetime input and output formats
 
 
@@ -9,7 +14,34 @@ DATE_FORMAT = ISO_8601
 
 EMPTY_VALUES = (None, '', [], (), {})
 
+# Types which are native to JSON and never need converting
+NATIVE_TYPES = frozenset(
+    six.integer_types + (float, bool, str, six.text_type, type(None))
+)
+
 MISSING_ERROR_MESSAGE = (
     'ValidationError raised by `{class_name}`, but error key `{key}` does '
     'not exist in the `error_messages` dict.'
 )
+
+# Output types of the serialized objects
+DICT = 'dict'
+ORDERED_DICT = 'ordered_dict'
+TUPLE = 'tuple'
+NAMEDTUPLE = 'namedtuple'
+
+OUTPUT_TYPES = (DICT, ORDERED_DICT, TUPLE, NAMEDTUPLE)
+
+# Plain dicts preserve insertion order from Python 3.7 onwards
+DICT_CLASS = dict if sys.version_info >= (3, 7) else OrderedDict
+
+DEFAULT_OUTPUT_TYPE = DICT if DICT_CLASS is dict else ORDERED_DICT
+
+# Deserialize into a `__slots__` class generated for the serializer
+SLOTS = 'slots'
+
+# Memoize the nested outputs by sharing them, or by copying them
+MEMOIZE_SHARE = 'share'
+MEMOIZE_COPY = 'copy'
+
+MEMOIZE_MODES = (MEMOIZE_SHARE, MEMOIZE_COPY)
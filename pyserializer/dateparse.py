@@ -0,0 +1,308 @@
+import re
+import operator
+from datetime import datetime, date, timedelta, tzinfo
+
+from pyserializer.constants import ISO_8601
+
+try:
+    from datetime import timezone
+except ImportError:  # Python 2
+    timezone = None
+
+
+__all__ = [
+    'get_fixed_timezone',
+    'parse_iso_datetime',
+    'parse_iso_date',
+    'format_iso_datetime',
+    'format_iso_date',
+    'parse_datetime',
+    'parse_date',
+    'StrftimeFormatter',
+    'compile_strftime',
+    'get_datetime_formatter',
+    'get_date_formatter',
+]
+
+
+# `fromisoformat` is available from Python 3.7 onwards. It does not accept
+# the `Z` suffix before Python 3.11, those values fall back to the regexes.
+datetime_fromisoformat = getattr(datetime, 'fromisoformat', None)
+date_fromisoformat = getattr(date, 'fromisoformat', None)
+
+DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})$')
+
+DATETIME_RE = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})'
+    r'(?::(\d{2})(?:[.,](\d{1,6})\d*)?)?'
+    r'(Z|[+-]\d{2}(?::?\d{2})?)?)?$'
+)
+
+
+# The strftime directives supported by `compile_strftime`, mapped to their
+# %-format and the attribute of the date or datetime they format
+STRFTIME_DIRECTIVES = {
+    'Y': ('%04d', 'year'),
+    'm': ('%02d', 'month'),
+    'd': ('%02d', 'day'),
+    'H': ('%02d', 'hour'),
+    'M': ('%02d', 'minute'),
+    'S': ('%02d', 'second'),
+    'f': ('%06d', 'microsecond'),
+}
+
+TIME_ATTRIBUTES = frozenset(('hour', 'minute', 'second', 'microsecond'))
+
+
+class FixedOffset(tzinfo):
+    """
+    A fixed offset from UTC, used on Python 2 which has no
+    `datetime.timezone`.
+    """
+
+    def __init__(self, minutes):
+        self._offset = timedelta(minutes=minutes)
+        sign = '-' if minutes < 0 else '+'
+        self._name = 'UTC%s%02d:%02d' % ((sign,) + divmod(abs(minutes), 60))
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def tzname(self, dt):
+        return self._name
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def __repr__(self):
+        return '<%s>' % self._name
+
+
+# Cache of `offset in minutes -> tzinfo`
+_timezones = {}
+
+
+def get_fixed_timezone(minutes):
+    """
+    Returns a tzinfo instance with a fixed offset from UTC in minutes.
+    """
+    tz = _timezones.get(minutes)
+    if tz is None:
+        if timezone is None:
+            tz = FixedOffset(minutes)
+        elif minutes == 0:
+            tz = timezone.utc
+        else:
+            tz = timezone(timedelta(minutes=minutes))
+        _timezones[minutes] = tz
+    return tz
+
+
+def parse_iso_datetime(value):
+    """
+    Parses an ISO 8601 string into a datetime.
+    Accepts the `Z` suffix and `+HH:MM`, `+HHMM` or `+HH` offsets, which
+    return an aware datetime. Values without a time part are parsed as
+    midnight.
+
+    Raises `ValueError` if the value is not a valid ISO 8601 datetime, and
+    `TypeError` if the value is not a string.
+    """
+    if datetime_fromisoformat is not None:
+        try:
+            return datetime_fromisoformat(value)
+        except ValueError:
+            pass
+    match = DATETIME_RE.match(value)
+    if match is None:
+        raise ValueError('%r is not a valid ISO 8601 datetime.' % (value,))
+    (year, month, day, hour, minute,
+     second, microsecond, offset) = match.groups()
+    tz = None
+    if offset == 'Z':
+        tz = get_fixed_timezone(0)
+    elif offset:
+        minutes = int(offset[1:3]) * 60
+        if len(offset) > 3:
+            minutes += int(offset[-2:])
+        tz = get_fixed_timezone(-minutes if offset[0] == '-' else minutes)
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        int(microsecond.ljust(6, '0')) if microsecond else 0,
+        tz
+    )
+
+
+def parse_iso_date(value):
+    """
+    Parses an ISO 8601 `YYYY-MM-DD` string into a date.
+
+    Raises `ValueError` if the value is not a valid ISO 8601 date, and
+    `TypeError` if the value is not a string.
+    """
+    if date_fromisoformat is not None:
+        try:
+            return date_fromisoformat(value)
+        except ValueError:
+            pass
+    match = DATE_RE.match(value)
+    if match is None:
+        raise ValueError('%r is not a valid ISO 8601 date.' % (value,))
+    year, month, day = match.groups()
+    return date(int(year), int(month), int(day))
+
+
+def format_iso_datetime(value):
+    """
+    Formats a datetime as ISO 8601. UTC offsets are formatted as `Z`.
+    """
+    ret = value.isoformat()
+    if ret.endswith('+00:00'):
+        ret = ret[:-6] + 'Z'
+    return ret
+
+
+def format_iso_date(value):
+    """
+    Formats a date as ISO 8601.
+    """
+    return value.isoformat()
+
+
+def parse_datetime(value, format):
+    """
+    Parses a string into a datetime with the format, which is either a
+    `strptime` format or `ISO_8601`.
+    """
+    if format.lower() == ISO_8601:
+        return parse_iso_datetime(value)
+    return datetime.strptime(value, format)
+
+
+def parse_date(value, format):
+    """
+    Parses a string into a date with the format, which is either a
+    `strptime` format or `ISO_8601`.
+    """
+    if format.lower() == ISO_8601:
+        return parse_iso_date(value)
+    return datetime.strptime(value, format).date()
+
+
+class StrftimeFormatter(object):
+    """
+    Formats a date or datetime with a strftime format, the same way
+    `strftime` does.
+    Formats which only use the `%Y`, `%m`, `%d`, `%H`, `%M`, `%S`, `%f`
+    and `%%` directives are compiled once into a %-format of the date's
+    attributes. Other formats, and years below 1000 which `strftime` does
+    not pad the same way on every platform, fall back to `strftime`.
+    """
+
+    def __init__(self, format, date_only=False):
+        """
+        :param format: The strftime format.
+        :param date_only: `True` if the formatter formats dates only. The
+            time directives are formatted as zeros.
+        """
+        self.format = format
+        self.date_only = date_only
+        self.template, self.getter = self.compile(format, date_only)
+        self.formats_year = self.getter is not None and any(
+            directive == 'Y' for directive in self.iter_directives(format)
+        )
+
+    @staticmethod
+    def compile(format, date_only):
+        """
+        Returns a tuple of the %-format and the getter of the date's
+        attributes it formats, `(None, None)` if the format is not
+        supported.
+        """
+        template = []
+        attributes = []
+        index = 0
+        while index < len(format):
+            char = format[index]
+            if char != '%':
+                template.append(char)
+                index += 1
+                continue
+            directive = format[index + 1:index + 2]
+            if directive == '%':
+                template.append('%%')
+            elif directive in STRFTIME_DIRECTIVES:
+                spec, attribute = STRFTIME_DIRECTIVES[directive]
+                if date_only and attribute in TIME_ATTRIBUTES:
+                    template.append(spec % 0)
+                else:
+                    template.append(spec)
+                    attributes.append(attribute)
+            else:
+                return None, None
+            index += 2
+        if not attributes:
+            return ''.join(template) % (), None
+        return ''.join(template), operator.attrgetter(*attributes)
+
+    @staticmethod
+    def iter_directives(format):
+        """
+        Yields the directives of a strftime format, without the `%`.
+        """
+        index = 0
+        while index < len(format):
+            if format[index] == '%':
+                yield format[index + 1:index + 2]
+                index += 2
+            else:
+                index += 1
+
+    def __call__(self, value):
+        if self.getter is not None:
+            if not (self.formats_year and value.year < 1000):
+                try:
+                    return self.template % self.getter(value)
+                except AttributeError:
+                    # A date formatted with a time directive
+                    pass
+        elif self.template is not None:
+            return self.template
+        return value.strftime(self.format)
+
+    def __reduce__(self):
+        return self.__class__, (self.format, self.date_only)
+
+
+def compile_strftime(format, date_only=False):
+    """
+    Compiles a strftime format into a function which formats a date or
+    datetime. See :class:`StrftimeFormatter`.
+    """
+    return StrftimeFormatter(format, date_only)
+
+
+def get_datetime_formatter(format):
+    """
+    Returns a function which formats a datetime with the format, which is
+    either a strftime format or `ISO_8601`.
+    """
+    if format.lower() == ISO_8601:
+        return format_iso_datetime
+    return compile_strftime(format)
+
+
+def get_date_formatter(format):
+    """
+    Returns a function which formats a date with the format, which is
+    either a strftime format or `ISO_8601`.
+    """
+    if format.lower() == ISO_8601:
+        return format_iso_date
+    return compile_strftime(format, date_only=True)
@@ -1,19 +1,29 @@
 import six
+import copy
 from datetime import datetime, date
 import warnings
 import uuid
 import decimal
 from collections import OrderedDict
+from itertools import compress
 
 from pyserializer.utils import (
     is_simple_callable,
     is_iterable,
-    get_object_by_source,
+    is_mapping,
+    get_source_accessor,
+    LRUCache,
 )
 from pyserializer import constants
-from pyserializer.constants import ISO_8601
 from pyserializer import validators
-from pyserializer.exceptions import MethodMissingError
+from pyserializer.concurrency import call_concurrently
+from pyserializer.dateparse import (
+    parse_date,
+    parse_datetime,
+    get_date_formatter,
+    get_datetime_formatter,
+)
+from pyserializer.exceptions import MethodMissingError, ValidationError
 
 
 __all__ = [
@@ -35,6 +45,15 @@ __all__ = [
 ]
 
 
+def overrides_to_native(field, cls):
+    """
+    True if the class of the field overrides the `to_native` method of the
+    class, in which case the bulk conversion of the class can not be used.
+    """
+    return (six.get_unbound_function(type(field).to_native) is not
+            six.get_unbound_function(cls.to_native))
+
+
 class Field(object):
     """
     A base class for fields in a Serializer.
@@ -42,7 +61,14 @@ class Field(object):
 
     type_name = None
     type_label = None
+    # The NumPy dtype of the field in structured arrays, see `to_numpy`.
+    # Fields without a dtype are exported as objects.
+    numpy_dtype = None
     default_validators = []
+    parse_validator = None
+    parent = None
+    field_name = None
+    allow_blank_source = False
 
     def __init__(self,
                  source=None,
@@ -97,18 +123,14 @@ class Field(object):
             return self.empty
         # If source is defined use use that as the field name
         field_name = self.source or field_name
-        value = get_object_by_source(
-            obj,
-            field_name,
-            self.allow_blank_source
-        )
-        return self.to_native(value)
+        accessor = get_source_accessor(field_name, self.allow_blank_source)
+        return self.to_native(accessor(obj))
 
     def to_native(self, value):
         """
         Converts the field's value into a serialized representation.
         """
-        if value is None:
+        if type(value) in constants.NATIVE_TYPES:
             return value
         if is_simple_callable(value):
             value = value()
@@ -122,6 +144,21 @@ class Field(object):
             return d
         return value
 
+    def to_native_many(self, values):
+        """
+        Converts a list of the field's values into a list of their
+        serialized representations. Used by the columnar serialization,
+        fields can override it to convert a whole column at once.
+        """
+        to_native = self.to_native
+        if not overrides_to_native(self, Field):
+            native_types = constants.NATIVE_TYPES
+            return [
+                value if type(value) in native_types else to_native(value)
+                for value in values
+            ]
+        return [to_native(value) for value in values]
+
     def to_python(self, value):
         """
         Reverts a simple representation back to the field's value.
@@ -130,11 +167,118 @@ class Field(object):
             return None
         return value
 
+    def validate(self, value, skip=None):
+        """
+        Runs the validators of the field on the value.
+        Returns a list of the error dicts of the validators which failed.
+
+        :param value: The value to be validated.
+        :param skip: (optional) A validator which should not be ran.
+        """
+        errors = []
+        for validator in self.validators:
+            if validator is skip:
+                continue
+            try:
+                validator(value)
+            except ValidationError as e:
+                error = OrderedDict(validator.error_dict)
+                error['message'] = str(e)
+                errors.append(error)
+        return errors
+
+    def validate_many(self, values):
+        """
+        Runs the validators of the field on a list of values at once, with
+        the `validate_many` method of each validator. Only the values which
+        fail are validated one by one again, to get the error messages.
+        Returns a dict of the indexes of the invalid values mapped to their
+        list of error dicts, in the same format as `validate`.
+
+        :param values: A list or a NumPy array of values.
+        """
+        failed = {}
+        for validator in self.validators:
+            mask = validator.validate_many(values)
+            for index in compress(range(len(mask)), mask):
+                try:
+                    validator(values[index])
+                except ValidationError as e:
+                    error = OrderedDict(validator.error_dict)
+                    error['message'] = str(e)
+                    failed.setdefault(index, []).append(error)
+        return OrderedDict(
+            (index, failed[index]) for index in sorted(failed)
+        )
+
+    def restore(self, value, errors=None):
+        """
+        Validates the value and reverts it back to the field's value in a
+        single step. Returns a tuple of the field's value and the list of
+        errors returned by `validate`. The field's value is `None` if the
+        value is not valid.
+
+        If the field has a `parse_validator`, a validator which only checks
+        that `to_python` can parse the value, the value is parsed once and
+        the validator is not ran when parsing succeeds.
+
+        :param errors: (optional) The list of errors of the value, if it
+            was already validated, eg: with `validate_many`.
+        """
+        errors, parsed = self.validate_for_restore(value, errors)
+        if errors:
+            return None, errors
+        if parsed is not None:
+            return parsed[0], errors
+        return self.to_python(value), errors
+
+    def validate_for_restore(self, value, errors=None):
+        """
+        Runs the validators of the field on the value, the first step of
+        `restore`. Returns a tuple of the list of errors and a 1-tuple of the
+        field's value if the value was parsed to validate it, else `None`.
+        Exceptions raised by the validators are not caught.
+
+        :param errors: (optional) The list of errors of the value, if it
+            was already validated, eg: with `validate_many`.
+        """
+        if errors is not None:
+            return errors, None
+        if (self.parse_validator is not None and
+                value not in constants.EMPTY_VALUES):
+            try:
+                python_value = self.to_python(value)
+            except (ValueError, TypeError):
+                pass
+            else:
+                errors = self.validate(value, skip=self.parse_validator)
+                return errors, (python_value,)
+        return self.validate(value), None
+
     def initialize(self, parent, field_name, allow_blank_source):
+        """
+        Sets the serializer, field name and `allow_blank_source` on the field.
+        Modifies the field in place, use `bind` for fields shared between
+        serializers.
+        """
         self.parent = parent
         self.field_name = field_name
         self.allow_blank_source = allow_blank_source
 
+    def bind(self, parent, field_name, allow_blank_source):
+        """
+        Returns a copy of the field bound to the serializer instance.
+        The field itself is not modified, so fields declared on a serializer
+        class can be shared between serializer instances and threads.
+        """
+        field = copy.copy(self)
+        field.initialize(
+            parent=parent,
+            field_name=field_name,
+            allow_blank_source=allow_blank_source
+        )
+        return field
+
     def metadata(self):
         metadata = {}
         metadata['type_name'] = self.type_name
@@ -179,6 +323,7 @@ class DateField(Field):
 
     type_name = 'DateField'
     type_label = 'date'
+    numpy_dtype = 'datetime64[D]'
     format = '%Y-%m-%d'
 
     def __init__(self,
@@ -187,13 +332,23 @@ class DateField(Field):
                  **kwargs):
         """
         :param format: The format of the date. Defaults to %Y-%m-%d.
+        :param cache_size: (optional) The number of formatted dates to keep
+            in a LRU cache, for columns which repeat the same dates. The
+            hit rate of the cache is available as `field.cache.hit_rate`.
+            Disabled by default.
         :param args: Arguments passed directly into the parent
             :class:`~pyserializer.Field`.
         :param kwargs: Keyword arguments passed directly into the parent
             :class:`~pyserializer.Field`.
         """
         self.format = format or self.format
-        default_validators = [validators.DateValidator(self.format)]
+        self.formatter = None
+        if self.format is not None:
+            self.formatter = get_date_formatter(self.format)
+        cache_size = kwargs.pop('cache_size', None)
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self.parse_validator = validators.DateValidator(self.format)
+        default_validators = [self.parse_validator]
         field_validators = (
             kwargs.pop('validators', []) +
             default_validators
@@ -209,9 +364,25 @@ class DateField(Field):
             return value
         if isinstance(value, datetime):
             value = value.date()
-        if self.format.lower() == ISO_8601:
-            return value.isoformat()
-        return value.strftime(self.format)
+        if self.cache is None:
+            return self.formatter(value)
+        ret = self.cache.get(value)
+        if ret is None:
+            ret = self.formatter(value)
+            self.cache.set(value, ret)
+        return ret
+
+    def to_native_many(self, values):
+        if (self.format is None or self.cache is not None or
+                overrides_to_native(self, DateField)):
+            return super(DateField, self).to_native_many(values)
+        formatter = self.formatter
+        return [
+            None if value is None else formatter(
+                value.date() if isinstance(value, datetime) else value
+            )
+            for value in values
+        ]
 
     def to_python(self, value):
         if value in constants.EMPTY_VALUES:
@@ -225,7 +396,7 @@ class DateField(Field):
             return value
         if isinstance(value, date):
             return value
-        return datetime.strptime(value, self.format).date()
+        return parse_date(value, self.format)
 
 
 class DateTimeField(Field):
@@ -235,6 +406,7 @@ class DateTimeField(Field):
 
     type_name = 'DateTimeField'
     type_label = 'datetime'
+    numpy_dtype = 'datetime64[us]'
     format = constants.DATETIME_FORMAT
 
     def __init__(self,
@@ -243,13 +415,23 @@ class DateTimeField(Field):
                  **kwargs):
         """
         :param format: The format of the datetime. Defaults to ISO_8601.
+        :param cache_size: (optional) The number of formatted datetimes to
+            keep in a LRU cache, for columns which repeat the same
+            datetimes. The hit rate of the cache is available as
+            `field.cache.hit_rate`. Disabled by default.
         :param args: Arguments passed directly into the parent
             :class:`~pyserializer.Field`.
         :param kwargs: Keyword arguments passed directly into the parent
             :class:`~pyserializer.Field`.
         """
         self.format = format or self.format
-        default_validators = [validators.DateTimeValidator(self.format)]
+        self.formatter = None
+        if self.format is not None:
+            self.formatter = get_datetime_formatter(self.format)
+        cache_size = kwargs.pop('cache_size', None)
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self.parse_validator = validators.DateTimeValidator(self.format)
+        default_validators = [self.parse_validator]
         field_validators = (
             kwargs.pop('validators', []) +
             default_validators
@@ -263,12 +445,23 @@ class DateTimeField(Field):
     def to_native(self, value):
         if value is None or self.format is None:
             return value
-        if self.format.lower() == ISO_8601:
-            ret = value.isoformat()
-            if ret.endswith('+00:00'):
-                ret = ret[:-6] + 'Z'
-            return ret
-        return value.strftime(self.format)
+        if self.cache is None:
+            return self.formatter(value)
+        # Equal datetimes in different timezones are formatted differently
+        key = (value, getattr(value, 'tzinfo', None))
+        ret = self.cache.get(key)
+        if ret is None:
+            ret = self.formatter(value)
+            self.cache.set(key, ret)
+        return ret
+
+    def to_native_many(self, values):
+        if (self.format is None or self.cache is not None or
+                overrides_to_native(self, DateTimeField)):
+            return super(DateTimeField, self).to_native_many(values)
+        formatter = self.formatter
+        return [None if value is None else formatter(value)
+                for value in values]
 
     def to_python(self, value):
         if value in constants.EMPTY_VALUES:
@@ -282,7 +475,7 @@ class DateTimeField(Field):
                 RuntimeWarning
             )
             return value
-        return datetime.strptime(value, self.format)
+        return parse_datetime(value, self.format)
 
 
 class UUIDField(Field):
@@ -293,6 +486,7 @@ class UUIDField(Field):
     type_name = 'UUIDField'
     type_label = 'string'
     default_validators = [validators.UUIDValidator()]
+    parse_validator = default_validators[0]
 
     def __init__(self,
                  *args,
@@ -310,6 +504,13 @@ class UUIDField(Field):
             return value
         return six.text_type(value)
 
+    def to_native_many(self, values):
+        if overrides_to_native(self, UUIDField):
+            return super(UUIDField, self).to_native_many(values)
+        text_type = six.text_type
+        return [None if value is None else text_type(value)
+                for value in values]
+
     def to_python(self, value):
         if value in constants.EMPTY_VALUES:
             return None
@@ -326,6 +527,7 @@ class NumberField(Field):
     num_type = float
     type_name = 'NumberField'
     type_label = 'number'
+    numpy_dtype = 'f8'
     default_validators = [validators.NumberValidator()]
 
     def __init__(self,
@@ -353,6 +555,7 @@ class IntegerField(NumberField):
     num_type = int
     type_name = 'IntegerField'
     type_label = 'integer'
+    numpy_dtype = 'i8'
     default_validators = [validators.IntegerValidator()]
 
 
@@ -395,6 +598,7 @@ class BooleanField(Field):
 
     type_name = 'BooleanField'
     type_label = 'booloean'
+    numpy_dtype = '?'
     default_validators = [validators.BooleanValidator()]
 
     def to_python(self, value):
@@ -475,39 +679,117 @@ class MethodField(Field):
 
     def __init__(self,
                  method_name=None,
+                 batch_method_name=None,
+                 concurrent=False,
+                 max_workers=None,
+                 timeout=None,
+                 fallback=None,
                  *args,
                  **kwargs):
         """
         :param method_name: The name of the serialize method
             defined in serializer.
+        :param batch_method_name: The name of a serialize method defined in
+            serializer which takes the list of all the objects of a
+            `many=True` serializer, and returns a list of the values in the
+            order of the objects or a mapping of the objects to their
+            values. Used instead of `method_name`, eg: to look up the values
+            of all the objects in a single query.
+        :param concurrent: A Bool field which should be set `True` to call
+            the method for all the objects of a `many=True` serializer at
+            once, on a thread pool. Useful for methods which wait on I/O,
+            eg: a cache or an HTTP request. The default is `False`
+        :param max_workers: The number of threads the method is called on,
+            with `concurrent`. Defaults to
+            `concurrency.DEFAULT_MAX_WORKERS`.
+        :param timeout: The number of seconds a call of the method may take,
+            with `concurrent`. Calls which have not returned within
+            `timeout` seconds of the list being submitted return
+            `fallback`.
+        :param fallback: The value of the calls which time out.
         :param args: Arguments passed directly into the parent
             :class:`~pyserializer.Field`.
         :param kwargs: Keyword arguments passed directly into the parent
             :class:`~pyserializer.Field`.
         """
         self.method_name = method_name
+        self.batch_method_name = batch_method_name
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.fallback = fallback
         super(MethodField, self).__init__(*args, **kwargs)
 
+    @property
+    def batched(self):
+        """
+        True if the field computes its values for a list of objects at once,
+        with a batch method or `concurrent`.
+        """
+        return bool(self.batch_method_name or self.concurrent)
+
+    def get_method(self, method_name=None):
+        """
+        Returns the serialize method of the serializer, `method_name` by
+        default. Raises `MethodMissingError` if the method is not defined.
+        """
+        method_name = method_name or self.method_name
+        method = getattr(
+            self.parent,
+            method_name,
+            None
+        )
+        if not method:
+            raise MethodMissingError(
+                self.default_method_missing_message
+                .format(
+                    method_name=method_name,
+                    serializer_calss=self.parent.__class__.__name__
+                )
+            )
+        return method
+
     def field_to_native(self, obj, field_name):
         """
         Given an obj and a field name, returns the value that should be
         serialized for that field.
         """
+        if self.batch_method_name:
+            return self.field_to_native_many([obj], field_name)[0]
         if self.method_name:
-            method = getattr(
-                self.parent,
-                self.method_name,
-                None
-            )
-            if not method:
-                raise MethodMissingError(
-                    self.default_method_missing_message
-                    .format(
-                        method_name=self.method_name,
-                        serializer_calss=self.parent.__class__.__name__
-                    )
+            return self.get_method()(obj)
+
+    def field_to_native_many(self, objs, field_name):
+        """
+        Returns the list of the values that should be serialized for the
+        field for a list of objects. The batch method is called once with
+        all the objects. With `concurrent` the method is called for the
+        objects on a thread pool.
+        """
+        if self.batch_method_name:
+            values = self.get_method(self.batch_method_name)(objs)
+            if is_mapping(values):
+                return [values.get(obj) for obj in objs]
+            values = list(values)
+            if len(values) != len(objs):
+                raise ValueError(
+                    'The batch method `%s` returned %d values for %d '
+                    'objects.' % (
+                        self.batch_method_name, len(values), len(objs))
                 )
-            return method(obj)
+            return values
+        if not self.method_name:
+            return [None] * len(objs)
+        method = self.get_method()
+        if not self.concurrent:
+            return [method(obj) for obj in objs]
+        return call_concurrently(
+            method,
+            objs,
+            max_workers=self.max_workers,
+            timeout=self.timeout,
+            fallback=self.fallback
+        )
 
 
 class EnumField(Field):
@@ -534,6 +816,11 @@ class EnumField(Field):
             return enum
         return enum.value
 
+    def to_native_many(self, values):
+        if overrides_to_native(self, EnumField):
+            return super(EnumField, self).to_native_many(values)
+        return [None if enum is None else enum.value for enum in values]
+
     def to_python(self, value):
         if value in constants.EMPTY_VALUES:
             return None
@@ -0,0 +1,192 @@
+import uuid
+import pickle
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+from pyserializer import constants
+
+# `concurrent.futures` is in the standard library from Python 3.2 onwards,
+# use the `futures` backport on Python 2
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
+
+__all__ = [
+    'dump_serializer',
+    'load_serializer',
+    'iter_serialize',
+]
+
+
+# The attributes of a serializer which are not sent to the workers: the
+# objects, the cached results and the functions bound to the instance.
+TRANSIENT_ATTRIBUTES = (
+    'instance',
+    'data_dict',
+    'executor',
+    '_data',
+    '_object',
+    '_errors',
+    '_restored_fields',
+    '_plan',
+    '_serialize',
+    '_serialize_json',
+    '_serialize_columns',
+    '_call_batched',
+    '_async_fields',
+)
+
+# The number of serializers kept by each worker process
+MAX_WORKER_SERIALIZERS = 16
+
+# Cache of `key -> serializer` in the worker processes
+_worker_serializers = {}
+
+
+def dump_serializer(serializer):
+    """
+    Pickles a serializer to be sent to the worker processes, without its
+    objects and the functions compiled for the instance.
+    Raises `ValueError` if the serializer can not be pickled, eg: when its
+    class is not defined at the module level.
+    """
+    state = dict(
+        (name, value) for name, value in serializer.__dict__.items()
+        if name not in TRANSIENT_ATTRIBUTES
+    )
+    state['parallel'] = None
+    try:
+        return pickle.dumps(
+            (serializer.__class__, state),
+            pickle.HIGHEST_PROTOCOL
+        )
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise ValueError(
+            'The serializer %s must be picklable to be used with `parallel`'
+            ' or `executor`, eg: its class and fields must be defined at the'
+            ' module level. %s' % (serializer.__class__.__name__, e)
+        )
+
+
+def load_serializer(data):
+    """
+    Rebuilds a serializer pickled with `dump_serializer`.
+    """
+    cls, state = pickle.loads(data)
+    serializer = cls.__new__(cls)
+    serializer.__dict__.update(state)
+    for name in TRANSIENT_ATTRIBUTES:
+        setattr(serializer, name, None)
+    return serializer
+
+
+def dump_chunk(chunk):
+    """
+    Pickles a chunk of objects to be sent to the worker processes.
+    Raises `ValueError` if the objects can not be pickled.
+    """
+    try:
+        return pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise ValueError(
+            'The objects serialized with `parallel` or `executor` must be '
+            'picklable. %s' % e
+        )
+
+
+def serialize_chunk(key, serializer_data, chunk_data):
+    """
+    Serializes a chunk of objects in a worker process.
+    The serializer is rebuilt once per worker process and key, and its plan
+    is compiled on first use.
+
+    :param key: The key of the serializer, unique for each run.
+    :param serializer_data: The serializer pickled with `dump_serializer`.
+    :param chunk_data: The list of objects pickled with `dump_chunk`.
+    """
+    serializer = _worker_serializers.get(key)
+    if serializer is None:
+        if len(_worker_serializers) >= MAX_WORKER_SERIALIZERS:
+            _worker_serializers.clear()
+        serializer = load_serializer(serializer_data)
+        _worker_serializers[key] = serializer
+    data = serializer.to_native(pickle.loads(chunk_data))
+    if serializer.output_type == constants.NAMEDTUPLE:
+        # The namedtuple class of the worker can not be pickled
+        data = [tuple(row) for row in data]
+    return data
+
+
+def get_max_workers(parallel):
+    """
+    Returns the number of worker processes for the `parallel` option:
+    the number of CPUs for `True`, else the number itself.
+    """
+    if parallel is True:
+        return multiprocessing.cpu_count()
+    return int(parallel)
+
+
+def iter_serialize(serializer, objs, chunk_size):
+    """
+    Returns a generator which serializes the objects in worker processes.
+    The objects are split into chunks, which are serialized on the
+    `executor` of the serializer, or on a `ProcessPoolExecutor` with
+    `parallel` workers. The serialized objects are yielded in the order of
+    `objs`.
+
+    :param serializer: The serializer of the objects.
+    :param objs: An iterable of the objects.
+    :param chunk_size: The number of objects in each chunk.
+    """
+    executor = serializer.executor
+    owns_executor = executor is None
+    if owns_executor:
+        if ProcessPoolExecutor is None:
+            raise ImportError(
+                '`parallel` requires `concurrent.futures`. Install it with '
+                '`pip install futures` on Python 2.'
+            )
+        max_workers = get_max_workers(serializer.parallel)
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        max_workers = (
+            getattr(executor, '_max_workers', None) or
+            multiprocessing.cpu_count()
+        )
+    # Keep two chunks per worker in flight
+    max_pending = max_workers * 2
+    key = uuid.uuid4().hex
+    serializer_data = dump_serializer(serializer)
+    row_class = None
+    if serializer.output_type == constants.NAMEDTUPLE:
+        row_class = serializer.plan.row_class
+    iterator = iter(objs)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < max_pending:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(
+                    serialize_chunk,
+                    key,
+                    serializer_data,
+                    dump_chunk(chunk)
+                ))
+            if not pending:
+                break
+            data = pending.popleft().result()
+            if row_class is not None:
+                data = [row_class(*row) for row in data]
+            for item in data:
+                yield item
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            executor.shutdown()
@@ -1,12 +1,28 @@
 import six
 import copy
+import json
+import operator
+import functools
 from collections import OrderedDict
+from itertools import islice
 
+from pyserializer import arrays
+from pyserializer import constants
+from pyserializer import parallel as parallel_serialization
+from pyserializer.compiler import SerializationPlan, iter_source_paths
 from pyserializer.exceptions import ValidationError
 from pyserializer.fields import Field
 from pyserializer.utils import (
-    get_object_by_source,
-    filter_list
+    CopyOnWriteMapping,
+    LRUCache,
+    Memo,
+    activate_memo,
+    filter_list,
+    frozen_mapping,
+    get_active_memo,
+    get_source_accessor,
+    is_mapping,
+    make_slots_class,
 )
 
 
@@ -18,6 +34,22 @@ __all__ = [
 ]
 
 
+def with_memo(method):
+    """
+    Decorates a serialize method, so a `Memo` is active for the duration
+    of the call when the serializer has the `memoize` option and no memo
+    is active yet, ie: for the top-level call.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.memoize or get_active_memo() is not None:
+            return method(self, *args, **kwargs)
+        memo = Memo(copy=self.memoize == constants.MEMOIZE_COPY)
+        with activate_memo(memo):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class SerializerOptions(object):
     """
     Meta class options for Serializer
@@ -25,6 +57,8 @@ class SerializerOptions(object):
     def __init__(self, meta):
         self.fields = getattr(meta, 'fields', ())
         self.exclude = getattr(meta, 'exclude', ())
+        self.output_type = getattr(meta, 'output_type', None)
+        self.target = getattr(meta, 'target', None)
 
 
 class SerializerMetaclass(type):
@@ -42,6 +76,12 @@ class SerializerMetaclass(type):
         parent_fields = new_class.get_parent_fields(bases)
         declared_fields = new_class.get_declared_fields(attrs)
         new_class.set_fields(parent_fields, declared_fields)
+        # Serialization plans are compiled lazily on first use
+        new_class._plans = {}
+        # Plans of the fields of instances, eg: returned by a `get_fields`
+        # override, bounded as the fields may be created per instance
+        new_class._instance_plans = LRUCache(maxsize=128)
+        new_class._slots_classes = {}
         return new_class
 
     def get_parent_fields(cls, bases):
@@ -71,6 +111,13 @@ class BaseSerializer(object):
 
     _options_class = SerializerOptions
 
+    # The number of objects sent to a worker process at once
+    parallel_chunk_size = 1000
+
+    # The number of objects the batched fields are computed for at once,
+    # when the objects are serialized incrementally, eg: by `iter_data`
+    batch_chunk_size = 1000
+
     class Meta(object):
         pass
 
@@ -80,6 +127,12 @@ class BaseSerializer(object):
                  source=None,
                  many=False,
                  allow_blank_source=False,
+                 output_type=None,
+                 target=None,
+                 columnar=False,
+                 parallel=None,
+                 executor=None,
+                 memoize=False,
                  *args,
                  **kwargs):
         """
@@ -92,6 +145,31 @@ class BaseSerializer(object):
         :param allow_blank_source: A Bool field which should be set `True`
             if the serializer should not throw an error when the source defined
             on the field is not present on the instance. The default is `False`
+        :param output_type: The type of the serialized objects. One of
+            `'dict'`, `'ordered_dict'`, `'tuple'` or `'namedtuple'`. Can also
+            be set as `output_type` on the Meta class. Defaults to `'dict'`
+            on Python 3.7+, where dicts preserve the order of the fields,
+            else to `'ordered_dict'`.
+        :param target: The class the deserialized objects are created with.
+            It is called with the deserialized fields as keyword arguments,
+            eg: `dict`, a namedtuple or a dataclass. `'slots'` creates the
+            objects with a `__slots__` class generated for the serializer.
+            Can also be set as `target` on the Meta class. By default the
+            deserialized objects are copies of the serializer.
+        :param columnar: A Bool field which should be set `True` to
+            serialize the objects of a `many=True` serializer column by
+            column, see `to_columns`. The default is `False`
+        :param parallel: The number of worker processes the objects of a
+            `many=True` serializer are serialized in, or `True` for one
+            per CPU. The serializer and the objects must be picklable.
+            The default is `None`, serializing in the current process.
+        :param executor: A `concurrent.futures.Executor` to serialize the
+            objects of a `many=True` serializer on, instead of creating a
+            process pool for `parallel`.
+        :param memoize: Set `True` to serialize each nested object only
+            once per call, when it is shared by several objects. The
+            output of the nested serializer is shared by the objects, or
+            copied for each of them with `'copy'`. The default is `False`
         """
         self.instance = instance
         self.data_dict = data_dict
@@ -99,12 +177,47 @@ class BaseSerializer(object):
         self.many = many
         self.allow_blank_source = allow_blank_source
         self.options = self._options_class(self.Meta)
-        self.fields = self.get_fields()
+        if (six.get_unbound_function(self.__class__.get_fields) is
+                six.get_unbound_function(BaseSerializer.get_fields)):
+            # Share the fields resolved for the class
+            self._fields = None
+            self.get_class_fields()
+        else:
+            self._fields = self.get_fields()
+        self.output_type = (
+            output_type or
+            self.options.output_type or
+            constants.DEFAULT_OUTPUT_TYPE
+        )
+        self.target = target or self.options.target
+        self.columnar = columnar
+        self.parallel = parallel
+        self.executor = executor
+        if memoize is True:
+            memoize = constants.MEMOIZE_SHARE
+        if memoize and memoize not in constants.MEMOIZE_MODES:
+            raise ValueError(
+                '`memoize` must be a bool or one of %s.'
+                % (constants.MEMOIZE_MODES,)
+            )
+        self.memoize = memoize
         self._data = None
         self._object = None
         self._errors = None
+        self._restored_fields = None
+        self._restore_failed = False
+        self._plan = None
+        self._serialize = None
+        self._serialize_json = None
+        self._serialize_columns = None
+        self._call_batched = None
 
-        if many and instance is not None and not hasattr(instance, '__iter__'):
+        if many and data_dict is not None and not isinstance(data_dict,
+                                                             (list, tuple)):
+            raise ValueError('`data_dict` should be a list of dicts with '
+                             'many=True')
+        if (many and instance is not None and
+                not hasattr(instance, '__iter__')):
             msg = ('`instance` should be a queryset or other iterable with '
                    'many=True')
             raise ValueError(msg)
@@ -113,42 +226,206 @@ class BaseSerializer(object):
     def errors(self):
         """
         Runs the deserialization and returns any validations errors.
-        Also, sets the object property if no errors occurred during validation.
+        Validation and deserialization of the fields happen in a single pass,
+        the deserialized fields are kept for the object property.
+
+        With `many=True` every dict in `data_dict` is validated, and the
+        errors of the invalid dicts are returned keyed by their index.
         """
         if self._errors is None:
             # Create a error dict and add all the
             # error fields and messages into it.
-            self._errors = OrderedDict()
-            self.perform_validation(
-                fields=self.fields,
-                data=self.data_dict
-            )
+            self._errors = constants.DICT_CLASS()
+            if self.many:
+                items = self.data_dict or ()
+                column_errors = self._validate_columns(items)
+                self._restored_fields = [
+                    self._validate_item(index, data, column_errors)
+                    for index, data in enumerate(items)
+                ]
+            else:
+                self._restored_fields = self._validate_and_restore(
+                    self.data_dict,
+                    self._errors
+                )
         return self._errors
 
     def is_valid(self):
         return not self.errors
 
-    def perform_validation(self, fields, data):
+    def _validate_and_restore(self, data, errors, validated=None):
+        """
+        Validates and deserializes a single dict, collecting the validation
+        errors into `errors`. Returns the deserialized fields, or `None` if
+        a value could not be deserialized.
+        """
+        self._restore_failed = False
+        if self._overrides_validation():
+            return self._validate_with_overrides(data, errors)
+        restored_fields = self.perform_validation(
+            fields=self._get_fields_without_copying(),
+            data=data,
+            errors=errors,
+            validated=validated
+        )
+        if self._restore_failed:
+            return None
+        return restored_fields
+
+    def _overrides_validation(self):
+        """
+        True if the class overrides `perform_validation` or
+        `invoke_validators_and_set_errors`, in which case the fields are
+        validated by calling them the same way as before the single pass
+        validation.
+        """
+        cls = self.__class__
+        return any(
+            six.get_unbound_function(getattr(cls, name)) is not
+            six.get_unbound_function(getattr(BaseSerializer, name))
+            for name in ('perform_validation',
+                         'invoke_validators_and_set_errors')
+        )
+
+    def _validate_with_overrides(self, data, errors):
+        """
+        Validates a single dict by calling `perform_validation(fields, data)`,
+        which sets the errors on `self._errors`. The errors are collected
+        into `errors`. Returns `None`, the fields are deserialized by
+        `restore_fields` when the object is restored.
+        """
+        serializer_errors = self._errors
+        self._errors = errors
+        try:
+            self.perform_validation(self._get_fields_without_copying(), data)
+        finally:
+            self._errors = serializer_errors
+        return None
+
+    def _validate_columns(self, items):
+        """
+        Validates the values of the fields of a `many=True` `data_dict`
+        column by column, with `Field.validate_many`. Fields with a
+        `parse_validator` and nested serializers are validated row by row.
+        Returns a dict of the field names mapped to the errors of the
+        column, keyed by index.
+        """
+        column_errors = {}
+        fields = self._get_fields_without_copying()
+        for field_name, field in six.iteritems(fields):
+            if not isinstance(field, Field) or field.parse_validator:
+                continue
+            column = [
+                data.get(field_name) if is_mapping(data) else None
+                for data in items
+            ]
+            try:
+                column_errors[field_name] = field.validate_many(column)
+            except Exception:
+                # Leave the column to the row by row validation, which
+                # handles the errors raised by the validators.
+                pass
+        return column_errors
+
+    def _validate_item(self, index, data, column_errors=None):
+        """
+        Validates and deserializes the dict at `index` of a `many=True`
+        `data_dict`. Sets the errors of the dict on the serializer errors.
+        """
+        errors = constants.DICT_CLASS()
+        if not is_mapping(data):
+            errors['non_field_errors'] = [OrderedDict([
+                ('type_name', 'DictValidator'),
+                ('type_label', 'dict'),
+                ('message', 'Ensure the value %s is of type dict.' % (data,)),
+            ])]
+            restored_fields = None
+        else:
+            validated = None
+            if column_errors:
+                validated = dict(
+                    (field_name, errors_by_index.get(index, []))
+                    for field_name, errors_by_index in
+                    six.iteritems(column_errors)
+                )
+            restored_fields = self._validate_and_restore(
+                data,
+                errors,
+                validated
+            )
+        if errors:
+            self._errors[index] = errors
+        return restored_fields
+
+    def perform_validation(self, fields, data, errors=None, validated=None):
         """
         Runs the validators specified on the fields
         and sets the error messages.
+        Deserializes the fields in the same pass, each value is parsed only
+        once. Returns a dictionary of the deserialized fields, in the same
+        format as `restore_fields`.
+
+        :param errors: (optional) The dict the error messages are set on.
+            Defaults to the errors of the serializer.
+        :param validated: (optional) A dict of the names of the fields which
+            are already validated mapped to their list of errors.
+
+        When the class overrides `invoke_validators_and_set_errors`, it is
+        called to validate each field, and the fields are deserialized by
+        `restore_fields` instead.
         """
+        if errors is None:
+            errors = self._errors
+        invoke_validators = (
+            six.get_unbound_function(
+                self.__class__.invoke_validators_and_set_errors) is not
+            six.get_unbound_function(
+                BaseSerializer.invoke_validators_and_set_errors)
+        )
+        output = {}
         for field_name, field in six.iteritems(fields):
             if isinstance(field, Serializer):
-                self.perform_validation(
-                    fields=field.fields,
-                    data=data.get(field_name)
+                output[field_name] = self.perform_validation(
+                    fields=field._get_fields_without_copying(),
+                    data=data.get(field_name),
+                    errors=errors
                 )
-            else:
+                continue
+            if invoke_validators:
                 self.invoke_validators_and_set_errors(
                     field_name=field_name,
                     validators=field.validators,
                     value=data.get(field_name)
                 )
+                value, field_errors = None, errors.get(field_name)
+            else:
+                value = data.get(field_name)
+                field_errors, parsed = field.validate_for_restore(
+                    value,
+                    validated.get(field_name) if validated else None
+                )
+                if field_errors:
+                    value = None
+                elif parsed is not None:
+                    value = parsed[0]
+                else:
+                    try:
+                        value = field.to_python(value)
+                    except Exception:
+                        # The value passed validation, but could not be
+                        # deserialized. Leave raising the error to
+                        # `restore_object`.
+                        self._restore_failed = True
+                        value = None
+            output[field_name] = value
+            if field_errors:
+                errors[field_name] = field_errors
                 self._overwrite_field_error_message_with_custom_field_error_message(  # flake8: noqa
                     field_name,
-                    field
+                    field,
+                    errors
                 )
+        return output
 
     def invoke_validators_and_set_errors(self,
                                          field_name,
@@ -171,7 +448,7 @@ class BaseSerializer(object):
             del self._errors[field_name]
 
     def _overwrite_field_error_message_with_custom_field_error_message(self,
-            field_name, field):
+            field_name, field, errors=None):
         """
         Overwrites the field error message(set by validators)
         with custom field error message.
@@ -180,8 +457,10 @@ class BaseSerializer(object):
         and the field has encountered an error while running the validators;
         then the filed error message will be overwritten by the custom field error message.
         """
-        if self._errors.get(field_name) and field.error_dict:
-            self._errors[field_name] = [field.error_dict]
+        if errors is None:
+            errors = self._errors
+        if errors.get(field_name) and field.error_dict:
+            errors[field_name] = [field.error_dict]
 
     @property
     def object(self):
@@ -199,18 +478,42 @@ class BaseSerializer(object):
     def restore_object(self, instance=None):
         """
         Deserialize a dictionary of attributes into an object instance.
+        With `many=True` returns a list of the deserialized objects, one for
+        each dict in `data_dict`.
 
         :param instance: The isntance on which the
             deserialized object should be set.
         """
-        if not self.data_dict:
+        if self.many and self.data_dict is not None:
+            restored = self._restored_fields
+            if restored is None:
+                restored = [None] * len(self.data_dict)
+            return [
+                self._restore_item(data, restored_fields)
+                for data, restored_fields in zip(self.data_dict, restored)
+            ]
+        if self.data_dict is None:
             raise AttributeError(
                 'Cannot restore object unless `data_dict` value is set'
             )
+        return self._restore_item(self.data_dict, self._restored_fields)
+
+    def _restore_item(self, data, restored_fields):
+        """
+        Creates the deserialized object of a single dict. Uses the fields
+        deserialized during validation when available.
+        """
+        if restored_fields is None or self._overrides_restore_fields():
+            restored_fields = self.restore_fields(data)
+        target = self.get_target()
+        if target is not None:
+            return self.create_object(target, restored_fields)
         # Create an instance of the Serializer class
         instance = copy.copy(self)
-        restored_fields = self.restore_fields(self.data_dict)
-        for field_name, field in six.iteritems(self.fields):
+        instance.data_dict = data
+        instance.many = False
+        fields = self._get_fields_without_copying()
+        for field_name, field in six.iteritems(fields):
             self.set_field_value_on_instance(
                 instance=instance,
                 field_name=field_name,
@@ -229,18 +532,93 @@ class BaseSerializer(object):
         sets the field name and value of the field on the instance.
         """
         if isinstance(field, Serializer):
-            inst = copy.deepcopy(field)
-            for fldname, fld in six.iteritems(field.fields):
-                self.set_field_value_on_instance(
-                    instance=inst,
-                    field_name=fldname,
-                    field=fld,
-                    data=data.get(field_name)
-                )
+            inst = self._copy_nested_serializer(field, data.get(field_name))
             return setattr(instance, field_name, inst)
 
         return setattr(instance, field_name, data.get(field_name))
 
+    def _copy_nested_serializer(self, field, data):
+        """
+        Returns a copy of the nested serializer with its deserialized fields
+        set on it.
+        """
+        inst = copy.deepcopy(field)
+        nested_fields = field._get_fields_without_copying()
+        for fldname, fld in six.iteritems(nested_fields):
+            self.set_field_value_on_instance(
+                instance=inst,
+                field_name=fldname,
+                field=fld,
+                data=data
+            )
+        return inst
+
+    def get_target(self, default=None):
+        """
+        Returns the class the deserialized objects are created with, or
+        `None` if the objects are copies of the serializer.
+
+        :param default: The target used when the serializer has none.
+        """
+        target = self.target or default
+        if target == constants.SLOTS:
+            return self.get_slots_class()
+        return target
+
+    def get_slots_class(self):
+        """
+        Returns the `__slots__` class generated for the fields of the
+        serializer. The class is generated once per serializer class.
+        """
+        field_names = tuple(self._get_fields_without_copying().keys())
+        slots_class = self._slots_classes.get(field_names)
+        if slots_class is None:
+            slots_class = make_slots_class(
+                self.__class__.__name__,
+                field_names
+            )
+            self._slots_classes[field_names] = slots_class
+        return slots_class
+
+    def create_object(self, target, restored_fields, default=None):
+        """
+        Creates an object of the target class from the deserialized fields.
+        Nested serializers create their objects with their own target.
+        Nested serializers without a target use the target of the parent
+        when it is `dict` or `'slots'`, else they are copied.
+
+        :param target: The class the object is created with.
+        :param restored_fields: The dictionary of deserialized fields.
+        :param default: The target of the parent serializer passed on to
+            the nested serializers.
+        """
+        if self.target is dict or self.target == constants.SLOTS:
+            default = self.target
+        values = {}
+        fields = self._get_fields_without_copying()
+        for field_name, field in six.iteritems(fields):
+            value = restored_fields.get(field_name)
+            if isinstance(field, Serializer) and value is not None:
+                nested_target = field.get_target(default)
+                if nested_target is None:
+                    value = self._copy_nested_serializer(field, value)
+                else:
+                    value = field.create_object(nested_target, value, default)
+            values[field_name] = value
+        return target(**values)
+
+    def _overrides_restore_fields(self):
+        """
+        True if the class overrides `restore_fields` or `restore_field`, in
+        which case the fields deserialized during validation are not used.
+        """
+        cls = self.__class__
+        return any(
+            six.get_unbound_function(getattr(cls, name)) is not
+            six.get_unbound_function(getattr(BaseSerializer, name))
+            for name in ('restore_fields', 'restore_field')
+        )
+
     def restore_fields(self, data):
         """
         Converts a dictionary of data into a dictionary of deserialized fields.
@@ -252,7 +630,8 @@ class BaseSerializer(object):
         if data is None and not isinstance(data, dict):
             raise ValueError('%s must be a  instance of dict.' % data)
 
-        for field_name, field in six.iteritems(self.fields):
+        fields = self._get_fields_without_copying()
+        for field_name, field in six.iteritems(fields):
             fldname, value = self.restore_field(field_name, field, data)
             output[fldname] = value
         return output
@@ -273,7 +652,8 @@ class BaseSerializer(object):
             nested_field_name = field_name
             nested_data = data.get(nested_field_name)
             output = {}
-            for fldname, fld in six.iteritems(field.fields):
+            nested_fields = field._get_fields_without_copying()
+            for fldname, fld in six.iteritems(nested_fields):
                 name, python_value = self.restore_field(
                     field_name=fldname,
                     field=fld,
@@ -288,76 +668,621 @@ class BaseSerializer(object):
         """
         Returns the complete set of fields defined in the Serializer
         class as a dict.
+        The fields are resolved once per class, see `get_class_fields`.
+        Returns a copy of them, which can be modified.
+        """
+        return OrderedDict(self.get_class_fields())
+
+    @classmethod
+    def get_class_fields(cls):
+        """
+        Returns the complete set of fields defined in the Serializer class
+        as a read-only dict. The fields are resolved once per class and the
+        same dict is shared by all instances of the class.
+        """
+        fields = cls.__dict__.get('_class_fields')
+        if fields is None:
+            fields = frozen_mapping(
+                cls.resolve_fields(cls._options_class(cls.Meta))
+            )
+            cls._class_fields = fields
+        return fields
+
+    @classmethod
+    def get_source_paths(cls, separator='.'):
+        """
+        Returns the sorted list of the paths the serializer class reads from
+        the objects it serializes: the `source` or name of each field, the
+        fields of the nested serializers prefixed by their own path, and
+        the related objects along the paths. The `fields` and `exclude`
+        Meta options are applied.
+        Fields which get their own value, eg: `MethodField`, are not
+        included. Useful to only load the columns an ORM query needs.
+
+        :param separator: The separator of the names of the paths, eg:
+            `'__'` for the Django ORM.
+        """
+        return sorted(set(
+            separator.join(names)
+            for names, is_relation, many in iter_source_paths(
+                cls.get_class_fields())
+        ))
+
+    @classmethod
+    def get_related_paths(cls, many=None, separator='.'):
+        """
+        Returns the sorted list of the paths to the related objects the
+        serializer class reads: the sources of the nested serializers and
+        the objects along dotted sources. See `get_source_paths`.
+
+        :param many: `False` to only return the related objects which are
+            reached without going through a `many=True` nested serializer,
+            eg: for `select_related()`. `True` to only return the others,
+            eg: for `prefetch_related()`. Returns both by default.
+        :param separator: The separator of the names of the paths.
+        """
+        return sorted(set(
+            separator.join(names)
+            for names, is_relation, path_many in iter_source_paths(
+                cls.get_class_fields())
+            if is_relation and (many is None or many == path_many)
+        ))
+
+    @classmethod
+    def resolve_fields(cls, options):
+        """
+        Resolves the fields of the Serializer class, applying the `fields`
+        and `exclude` Meta options.
+
+        :param options: The `SerializerOptions` of the class.
         """
         # Maintain the order in which the fields were defined
         output = OrderedDict()
 
         # Get the explicitly declared fields
-        base_fields = copy.copy(self.base_fields)
-        for key, field in six.iteritems(base_fields):
+        for key, field in six.iteritems(cls.base_fields):
             if isinstance(field, (Field, Serializer)):
                 output[key] = field
 
         # Check for specified fields.
-        if self.options.fields:
-            if not isinstance(self.options.fields, (list, tuple)):
+        if options.fields:
+            if not isinstance(options.fields, (list, tuple)):
                 raise ValueError('`fields` must be a list or tuple.')
             d = OrderedDict()
-            for key in self.options.fields:
+            for key in options.fields:
                 d[key] = output[key]
             output = d
 
         # Remove anything in 'exclude'
-        if self.options.exclude:
-            if not isinstance(self.options.fields, (list, tuple)):
+        if options.exclude:
+            if not isinstance(options.fields, (list, tuple)):
                 raise ValueError('`exclude` must be a list or tuple.')
-            for key in self.options.exclude:
+            for key in options.exclude:
                 output.pop(key, None)
 
         return output
 
+    @property
+    def fields(self):
+        """
+        The fields of the serializer.
+        The instances of a class share the fields resolved for the class,
+        until the fields of an instance are modified through this property.
+        The instance then gets its own copy of them, which can be modified
+        without affecting other instances. Reading the fields does not copy
+        them.
+        """
+        if self._fields is None:
+            return CopyOnWriteMapping(
+                self._get_fields_without_copying,
+                self._copy_fields
+            )
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = fields
+
+    def _copy_fields(self):
+        """
+        Returns the fields of the instance, copying the fields shared by the
+        class on the first call.
+        """
+        if self._fields is None:
+            self._fields = self.get_fields()
+        return self._fields
+
+    def _get_fields_without_copying(self):
+        """
+        Returns the fields of the serializer, without copying the fields
+        shared by the class. The returned dict must not be modified.
+        """
+        if self._fields is None:
+            return self.get_class_fields()
+        return self._fields
+
+    @property
+    def plan(self):
+        """
+        Returns the compiled serialization plan of the serializer.
+        """
+        if self._plan is None:
+            self._plan = self.get_plan()
+        return self._plan
+
+    def get_plan(self):
+        """
+        Returns the serialization plan for the fields of the serializer.
+        Plans of the fields shared by the class are compiled once per
+        serializer class, `allow_blank_source` and `output_type`, and cached
+        on the class. Plans of the fields of an instance, eg: returned by a
+        `get_fields` override, are cached on the class by the identity of
+        the fields, in a bounded cache, so instances with the same fields
+        share a plan.
+        """
+        fields = self._get_fields_without_copying()
+        if fields is not self.get_class_fields():
+            # The plan holds the fields, their ids are not reused while the
+            # plan is cached
+            key = (
+                self.allow_blank_source,
+                self.output_type,
+                tuple(
+                    (field_name, id(field))
+                    for field_name, field in six.iteritems(fields)
+                )
+            )
+            plan = self._instance_plans.get(key)
+            if plan is None:
+                plan = self.create_plan(fields)
+                self._instance_plans.set(key, plan)
+            return plan
+        key = (self.allow_blank_source, self.output_type)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self.create_plan(fields)
+            self._plans[key] = plan
+        return plan
+
+    def create_plan(self, fields):
+        """
+        Compiles a serialization plan for the fields, with the options of
+        the serializer.
+        """
+        return SerializationPlan(
+            fields=fields,
+            allow_blank_source=self.allow_blank_source,
+            name=self.__class__.__name__,
+            output_type=self.output_type
+        )
+
+    def get_serialize_function(self):
+        """
+        Returns the function which serializes a single object, the
+        serialization plan bound to the serializer instance.
+        The plan is bound once per serializer instance.
+        """
+        if self._serialize is None:
+            self._serialize = self.plan.bind(self)
+        return self._serialize
+
+    @with_memo
     def to_native(self, obj):
         """
-        Serializes objects. Calls the field_to_native method on each fields.
+        Serializes objects. Dispatches to the compiled serialization plan,
+        which calls the field_to_native method on each field.
 
         :param obj: The python object passed in to be serialized.
         """
+        serialize = self.get_serialize_function()
+        memo = get_active_memo()
+        if memo is not None:
+            return self._serialize_memoized(
+                obj,
+                memo,
+                serialize,
+                self.to_native
+            )
         if isinstance(obj, (list, tuple)):
-            return [self.to_native(item) for item in obj]
+            return self._serialize_list(obj, serialize, self.to_native)
+        return serialize(obj)
 
-        # Maintain the order in which the fields were defined
-        output = OrderedDict()
+    def get_batch_function(self):
+        """
+        Returns the function which computes the values of the batched
+        fields, eg: `MethodField(concurrent=True)`, for a list of objects at
+        once. Returns `None` if the serializer has no batched fields.
+        """
+        if self._call_batched is None and self.plan.batched_fields:
+            self._call_batched = self.plan.bind_batched(self)
+        return self._call_batched
 
-        for field_name, field in six.iteritems(self.fields):
-            key = field_name
-            if isinstance(field, Serializer):
-                if field.source:
-                    serializable_obj = get_object_by_source(
-                        obj,
-                        field.source,
-                        field.allow_blank_source
-                    )
-                else:
-                    serializable_obj = getattr(obj, key)
-                serializable_obj = filter_list(serializable_obj)
-                if serializable_obj in [None, []] and field.many is False:
-                    value = None
-                elif serializable_obj in [None, []] and field.many is True:
-                    value = []
+    def _serialize_list(self, objs, serialize, serialize_list):
+        """
+        Serializes a list of objects with the serialize function, and the
+        nested lists with `serialize_list`. The values of the batched
+        fields are computed for all the objects at once beforehand.
+        """
+        call_batched = self.get_batch_function()
+        if call_batched is not None:
+            items = [
+                item for item in objs if not isinstance(item, (list, tuple))
+            ]
+        if call_batched is None or not items:
+            return [
+                serialize_list(item)
+                if isinstance(item, (list, tuple)) else serialize(item)
+                for item in objs
+            ]
+        prefetched = iter(call_batched(items))
+        return [
+            serialize_list(item)
+            if isinstance(item, (list, tuple))
+            else serialize(item, next(prefetched))
+            for item in objs
+        ]
+
+    def _iter_serialized(self, objs, serialize, serialize_list):
+        """
+        Returns a generator which serializes the objects of an iterable one
+        at a time with the serialize function, and the nested lists with
+        `serialize_list`. With batched fields, the objects are read in
+        chunks of `batch_chunk_size`, and the values of the batched fields
+        are computed for each chunk at once.
+        """
+        if self.get_batch_function() is None:
+            for obj in objs:
+                if isinstance(obj, (list, tuple)):
+                    yield serialize_list(obj)
                 else:
-                    value = field.to_native(serializable_obj)
+                    yield serialize(obj)
+            return
+        iterator = iter(objs)
+        while True:
+            chunk = list(islice(iterator, self.batch_chunk_size))
+            if not chunk:
+                return
+            for output in self._serialize_list(
+                    chunk, serialize, serialize_list):
+                yield output
+
+    def _serialize_memoized(self, obj, memo, serialize, serialize_list):
+        """
+        Serializes an object or a list of objects with the memo of the
+        current call. Objects already serialized with the same plan are not
+        serialized again, the others are serialized in a single batch.
+
+        :param obj: The object or the list of objects.
+        :param memo: The active `Memo`.
+        :param serialize: The function which serializes a single object.
+        :param serialize_list: The method serializing the nested lists,
+            `to_native` or `to_json`.
+        """
+        plan = self.plan
+        kind = serialize_list.__name__
+        items = obj if isinstance(obj, (list, tuple)) else [obj]
+        missing = OrderedDict()
+        for item in items:
+            if not isinstance(item, (list, tuple)):
+                key = (plan, kind, id(item))
+                if key not in memo and key not in missing:
+                    missing[key] = item
+        if missing:
+            outputs = self._serialize_list(
+                list(missing.values()),
+                serialize,
+                serialize_list
+            )
+            for (key, item), output in zip(missing.items(), outputs):
+                memo.set(key, item, output)
+        outputs = [
+            serialize_list(item)
+            if isinstance(item, (list, tuple))
+            else memo.get((plan, kind, id(item)))
+            for item in items
+        ]
+        if isinstance(obj, (list, tuple)):
+            return outputs
+        return outputs[0]
+
+    def field_to_native_many(self, objs, field_name):
+        """
+        Serializes the nested objects of a list of parent objects, when the
+        serializer is a nested field with batched fields. The nested objects
+        of all the parents are serialized in a single `to_native` call, so
+        their batched fields are computed once for all the parents.
+        Returns the list of the serialized values, in the order of the
+        parent objects.
+
+        :param objs: The list of parent objects.
+        :param field_name: The name of the field on the parent serializer.
+        """
+        if self.source:
+            get = get_source_accessor(self.source, self.allow_blank_source)
+        else:
+            get = operator.attrgetter(field_name)
+        values = [filter_list(get(obj)) for obj in objs]
+        nested = []
+        for value in values:
+            if value is None or value == []:
+                continue
+            if isinstance(value, (list, tuple)):
+                nested.extend(value)
             else:
-                field.initialize(
-                    parent=self,
-                    field_name=field_name,
-                    allow_blank_source=self.allow_blank_source
+                nested.append(value)
+        serialized = iter(self.to_native(nested))
+        output = []
+        for value in values:
+            if value is None or value == []:
+                output.append([] if self.many else None)
+            elif isinstance(value, (list, tuple)):
+                output.append([next(serialized) for item in value])
+            else:
+                output.append(next(serialized))
+        return output
+
+    def iter_data(self):
+        """
+        Returns a generator which serializes the objects in `instance` one
+        at a time. `instance` can be any iterable, eg: a generator or a
+        database cursor, and is consumed lazily.
+        Only available when the serializer is created with `many=True`.
+        Unlike `data`, the serialized objects are not cached.
+        Raises `ValueError` when called, without `many=True`.
+        """
+        if not self.many:
+            raise ValueError('`iter_data` can only be used with many=True')
+        if self.instance is None:
+            return iter(())
+        if self.is_parallel():
+            return parallel_serialization.iter_serialize(
+                self,
+                self.instance,
+                self.parallel_chunk_size
+            )
+        return self._iter_serialized(
+            self.instance,
+            self.get_serialize_function(),
+            self.to_native
+        )
+
+    def is_parallel(self):
+        """
+        True if the objects are serialized in worker processes, see the
+        `parallel` and `executor` options.
+        """
+        return bool(self.many and (
+            self.parallel or self.executor is not None
+        ))
+
+    def get_serialize_columns_function(self):
+        """
+        Returns the function which serializes a list of objects column by
+        column. The plan is bound once per serializer instance.
+        """
+        if self._serialize_columns is None:
+            self._serialize_columns = self.plan.bind_columns(self)
+        return self._serialize_columns
+
+    @with_memo
+    def to_columns(self, objs=None):
+        """
+        Serializes a list of objects column by column: the values of each
+        field are collected for all the objects, and converted at once with
+        the `to_native_many` method of the field.
+        Returns a dict of the field names mapped to the lists of serialized
+        values, in the order of the objects.
+
+        :param objs: (optional) An iterable of the python objects to be
+            serialized. Defaults to the `instance` of a serializer created
+            with `many=True`.
+        """
+        objs = self._get_objects(objs, 'to_columns')
+        return self.get_serialize_columns_function()(objs)
+
+    def get_numpy_dtype(self):
+        """
+        Returns the NumPy structured dtype derived from the fields of the
+        serializer. Requires NumPy.
+        """
+        return arrays.get_dtype(self._get_fields_without_copying())
+
+    def to_numpy(self, objs=None):
+        """
+        Exports a list of objects to a NumPy structured array, filled in
+        bulk column by column. The dtype is derived from the
+        `numpy_dtype` of the fields, see `get_numpy_dtype`, except for
+        integer and bool columns which contain `None`, exported as objects.
+        Fields without one hold their serialized values as objects.
+        Requires NumPy.
+
+        :param objs: (optional) An iterable of the python objects to be
+            exported. Defaults to the `instance` of a serializer created
+            with `many=True`.
+        """
+        arrays.require_numpy()
+        return arrays.to_numpy(self, self._get_objects(objs, 'to_numpy'))
+
+    def _get_objects(self, objs, method_name):
+        """
+        Returns the objects passed to a batch method as a list or tuple,
+        defaulting to the `instance` of a `many=True` serializer.
+        """
+        if objs is None:
+            if not self.many:
+                raise ValueError(
+                    '`%s` can only be used with many=True' % method_name
                 )
-                value = field.field_to_native(
-                    obj,
-                    field_name
+            objs = self.instance if self.instance is not None else []
+        if not isinstance(objs, (list, tuple)):
+            objs = list(objs)
+        return objs
+
+    def get_serialize_json_function(self):
+        """
+        Returns the function which serializes a single object directly to
+        JSON. The plan is bound once per serializer instance.
+        """
+        if self._serialize_json is None:
+            self._serialize_json = self.plan.bind_json(self)
+        return self._serialize_json
+
+    @with_memo
+    def to_json(self, obj):
+        """
+        Serializes objects directly to a JSON encoded string, without
+        building the intermediate `OrderedDict` for each object.
+        The output is the same as `json.dumps(serializer.to_native(obj))`.
+
+        :param obj: The python object passed in to be serialized.
+        """
+        serialize = self.get_serialize_json_function()
+        memo = get_active_memo()
+        if memo is not None:
+            output = self._serialize_memoized(
+                obj,
+                memo,
+                serialize,
+                self.to_json
+            )
+            if isinstance(obj, (list, tuple)):
+                return '[' + ', '.join(output) + ']'
+            return output
+        if isinstance(obj, (list, tuple)):
+            return '[' + ', '.join(
+                self._serialize_list(obj, serialize, self.to_json)
+            ) + ']'
+        return serialize(obj)
+
+    def dump_json_iter(self, chunk_size=65536):
+        """
+        Returns a generator which serializes `instance` to JSON, yielding
+        the encoded string in chunks. With `many=True` the objects are
+        serialized and written out incrementally, so the whole list is never
+        held in memory.
+
+        :param chunk_size: The approximate size, in characters, of the
+            chunks yielded.
+        """
+        if not self.many or self.instance is None:
+            yield self.to_json(self.instance)
+            return
+        chunk = ['[']
+        size = 1
+        separator = ''
+        for encoded in self._iter_serialized(
+                self.instance,
+                self.get_serialize_json_function(),
+                self.to_json):
+            chunk.append(separator)
+            chunk.append(encoded)
+            separator = ', '
+            size += len(encoded) + 2
+            if size >= chunk_size:
+                yield ''.join(chunk)
+                chunk = []
+                size = 0
+        chunk.append(']')
+        yield ''.join(chunk)
+
+    def write_json(self, fp, chunk_size=65536):
+        """
+        Serializes `instance` to JSON and writes it to the file-like
+        object `fp`, in chunks. See `dump_json_iter`.
+
+        :param fp: A file-like object with a `write` method, which accepts
+            strings.
+        :param chunk_size: The approximate size, in characters, of the
+            chunks written.
+        """
+        for chunk in self.dump_json_iter(chunk_size=chunk_size):
+            fp.write(chunk)
+
+    @classmethod
+    def dump_jsonl(cls, iterable, fp, buffer_size=1000, **kwargs):
+        """
+        Serializes the objects in the iterable to JSON Lines (one JSON
+        object per line) and writes them to the file-like object `fp`.
+        The objects are serialized one at a time, or in chunks of
+        `batch_chunk_size` when the serializer has batched fields.
+
+        :param iterable: An iterable of python objects to be serialized.
+        :param fp: A file-like object with a `write` method, which accepts
+            strings.
+        :param buffer_size: The number of lines buffered before they are
+            written to `fp`. Defaults to 1000.
+        :param kwargs: Keyword arguments passed directly into the
+            serializer.
+        """
+        serializer = cls(iterable, many=True, **kwargs)
+        lines = []
+        for encoded in serializer._iter_serialized(
+                iterable,
+                serializer.get_serialize_json_function(),
+                serializer.to_json):
+            lines.append(encoded)
+            if len(lines) >= buffer_size:
+                fp.write('\n'.join(lines) + '\n')
+                lines = []
+        if lines:
+            fp.write('\n'.join(lines) + '\n')
+
+    @classmethod
+    def load_jsonl(cls, fp, errors=None, **kwargs):
+        """
+        Returns a generator which deserializes the JSON Lines read from the
+        file-like object `fp` one line at a time, and yields the
+        deserialized objects.
+        Lines which are not valid JSON objects, do not pass validation or
+        can not be deserialized are skipped, and their errors are stored in
+        `errors` with the line number as key. Blank lines are ignored.
+
+        :param fp: A file-like object, or any iterable of lines.
+        :param errors: (optional) A dict which collects the errors of the
+            invalid lines, keyed by line number (starting from 1).
+        :param kwargs: Keyword arguments passed directly into the
+            serializer.
+        """
+        if errors is None:
+            errors = {}
+        for line_number, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                errors[line_number] = cls._jsonl_error(str(e))
+                continue
+            if not isinstance(data, dict):
+                errors[line_number] = cls._jsonl_error(
+                    'Expected a JSON object.'
                 )
-            output[key] = value
-        return output
+                continue
+            serializer = cls(data_dict=data, **kwargs)
+            if not serializer.is_valid():
+                errors[line_number] = serializer.errors
+                continue
+            try:
+                obj = serializer.object
+            except Exception as e:
+                # The line passed validation, but could not be deserialized
+                errors[line_number] = cls._jsonl_error(
+                    str(e),
+                    key='non_field_errors',
+                    type_label='restore'
+                )
+                continue
+            yield obj
+
+    @staticmethod
+    def _jsonl_error(message, key='json', type_label='json'):
+        return OrderedDict([
+            (key, [OrderedDict([
+                ('type_name', 'JsonLines'),
+                ('type_label', type_label),
+                ('message', message),
+            ])]),
+        ])
 
     @property
     def data(self):
@@ -367,7 +1292,26 @@ class BaseSerializer(object):
         Uses the cached version next time when the data property is accessed.
         """
         if not self._data:
-            self._data = self.to_native(self.instance)
+            if self.is_parallel() and self.instance is not None:
+                self._data = list(self.iter_data())
+            elif self.many and self.columnar and self.instance is not None:
+                objs = self.instance
+                if not isinstance(objs, (list, tuple)):
+                    objs = list(objs)
+                self._data = self.plan.rows_from_columns(
+                    self.to_columns(objs),
+                    len(objs)
+                )
+            elif (self.many and self.instance is not None and
+                    not isinstance(self.instance, (list, tuple))):
+                if self.memoize or self.plan.batched_fields:
+                    # Serialize the objects at once, to share the memo or
+                    # compute the batched fields for all of them
+                    self._data = self.to_native(list(self.instance))
+                else:
+                    self._data = list(self.iter_data())
+            else:
+                self._data = self.to_native(self.instance)
         return self._data
 
     def metadata(self):
@@ -375,7 +1319,7 @@ class BaseSerializer(object):
         Return a dictionary of metadata about the fields on the serializer.
         """
         return dict(
-            (field_name, field.metadata()) for field_name, field in six.iteritems(self.fields)  # NOQA
+            (field_name, field.metadata()) for field_name, field in six.iteritems(self._get_fields_without_copying())  # NOQA
         )
 
 
@@ -1,29 +1,81 @@
+import copy
 import inspect
+import threading
 import six
-import collections
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from pyserializer.constants import NATIVE_TYPES
+
+try:
+    from collections.abc import Mapping, MutableMapping
+except ImportError:  # Python 2
+    from collections import Mapping, MutableMapping
+
+try:
+    from types import MappingProxyType
+except ImportError:  # Python 2
+    MappingProxyType = None
 
 
 __all__ = [
     'is_simple_callable',
     'is_iterable',
+    'is_mapping',
     'force_str',
+    'get_source_accessor',
     'get_object_by_source',
     'filter_list',
+    'frozen_mapping',
+    'CopyOnWriteMapping',
+    'make_slots_class',
+    'LRUCache',
+    'Memo',
+    'get_active_memo',
+    'activate_memo',
 ]
 
 
+# Cache of `(code, is_method, number of defaults) -> bool`,
+# whether the function can be called without arguments
+_simple_callables = {}
+
+# Cache of `type -> bool`, whether the type is a mapping
+_mapping_types = {dict: True}
+
+# Cache of `(source, allow_blank_source) -> accessor`
+_source_accessors = {}
+
+
 def is_simple_callable(obj):
     '''
     True if the object is a callable and takes no arguments, else False.
+    The signature check is cached per code object.
     '''
+    if type(obj) in NATIVE_TYPES:
+        return False
     function = inspect.isfunction(obj)
     method = inspect.ismethod(obj)
     if not (function or method):
         return False
-    args, varargs, keywords, defaults = inspect.getargspec(obj)
-    len_args = len(args) if function else len(args) - 1
+    func = obj.__func__ if method else obj
+    key = (func.__code__, method, len(func.__defaults__ or ()))
+    try:
+        return _simple_callables[key]
+    except KeyError:
+        pass
+    if six.PY3:
+        spec = inspect.getfullargspec(func)
+        args, defaults = spec.args, spec.defaults
+        required_kwonly = set(spec.kwonlyargs) - set(spec.kwonlydefaults or ())
+    else:
+        args, varargs, keywords, defaults = inspect.getargspec(func)
+        required_kwonly = ()
+    len_args = len(args) - 1 if method else len(args)
     len_defaults = len(defaults) if defaults else 0
-    return len_args <= len_defaults
+    result = len_args <= len_defaults and not required_kwonly
+    _simple_callables[key] = result
+    return result
 
 
 def is_iterable(obj):
@@ -43,36 +95,80 @@ def force_str(value, encoding='utf-8'):
     return value
 
 
+def is_mapping(obj):
+    """
+    True if the object is a mapping, else False.
+    The result is cached per type, to avoid the ABC check on every call.
+    """
+    cls = type(obj)
+    try:
+        return _mapping_types[cls]
+    except KeyError:
+        result = _mapping_types[cls] = issubclass(cls, Mapping)
+        return result
+
+
+def get_source_accessor(source, allow_blank_source=False):
+    """
+    Returns a function which gets the object by source from the object
+    passed in to it. See `get_object_by_source`.
+    The dot separated source is parsed once and the accessor is cached,
+    so the same accessor is returned for the same source.
+
+    Example:
+        >>> get_city = get_source_accessor('location.address.city')
+        >>> city = get_city(practice)
+    """
+    key = (source, allow_blank_source)
+    try:
+        return _source_accessors[key]
+    except KeyError:
+        pass
+
+    names = tuple(source.split('.'))
+    if len(names) == 1:
+        def accessor(obj):
+            try:
+                if is_mapping(obj):
+                    return obj.get(source)
+                return getattr(obj, source)
+            except AttributeError:
+                if not allow_blank_source:
+                    raise
+                return None
+    else:
+        def accessor(obj):
+            try:
+                for name in names:
+                    if is_mapping(obj):
+                        obj = obj.get(name)
+                    else:
+                        obj = getattr(obj, name)
+            except AttributeError:
+                if not allow_blank_source:
+                    raise
+                return None
+            return obj
+
+    accessor.source = source
+    _source_accessors[key] = accessor
+    return accessor
+
+
 def get_object_by_source(obj, source, allow_blank_source=False):
     """
     Tries to get the object by source.
     Similar to Python's `getattr(obj, source)`, but takes a dot separaed
     string for source to get source from nested obj, instead of a single
     source field. Also, supports getting source form obj where obj is a
-    dict type.
+    dict type. Each object along the source path is looked up as a mapping
+    or by attribute depending on its own type.
 
     Example:
         >>> obj = get_object_by_source(
             object, source='user.username')
     """
-    try:
-        if isinstance(obj, collections.Mapping):
-            if '.' in source:
-                for source in source.split('.'):
-                    obj = obj.get(source)
-            else:
-                obj = obj.get(source)
-        else:
-            if '.' in source:
-                for source in source.split('.'):
-                    obj = getattr(obj, source)
-            else:
-                obj = getattr(obj, source)
-    except AttributeError:
-        if not allow_blank_source:
-            raise
-        obj = None
-    return obj
+    return get_source_accessor(source, allow_blank_source)(obj)
 
 
 def filter_list(obj):
@@ -82,3 +178,229 @@ def filter_list(obj):
     if isinstance(obj, (list, tuple)):
         return [item for item in obj if item is not None]
     return obj
+
+
+def frozen_mapping(mapping):
+    """
+    Returns a read-only view of the mapping.
+    On Python 2 the mapping is returned as is.
+    """
+    if MappingProxyType is None:
+        return mapping
+    return MappingProxyType(mapping)
+
+
+class CopyOnWriteMapping(MutableMapping):
+    """
+    A modifiable view of a shared mapping, which is only copied on the
+    first write. Reading does not copy the mapping.
+    """
+
+    def __init__(self, read, write):
+        """
+        :param read: A function returning the current mapping.
+        :param write: A function returning the modifiable copy of the
+            mapping, copying it on the first call.
+        """
+        self._read = read
+        self._write = write
+
+    def __getitem__(self, key):
+        return self._read()[key]
+
+    def __iter__(self):
+        return iter(self._read())
+
+    def __len__(self):
+        return len(self._read())
+
+    def __contains__(self, key):
+        return key in self._read()
+
+    def __setitem__(self, key, value):
+        self._write()[key] = value
+
+    def __delitem__(self, key):
+        del self._write()[key]
+
+    def __repr__(self):
+        return repr(self._read())
+
+
+def make_slots_class(name, field_names):
+    """
+    Returns a lightweight class with `__slots__` for the field names.
+    The class takes the field values as keyword arguments, missing values
+    are set to `None`.
+
+    :param name: The name of the class.
+    :param field_names: The names of the attributes of the class.
+    """
+    field_names = tuple(str(field_name) for field_name in field_names)
+
+    def __init__(self, **kwargs):
+        for field_name in field_names:
+            setattr(self, field_name, kwargs.get(field_name))
+
+    def __repr__(self):
+        return '%s(%s)' % (name, ', '.join(
+            '%s=%r' % (field_name, getattr(self, field_name))
+            for field_name in field_names
+        ))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, field_name) == getattr(other, field_name)
+            for field_name in field_names
+        )
+
+    def __ne__(self, other):
+        return not self == other
+
+    return type(str(name), (object,), {
+        '__slots__': field_names,
+        '__init__': __init__,
+        '__repr__': __repr__,
+        '__eq__': __eq__,
+        '__ne__': __ne__,
+        '__hash__': None,
+    })
+
+
+class LRUCache(object):
+    """
+    A bounded cache which discards the least recently used keys once it
+    holds more than `maxsize` keys. Counts the hits and misses of `get`.
+    Safe to share between threads.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        :param maxsize: The maximum number of keys held by the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for the key, or `default`.
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            # Re-insert the key as the most recently used one
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """
+        Caches the value for the key.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all the keys and resets the hit and miss counts.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """
+        The ratio of the `get` calls which found the key, between 0 and 1.
+        """
+        total = self.hits + self.misses
+        if not total:
+            return 0.0
+        return float(self.hits) / total
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class Memo(object):
+    """
+    The outputs memoized during a single serialization call, keyed by
+    object identity. Holds a reference to each object, so the id of an
+    object is not reused while the memo is alive.
+    """
+
+    def __init__(self, copy=False):
+        """
+        :param copy: If `True` `get` returns a deep copy of the output,
+            else the output itself is shared.
+        """
+        self.copy = copy
+        self.hits = 0
+        self._data = {}
+
+    def get(self, key):
+        """
+        Returns the output memoized for the key, copied if `copy` is set.
+        Raises `KeyError` if the key is not memoized.
+        """
+        obj, output = self._data[key]
+        self.hits += 1
+        if self.copy:
+            return copy.deepcopy(output)
+        return output
+
+    def set(self, key, obj, output):
+        """
+        Memoizes the output of the object for the key.
+        """
+        self._data[key] = (obj, output)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+# The memo of the serialization call running in the current thread
+_active_memo = threading.local()
+
+
+def get_active_memo():
+    """
+    Returns the `Memo` activated in the current thread, `None` if there is
+    none.
+    """
+    return getattr(_active_memo, 'memo', None)
+
+
+@contextmanager
+def activate_memo(memo):
+    """
+    Activates the memo in the current thread for the duration of the
+    `with` block. The memo is discarded when the block exits.
+    """
+    _active_memo.memo = memo
+    try:
+        yield memo
+    finally:
+        _active_memo.memo = None
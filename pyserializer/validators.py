@@ -3,15 +3,27 @@ import re
 import uuid
 import copy
 import decimal
-import collections
 from encodings import idna
 from decimal import Decimal
 from collections import OrderedDict
 from datetime import datetime, date
 from pyserializer.exceptions import ValidationError
 from pyserializer.utils import force_str
+from pyserializer.dateparse import parse_date, parse_datetime
 from pyserializer import constants
 
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+# NumPy is an optional dependency, used by the batch validation of the
+# value validators when installed
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 __all__ = [
     'BaseValidator',
@@ -36,6 +48,74 @@ __all__ = [
 ]
 
 
+# Types of the values which are numbers without conversion
+NUMBER_TYPES = frozenset(six.integer_types + (float,))
+
+# The integers below this magnitude are exactly represented by float64
+MAX_EXACT_INTEGER = 2 ** 53
+
+
+def to_number_array(values):
+    """
+    Returns the values as a NumPy array if NumPy is installed and the values
+    are all ints or floats, else `None`.
+
+    :param values: A list or a NumPy array of values.
+    """
+    if numpy is None:
+        return None
+    if isinstance(values, numpy.ndarray):
+        if values.dtype.kind in 'iuf':
+            return values
+        return None
+    if not values or not set(map(type, values)) <= NUMBER_TYPES:
+        return None
+    try:
+        array = numpy.array(values)
+    except OverflowError:
+        return None
+    if array.dtype.kind not in 'iuf':
+        return None
+    return array
+
+
+def to_comparable_array(values, bound):
+    """
+    Returns the values as a NumPy array, see `to_number_array`, if NumPy
+    compares them with the bound exactly, else `None`. NumPy may compare
+    them as float64, which only holds integers below 2**53 in magnitude
+    exactly, so larger integers are compared one by one.
+
+    :param values: A list or a NumPy array of values.
+    :param bound: The number the values are compared with.
+    """
+    if type(bound) not in NUMBER_TYPES:
+        return None
+    if (not isinstance(bound, float) and
+            not -MAX_EXACT_INTEGER < bound < MAX_EXACT_INTEGER):
+        return None
+    array = to_number_array(values)
+    if array is None or not len(array):
+        return None
+    if not (-MAX_EXACT_INTEGER < array.min() and
+            array.max() < MAX_EXACT_INTEGER):
+        return None
+    return array
+
+
+def overrides_is_valid(validator, *classes):
+    """
+    True if the class of the validator overrides the `is_valid` method of
+    the classes, in which case the batch validation of the classes can
+    not be used.
+    """
+    is_valid = six.get_unbound_function(type(validator).is_valid)
+    return all(
+        is_valid is not six.get_unbound_function(cls.is_valid)
+        for cls in classes
+    )
+
+
 class BaseValidator(object):
     """
     A base class for validators.
@@ -67,6 +147,25 @@ class BaseValidator(object):
             '`is_valid` should be implemented by the child class.'
         )
 
+    def validate_many(self, values):
+        """
+        Validates a list of values at once.
+        Returns a list of bools, the mask of the values which fail the
+        validation. Validators can override it to check the whole list
+        at once.
+
+        :param values: A list or a NumPy array of values.
+        """
+        mask = []
+        for value in values:
+            try:
+                self(value)
+            except ValidationError:
+                mask.append(True)
+            else:
+                mask.append(False)
+        return mask
+
     def fail(self, key, **kwargs):
         """
         A helper method to raise `ValidationError`
@@ -138,6 +237,12 @@ class MaxValueValidator(BaseValidator):
             value = Decimal(value)
         return self.max_value > value
 
+    def validate_many(self, values):
+        array = to_comparable_array(values, self.max_value)
+        if array is None or overrides_is_valid(self, MaxValueValidator):
+            return super(MaxValueValidator, self).validate_many(values)
+        return (~(self.max_value > array)).tolist()
+
 
 class MinValueValidator(BaseValidator):
     """
@@ -172,6 +277,12 @@ class MinValueValidator(BaseValidator):
             value = Decimal(value)
         return value >= self.min_value
 
+    def validate_many(self, values):
+        array = to_comparable_array(values, self.min_value)
+        if array is None or overrides_is_valid(self, MinValueValidator):
+            return super(MinValueValidator, self).validate_many(values)
+        return (~(array >= self.min_value)).tolist()
+
 
 class MaxLengthValidator(BaseValidator):
     """
@@ -339,6 +450,42 @@ class NumberValidator(BaseValidator):
         except (ValueError, TypeError):
             return False
 
+    def get_valid_types(self):
+        """
+        Returns the types of the values which are always valid, and do not
+        have to be converted to be validated.
+        """
+        if self.num_type is int:
+            # `int(str(1.5))` fails, floats are not valid integers
+            return frozenset(six.integer_types)
+        return NUMBER_TYPES
+
+    def validate_many(self, values):
+        if overrides_is_valid(self, NumberValidator, DecimalValidator):
+            return super(NumberValidator, self).validate_many(values)
+        valid_types = self.get_valid_types()
+        array = to_number_array(values)
+        if array is not None and (isinstance(values, numpy.ndarray) or
+                                  len(set(map(type, values))) == 1):
+            # The dtype only tells the type of each value when the values
+            # all have the same type, eg: `[1, 2.5]` is an array of floats
+            if array.dtype.kind in 'iu' or float in valid_types:
+                return [False] * len(array)
+            # Floats are not valid integers
+            return [True] * len(array)
+        mask = []
+        for value in values:
+            if type(value) in valid_types:
+                mask.append(False)
+                continue
+            try:
+                self(value)
+            except ValidationError:
+                mask.append(True)
+            else:
+                mask.append(False)
+        return mask
+
 
 class IntegerValidator(NumberValidator):
     """
@@ -402,7 +549,7 @@ class DictValidator(BaseValidator):
             self.fail('invalid', value=value)
 
     def is_valid(self, value):
-        if isinstance(value, collections.Mapping):
+        if isinstance(value, Mapping):
             return True
         return False
 
@@ -469,11 +616,18 @@ class DateTimeValidator(BaseValidator):
         if isinstance(value, (datetime, date)):
             return True
         try:
-            datetime.strptime(value, self.format)
+            self.parse(value)
             return True
         except (ValueError, TypeError):
             return False
 
+    def parse(self, value):
+        """
+        Parses the value with the format of the validator.
+        Raises `ValueError` or `TypeError` if the value can not be parsed.
+        """
+        return parse_datetime(value, self.format)
+
 
 class DateValidator(DateTimeValidator):
     """
@@ -486,6 +640,9 @@ class DateValidator(DateTimeValidator):
     }
     format = constants.DATETIME_FORMAT
 
+    def parse(self, value):
+        return parse_date(value, self.format)
+
 
 class BooleanValidator(BaseValidator):
     """
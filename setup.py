@@ -14,6 +14,9 @@ setup(
     install_requires=[
         'six>=1.10.0'
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Environment :: Web Environment',
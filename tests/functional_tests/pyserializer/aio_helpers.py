@@ -0,0 +1,64 @@
+# Coroutines used by the asyncio serialization tests. Kept out of
+# `aio_tests` as the async syntax requires Python 3.5+.
+import asyncio
+
+
+class AsyncCursor(object):
+    """
+    An async iterable of objects, like an async database cursor.
+    """
+
+    def __init__(self, objs):
+        self.objs = iter(objs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.objs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+async def count_active(active, value):
+    """
+    Returns the value after a short sleep. Counts the calls running at
+    once in `active[0]`, and the maximum reached in `active[1]`.
+    """
+    active[0] += 1
+    active[1] = max(active)
+    await asyncio.sleep(0.01)
+    active[0] -= 1
+    return value
+
+
+async def fail(value):
+    raise KeyError(value)
+
+
+async def collect(iterator):
+    """
+    Returns the list of the items of an async iterator.
+    """
+    items = []
+    async for item in iterator:
+        items.append(item)
+    return items
+
+
+async def collect_with_ticker(iterator, ticks):
+    """
+    Returns the list of the items of an async iterator, while a concurrent
+    task appends to `ticks` each time it runs.
+    """
+    async def tick():
+        while True:
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    task = asyncio.ensure_future(tick())
+    try:
+        return await collect(iterator)
+    finally:
+        task.cancel()
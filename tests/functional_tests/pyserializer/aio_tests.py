@@ -0,0 +1,239 @@
+from nose.tools import *  # flake8: noqa
+from mock import *  # flake8: noqa
+
+import json
+import time
+from collections import OrderedDict
+
+# Only test the asyncio serialization on Python 3.5+
+try:
+    import asyncio
+    from pyserializer.aio import AsyncSerializer
+    from tests.functional_tests.pyserializer.aio_helpers import (
+        AsyncCursor,
+        collect,
+        collect_with_ticker,
+        count_active,
+        fail,
+    )
+except (ImportError, SyntaxError):
+    AsyncSerializer = None
+
+from pyserializer.serializers import Serializer
+from pyserializer import fields
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+if AsyncSerializer:
+    class TestAsyncSerialization:
+
+        def setup(self):
+            class AddressSerializer(Serializer):
+                city = fields.CharField()
+
+            class UserSerializer(AsyncSerializer):
+                email = fields.CharField()
+                username = fields.CharField()
+                avatar = fields.MethodField(method_name='get_avatar')
+                address = AddressSerializer()
+                greeting = fields.MethodField(method_name='get_greeting')
+
+                def get_avatar(self, obj):
+                    # Coroutines are awaited like coroutine methods
+                    return asyncio.sleep(0.05, obj.email.replace('@', '.'))
+
+                def get_greeting(self, obj):
+                    return 'Hello %s' % obj.email
+
+            class User(object):
+                def __init__(self, index):
+                    self.email = 'user%d@example.com' % index
+                    self.username = asyncio.sleep(0.05, 'user%d' % index)
+                    self.address = Mock(city='City %d' % index)
+
+            self.UserSerializer = UserSerializer
+            self.User = User
+
+        def expected(self, index):
+            return OrderedDict([
+                ('email', 'user%d@example.com' % index),
+                ('username', 'user%d' % index),
+                ('avatar', 'user%d.example.com' % index),
+                ('address', {'city': 'City %d' % index}),
+                ('greeting', 'Hello user%d@example.com' % index),
+            ])
+
+        def test_adata(self):
+            serializer = self.UserSerializer(
+                self.User(1),
+                output_type='ordered_dict'
+            )
+            output = run(serializer.adata())
+            assert_equal(output, self.expected(1))
+            assert_equal(list(output.keys()), list(self.expected(1).keys()))
+
+        def test_adata_with_many(self):
+            users = [self.User(index) for index in range(20)]
+            serializer = self.UserSerializer(
+                users,
+                many=True,
+                output_type='ordered_dict'
+            )
+            start = time.time()
+            output = run(serializer.adata())
+            # The 40 awaitables are awaited concurrently
+            assert_true(time.time() - start < 1)
+            assert_equal(output, [self.expected(index) for index in range(20)])
+
+        def test_adata_is_cached(self):
+            serializer = self.UserSerializer(self.User(1))
+            assert_true(run(serializer.adata()) is serializer._data)
+
+        def test_max_concurrency(self):
+            active = [0, 0]
+
+            class UserSerializer(AsyncSerializer):
+                avatar = fields.MethodField(method_name='get_avatar')
+
+                def get_avatar(self, obj):
+                    return count_active(active, obj)
+
+            serializer = UserSerializer(
+                list(range(10)),
+                many=True,
+                max_concurrency=3,
+                output_type='tuple'
+            )
+            output = run(serializer.adata())
+            assert_equal(output, [(index,) for index in range(10)])
+            assert_equal(active[1], 3)
+
+        def test_output_type_tuple(self):
+            serializer = self.UserSerializer(self.User(1), output_type='tuple')
+            assert_equal(
+                run(serializer.adata()),
+                tuple(self.expected(1).values())
+            )
+
+        def test_nested_async_serializer(self):
+            UserSerializer = self.UserSerializer
+
+            class TeamSerializer(AsyncSerializer):
+                name = fields.CharField()
+                users = UserSerializer(many=True, source='members')
+
+            team = Mock(
+                members=asyncio.sleep(0, [self.User(1), self.User(2)])
+            )
+            team.name = 'Team'
+            output = run(TeamSerializer(team).adata())
+            assert_equal(output['name'], 'Team')
+            assert_equal(
+                [dict(user) for user in output['users']],
+                [dict(self.expected(1)), dict(self.expected(2))]
+            )
+
+        def test_exception_is_raised(self):
+            class UserSerializer(AsyncSerializer):
+                avatar = fields.MethodField(method_name='get_avatar')
+
+                def get_avatar(self, obj):
+                    return fail(obj)
+
+            with assert_raises(KeyError):
+                run(UserSerializer([1, 2], many=True).adata())
+
+
+if AsyncSerializer:
+    class TestAsyncSerializationToJson:
+
+        def setup(self):
+            class UserSerializer(AsyncSerializer):
+                email = fields.CharField()
+                avatar = fields.MethodField(method_name='get_avatar')
+
+                def get_avatar(self, obj):
+                    return asyncio.sleep(0, obj.email.replace('@', '.'))
+
+            class User(object):
+                def __init__(self, index):
+                    self.email = 'user%d@example.com' % index
+
+            self.UserSerializer = UserSerializer
+            self.users = [User(index) for index in range(25)]
+            self.expected = [
+                {
+                    'email': 'user%d@example.com' % index,
+                    'avatar': 'user%d.example.com' % index,
+                }
+                for index in range(25)
+            ]
+
+        def test_aiter_json(self):
+            serializer = self.UserSerializer(self.users, many=True)
+            chunks = run(collect(serializer.aiter_json(chunk_size=200)))
+            assert_true(len(chunks) > 1)
+            assert_equal(json.loads(''.join(chunks)), self.expected)
+
+        def test_aiter_json_is_the_same_as_adata(self):
+            serializer = self.UserSerializer(self.users, many=True)
+            chunks = run(collect(serializer.aiter_json(yield_every=7)))
+            assert_equal(
+                ''.join(chunks),
+                json.dumps(run(serializer.adata()))
+            )
+
+        def test_aiter_json_with_async_iterable(self):
+            serializer = self.UserSerializer(
+                AsyncCursor(self.users),
+                many=True
+            )
+            chunks = run(collect(serializer.aiter_json(yield_every=10)))
+            assert_equal(json.loads(''.join(chunks)), self.expected)
+
+        def test_aiter_json_with_empty_list(self):
+            serializer = self.UserSerializer([], many=True)
+            assert_equal(run(collect(serializer.aiter_json())), ['[]'])
+
+        def test_aiter_json_without_many(self):
+            serializer = self.UserSerializer(self.users[0])
+            chunks = run(collect(serializer.aiter_json()))
+            assert_equal(json.loads(''.join(chunks)), self.expected[0])
+
+        def test_aiter_json_yields_to_the_event_loop(self):
+            class UserSerializer(AsyncSerializer):
+                email = fields.CharField()
+
+            ticks = []
+            serializer = UserSerializer(self.users, many=True)
+            chunks = run(collect_with_ticker(
+                serializer.aiter_json(yield_every=5),
+                ticks
+            ))
+            assert_equal(len(json.loads(''.join(chunks))), 25)
+            # The ticker ran between the batches of 5 objects
+            assert_true(len(ticks) >= 5)
+
+        def test_adata_with_async_iterable(self):
+            serializer = self.UserSerializer(
+                AsyncCursor(self.users),
+                many=True
+            )
+            assert_equal(
+                json.loads(json.dumps(run(serializer.adata()))),
+                self.expected
+            )
+
+        def test_sync_serializer_rejects_async_iterable(self):
+            class UserSerializer(Serializer):
+                email = fields.CharField()
+
+            with assert_raises(ValueError):
+                UserSerializer(AsyncCursor(self.users), many=True)
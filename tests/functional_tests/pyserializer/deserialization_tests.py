@@ -1,6 +1,8 @@
 from nose.tools import *  # flake8: noqa
 from mock import *  # flake8: noqa
 
+import decimal
+from collections import namedtuple
 from datetime import date, datetime
 
 from pyserializer.serializers import Serializer
@@ -188,3 +190,355 @@ class TestInternalNestedDeserialization:
         assert_equal(obj.comment.user.email, 'foo@example.com')
         assert_equal(obj.comment.user.username, 'JohnSmith')
         assert_equal(obj.posted_at, datetime(2012, 1, 1, 16, 0))
+
+
+class TestDeserializationFromJsonLines:
+
+    def setup(self):
+        class UserDeserializer(Serializer):
+            email = fields.CharField(
+                validators=[validators.RequiredValidator()]
+            )
+            age = fields.IntegerField()
+
+        self.UserDeserializer = UserDeserializer
+
+    def test_load_jsonl(self):
+        lines = [
+            '{"email": "foo@example.com", "age": 20}\n',
+            '\n',
+            '{"age": 30}\n',
+            'not json\n',
+            '{"email": "bar@example.com", "age": "40"}\n',
+        ]
+        errors = {}
+        objects = list(self.UserDeserializer.load_jsonl(lines, errors=errors))
+        assert_equal(
+            [(obj.email, obj.age) for obj in objects],
+            [('foo@example.com', 20), ('bar@example.com', 40)]
+        )
+        assert_equal(sorted(errors.keys()), [3, 4])
+        assert_true('email' in errors[3])
+        assert_true('json' in errors[4])
+
+    def test_load_jsonl_with_restore_error(self):
+        class AgeField(fields.Field):
+            def to_python(self, value):
+                return int(value)
+
+        class UserDeserializer(Serializer):
+            age = AgeField()
+
+        lines = ['{"age": 1}\n', '{"age": "zz"}\n', '{"age": 3}\n']
+        errors = {}
+        objects = list(UserDeserializer.load_jsonl(lines, errors=errors))
+        assert_equal([obj.age for obj in objects], [1, 3])
+        assert_equal(list(errors.keys()), [2])
+        assert_true('non_field_errors' in errors[2])
+
+    def test_load_jsonl_with_empty_object(self):
+        class UserDeserializer(Serializer):
+            age = fields.IntegerField()
+
+        lines = ['{}\n', '[]\n']
+        errors = {}
+        objects = list(UserDeserializer.load_jsonl(lines, errors=errors))
+        assert_equal([obj.age for obj in objects], [None])
+        assert_equal(list(errors.keys()), [2])
+
+
+class TestDeserializationParsesValuesOnce:
+
+    def setup(self):
+        class EventDeserializer(Serializer):
+            name = fields.CharField()
+            starts_at = fields.DateTimeField(format='%Y-%m-%dT%H:%M:%SZ')
+
+        self.EventDeserializer = EventDeserializer
+
+    def test_deserialization_parses_values_once(self):
+        input_data = {
+            'name': 'Checkup',
+            'starts_at': '2012-01-01T16:00:00Z'
+        }
+        deserializer = self.EventDeserializer(data_dict=input_data)
+        field = self.EventDeserializer.base_fields['starts_at']
+        to_python = Mock(wraps=field.to_python)
+        with patch.object(field, 'to_python', to_python):
+            obj = deserializer.object
+        assert_equal(obj.starts_at, datetime(2012, 1, 1, 16, 0))
+        assert_equal(to_python.call_count, 1)
+
+
+class TestDeserializationWithOverriddenValidation:
+
+    def setup(self):
+        class UserDeserializer(Serializer):
+            email = fields.CharField(
+                validators=[validators.RequiredValidator()]
+            )
+            username = fields.CharField()
+
+        self.UserDeserializer = UserDeserializer
+
+    def test_overridden_perform_validation(self):
+        class UserDeserializer(self.UserDeserializer):
+            def perform_validation(self, fields, data):
+                super(UserDeserializer, self).perform_validation(fields, data)
+                if data.get('username') == 'admin':
+                    self._errors['username'] = ['Reserved username.']
+
+        deserializer = UserDeserializer(data_dict={'username': 'admin'})
+        assert_false(deserializer.is_valid())
+        assert_equal(
+            sorted(deserializer.errors.keys()),
+            ['email', 'username']
+        )
+        deserializer = UserDeserializer(data_dict={
+            'email': 'foo@example.com',
+            'username': 'foo'
+        })
+        assert_equal(deserializer.object.username, 'foo')
+
+    def test_overridden_invoke_validators_and_set_errors(self):
+        calls = []
+
+        class UserDeserializer(self.UserDeserializer):
+            def invoke_validators_and_set_errors(self,
+                                                 field_name,
+                                                 validators,
+                                                 value):
+                calls.append(field_name)
+                super(UserDeserializer, self).invoke_validators_and_set_errors(
+                    field_name,
+                    validators,
+                    value
+                )
+
+        deserializer = UserDeserializer(
+            data_dict=[{'username': 'foo'}, {'email': 'foo@example.com'}],
+            many=True
+        )
+        assert_equal(list(deserializer.errors.keys()), [0])
+        assert_true('email' in deserializer.errors[0])
+        assert_equal(calls, ['email', 'username'] * 2)
+
+
+class TestDeserializationWithFailingValidator:
+
+    def setup(self):
+        class BrokenValidator(validators.BaseValidator):
+            def __call__(self, value):
+                raise RuntimeError('Broken validator')
+
+        class UserDeserializer(Serializer):
+            email = fields.CharField(validators=[BrokenValidator()])
+
+        self.UserDeserializer = UserDeserializer
+
+    def test_validator_exceptions_are_raised(self):
+        deserializer = self.UserDeserializer(data_dict={'email': 'foo'})
+        with assert_raises(RuntimeError):
+            deserializer.is_valid()
+
+    def test_value_which_can_not_be_validated(self):
+        class UserDeserializer(Serializer):
+            age = fields.IntegerField(
+                validators=[validators.MaxValueValidator(90)]
+            )
+
+        deserializer = UserDeserializer(data_dict={'age': 'zz'})
+        with assert_raises(decimal.InvalidOperation):
+            deserializer.is_valid()
+
+
+class TestDeserializationWithMany:
+
+    def setup(self):
+        class UserDeserializer(Serializer):
+            email = fields.CharField(
+                validators=[validators.RequiredValidator()]
+            )
+            age = fields.IntegerField()
+
+        class CommentDeserializer(Serializer):
+            user = UserDeserializer()
+            content = fields.CharField()
+
+        self.UserDeserializer = UserDeserializer
+        self.CommentDeserializer = CommentDeserializer
+
+    def test_deserialization(self):
+        input_data = [
+            {'email': 'foo@example.com', 'age': '20'},
+            {'email': 'bar@example.com', 'age': 30},
+        ]
+        deserializer = self.UserDeserializer(data_dict=input_data, many=True)
+        assert_true(deserializer.is_valid())
+        assert_equal(
+            [(obj.email, obj.age) for obj in deserializer.object],
+            [('foo@example.com', 20), ('bar@example.com', 30)]
+        )
+
+    def test_errors_by_index(self):
+        input_data = [
+            {'email': 'foo@example.com', 'age': 20},
+            {'age': 30},
+            'foo',
+        ]
+        deserializer = self.UserDeserializer(data_dict=input_data, many=True)
+        assert_false(deserializer.is_valid())
+        assert_equal(sorted(deserializer.errors.keys()), [1, 2])
+        assert_true('email' in deserializer.errors[1])
+        assert_true('non_field_errors' in deserializer.errors[2])
+        assert_equal(deserializer.object, None)
+
+    def test_nested_deserialization(self):
+        input_data = [
+            {'user': {'email': 'foo@example.com', 'age': 20},
+             'content': 'foo'},
+            {'user': {'email': 'bar@example.com', 'age': 30},
+             'content': 'bar'},
+        ]
+        objects = self.CommentDeserializer(
+            data_dict=input_data,
+            many=True
+        ).object
+        assert_equal(
+            [(obj.content, obj.user.email) for obj in objects],
+            [('foo', 'foo@example.com'), ('bar', 'bar@example.com')]
+        )
+
+    def test_errors_match_single_deserialization(self):
+        class UserDeserializer(Serializer):
+            email = fields.CharField(
+                validators=[validators.RequiredValidator()],
+                error_messages={'required': 'Email is required.'}
+            )
+            age = fields.IntegerField(
+                validators=[validators.MinValueValidator(18)]
+            )
+
+        input_data = [
+            {'email': 'foo@example.com', 'age': 20},
+            {'age': 10},
+            {'email': 'bar@example.com', 'age': '20.5'},
+        ]
+        deserializer = UserDeserializer(data_dict=input_data, many=True)
+        for index, data in enumerate(input_data):
+            single = UserDeserializer(data_dict=data)
+            assert_equal(
+                deserializer.errors.get(index, {}),
+                single.errors
+            )
+
+    def test_empty_list(self):
+        deserializer = self.UserDeserializer(data_dict=[], many=True)
+        assert_true(deserializer.is_valid())
+        assert_equal(deserializer.object, [])
+
+    def test_data_dict_should_be_a_list(self):
+        with assert_raises(ValueError):
+            self.UserDeserializer(data_dict={'age': 20}, many=True)
+
+
+class TestDeserializationWithTarget:
+
+    def setup(self):
+        class UserDeserializer(Serializer):
+            email = fields.CharField()
+            age = fields.IntegerField()
+
+        class CommentDeserializer(Serializer):
+            user = UserDeserializer()
+            content = fields.CharField()
+
+        self.UserDeserializer = UserDeserializer
+        self.CommentDeserializer = CommentDeserializer
+        self.input_data = {
+            'user': {'email': 'foo@example.com', 'age': '20'},
+            'content': 'foo bar'
+        }
+
+    def test_dict_target(self):
+        obj = self.CommentDeserializer(
+            data_dict=self.input_data,
+            target=dict
+        ).object
+        assert_equal(obj, {
+            'user': {'email': 'foo@example.com', 'age': 20},
+            'content': 'foo bar'
+        })
+
+    def test_slots_target(self):
+        obj = self.CommentDeserializer(
+            data_dict=self.input_data,
+            target='slots'
+        ).object
+        assert_equal(obj.content, 'foo bar')
+        assert_equal(obj.user.age, 20)
+        assert_false(hasattr(obj, '__dict__'))
+        assert_false(isinstance(obj.user, Serializer))
+        assert_equal(type(obj).__slots__, ('user', 'content'))
+
+    def test_slots_class_is_cached(self):
+        first = self.CommentDeserializer(
+            data_dict=self.input_data,
+            target='slots'
+        ).object
+        second = self.CommentDeserializer(
+            data_dict=self.input_data,
+            target='slots'
+        ).object
+        assert_true(type(first) is type(second))
+        assert_equal(first, second)
+
+    def test_meta_target(self):
+        User = namedtuple('User', ['email', 'age'])
+
+        class UserDeserializer(Serializer):
+            email = fields.CharField()
+            age = fields.IntegerField()
+
+            class Meta:
+                target = User
+
+        obj = UserDeserializer(data_dict=self.input_data['user']).object
+        assert_equal(obj, User('foo@example.com', 20))
+
+    def test_nested_serializer_with_own_target(self):
+        User = namedtuple('User', ['email', 'age'])
+
+        class CommentDeserializer(Serializer):
+            user = self.UserDeserializer(target=User)
+            content = fields.CharField()
+
+        obj = CommentDeserializer(
+            data_dict=self.input_data,
+            target=dict
+        ).object
+        assert_equal(obj['user'], User('foo@example.com', 20))
+
+    def test_nested_serializer_is_copied_for_class_target(self):
+        Comment = namedtuple('Comment', ['user', 'content'])
+        obj = self.CommentDeserializer(
+            data_dict=self.input_data,
+            target=Comment
+        ).object
+        assert_equal(obj.content, 'foo bar')
+        assert_true(isinstance(obj.user, self.UserDeserializer))
+        assert_equal(obj.user.age, 20)
+
+    def test_many(self):
+        objects = self.UserDeserializer(
+            data_dict=[
+                {'email': 'foo@example.com', 'age': 20},
+                {'email': 'bar@example.com', 'age': 30},
+            ],
+            many=True,
+            target=dict
+        ).object
+        assert_equal(objects, [
+            {'email': 'foo@example.com', 'age': 20},
+            {'email': 'bar@example.com', 'age': 30},
+        ])
@@ -1,9 +1,11 @@
 from nose.tools import *  # flake8: noqa
 from mock import *  # flake8: noqa
 
+import six
 import uuid
 import decimal
 import json
+import time
 from datetime import datetime, date
 from collections import OrderedDict
 
@@ -1043,3 +1045,294 @@ if Enum:
             assert_equal(self.field.to_python('pending'), self.Status.PENDING)
             with assert_raises(ValueError):
                 self.field.to_python('invalid')
+
+
+class TestConcurrentMethodFieldSerializer:
+
+    def setup(self):
+        class Profile(object):
+            def __init__(self, index):
+                self.index = index
+
+        class ProfileSerializer(Serializer):
+            index = fields.IntegerField()
+            avatar = fields.MethodField(
+                method_name='get_avatar',
+                concurrent=True,
+                max_workers=4,
+                timeout=0.2,
+                fallback='default.png'
+            )
+
+            def get_avatar(self, obj):
+                if obj.index == 3:
+                    time.sleep(0.5)
+                return 'avatar_%d.png' % obj.index
+
+        class UserSerializer(Serializer):
+            username = fields.CharField()
+            profiles = ProfileSerializer(many=True)
+
+        class User(object):
+            def __init__(self, username, profiles):
+                self.username = username
+                self.profiles = profiles
+
+        self.profiles = [Profile(index) for index in range(6)]
+        self.expected = [
+            {'index': 0, 'avatar': 'avatar_0.png'},
+            {'index': 1, 'avatar': 'avatar_1.png'},
+            {'index': 2, 'avatar': 'avatar_2.png'},
+            {'index': 3, 'avatar': 'default.png'},
+            {'index': 4, 'avatar': 'avatar_4.png'},
+            {'index': 5, 'avatar': 'avatar_5.png'},
+        ]
+        self.ProfileSerializer = ProfileSerializer
+        self.UserSerializer = UserSerializer
+        self.User = User
+
+    def test_many(self):
+        serializer = self.ProfileSerializer(self.profiles, many=True)
+        assert_equal(
+            json.loads(json.dumps(serializer.data)),
+            self.expected
+        )
+
+    def test_single_object(self):
+        serializer = self.ProfileSerializer(self.profiles[1])
+        assert_equal(serializer.data['avatar'], 'avatar_1.png')
+
+    def test_to_json(self):
+        serializer = self.ProfileSerializer(self.profiles, many=True)
+        assert_equal(
+            json.loads(serializer.to_json(self.profiles)),
+            self.expected
+        )
+
+    def test_columnar(self):
+        serializer = self.ProfileSerializer(
+            self.profiles,
+            many=True,
+            columnar=True
+        )
+        assert_equal(
+            json.loads(json.dumps(serializer.data)),
+            self.expected
+        )
+
+    def test_nested_many(self):
+        user = self.User('foobar', self.profiles)
+        serializer = self.UserSerializer(user)
+        assert_equal(
+            json.loads(json.dumps(serializer.data['profiles'])),
+            self.expected
+        )
+
+    def test_exception_is_raised(self):
+        class ProfileSerializer(self.ProfileSerializer):
+            def get_avatar(self, obj):
+                raise KeyError(obj.index)
+
+        serializer = ProfileSerializer(self.profiles, many=True)
+        with assert_raises(KeyError):
+            serializer.data
+
+
+class TestBatchMethodFieldSerializer:
+
+    def setup(self):
+        calls = []
+
+        class Slot(object):
+            def __init__(self, provider_id):
+                self.provider_id = provider_id
+
+        class ProviderSerializer(Serializer):
+            id = fields.IntegerField()
+            next_slot = fields.MethodField(
+                batch_method_name='get_next_slots'
+            )
+            rating = fields.MethodField(batch_method_name='get_ratings')
+
+            def get_next_slots(self, objs):
+                calls.append([obj.id for obj in objs])
+                return ['slot %d' % obj.id for obj in objs]
+
+            def get_ratings(self, objs):
+                return dict((obj, obj.id * 10) for obj in objs)
+
+        class PracticeSerializer(Serializer):
+            name = fields.CharField()
+            providers = ProviderSerializer(many=True)
+            head = ProviderSerializer()
+
+        class RegionSerializer(Serializer):
+            practices = PracticeSerializer(many=True)
+
+        class Provider(object):
+            def __init__(self, id):
+                self.id = id
+
+        class Practice(object):
+            def __init__(self, name, providers, head=None):
+                self.name = name
+                self.providers = providers
+                self.head = head
+
+        self.calls = calls
+        self.Provider = Provider
+        self.Practice = Practice
+        self.ProviderSerializer = ProviderSerializer
+        self.PracticeSerializer = PracticeSerializer
+        self.RegionSerializer = RegionSerializer
+
+    def provider_output(self, id):
+        return {'id': id, 'next_slot': 'slot %d' % id, 'rating': id * 10}
+
+    def test_many(self):
+        providers = [self.Provider(id) for id in range(3)]
+        serializer = self.ProviderSerializer(providers, many=True)
+        assert_equal(
+            json.loads(json.dumps(serializer.data)),
+            [self.provider_output(id) for id in range(3)]
+        )
+        assert_equal(self.calls, [[0, 1, 2]])
+
+    def test_single_object(self):
+        serializer = self.ProviderSerializer(self.Provider(4))
+        assert_equal(
+            json.loads(json.dumps(serializer.data)),
+            self.provider_output(4)
+        )
+        assert_equal(self.calls, [[4]])
+
+    def test_to_json(self):
+        providers = [self.Provider(id) for id in range(3)]
+        serializer = self.ProviderSerializer(many=True)
+        assert_equal(
+            json.loads(serializer.to_json(providers)),
+            [self.provider_output(id) for id in range(3)]
+        )
+        assert_equal(self.calls, [[0, 1, 2]])
+
+    def test_columnar(self):
+        providers = [self.Provider(id) for id in range(3)]
+        serializer = self.ProviderSerializer(
+            providers,
+            many=True,
+            columnar=True
+        )
+        assert_equal(
+            json.loads(json.dumps(serializer.data)),
+            [self.provider_output(id) for id in range(3)]
+        )
+        assert_equal(self.calls, [[0, 1, 2]])
+
+    def test_many_with_iterable(self):
+        providers = (self.Provider(id) for id in range(3))
+        serializer = self.ProviderSerializer(providers, many=True)
+        assert_equal(
+            json.loads(json.dumps(serializer.data)),
+            [self.provider_output(id) for id in range(3)]
+        )
+        assert_equal(self.calls, [[0, 1, 2]])
+
+    def test_nested_serializers_with_iterable(self):
+        practices = iter([
+            self.Practice('First', [self.Provider(1), self.Provider(2)]),
+            self.Practice('Second', [self.Provider(3)]),
+        ])
+        self.PracticeSerializer(practices, many=True).data
+        assert_equal(self.calls, [[1, 2, 3]])
+
+    def test_iter_data_batches_in_chunks(self):
+        class ProviderSerializer(self.ProviderSerializer):
+            batch_chunk_size = 2
+
+        providers = (self.Provider(id) for id in range(5))
+        serializer = ProviderSerializer(providers, many=True)
+        assert_equal(
+            json.loads(json.dumps(list(serializer.iter_data()))),
+            [self.provider_output(id) for id in range(5)]
+        )
+        assert_equal(self.calls, [[0, 1], [2, 3], [4]])
+
+    def test_dump_json_iter_batches_in_chunks(self):
+        providers = (self.Provider(id) for id in range(3))
+        serializer = self.ProviderSerializer(providers, many=True)
+        assert_equal(
+            json.loads(''.join(serializer.dump_json_iter())),
+            [self.provider_output(id) for id in range(3)]
+        )
+        assert_equal(self.calls, [[0, 1, 2]])
+
+    def test_dump_jsonl_batches_in_chunks(self):
+        providers = (self.Provider(id) for id in range(3))
+        fp = six.StringIO()
+        self.ProviderSerializer.dump_jsonl(providers, fp)
+        assert_equal(
+            [json.loads(line) for line in fp.getvalue().splitlines()],
+            [self.provider_output(id) for id in range(3)]
+        )
+        assert_equal(self.calls, [[0, 1, 2]])
+
+    def test_nested_serializers_batch_across_parents(self):
+        practices = [
+            self.Practice(
+                'First',
+                [self.Provider(1), self.Provider(2)],
+                self.Provider(1)
+            ),
+            self.Practice('Second', [], None),
+            self.Practice('Third', [self.Provider(3)], self.Provider(3)),
+        ]
+        serializer = self.PracticeSerializer(practices, many=True)
+        output = json.loads(json.dumps(serializer.data))
+        assert_equal(output, [
+            {
+                'name': 'First',
+                'providers': [
+                    self.provider_output(1),
+                    self.provider_output(2),
+                ],
+                'head': self.provider_output(1),
+            },
+            {
+                'name': 'Second',
+                'providers': [],
+                'head': None,
+            },
+            {
+                'name': 'Third',
+                'providers': [self.provider_output(3)],
+                'head': self.provider_output(3),
+            },
+        ])
+        # One call per nested field, for all the practices
+        assert_equal(sorted(self.calls), [[1, 2, 3], [1, 3]])
+
+    def test_nested_serializers_batch_across_levels(self):
+        regions = [
+            Mock(practices=[
+                self.Practice('First', [self.Provider(1)], self.Provider(1)),
+            ]),
+            Mock(practices=[
+                self.Practice('Second', [self.Provider(2)], self.Provider(2)),
+            ]),
+        ]
+        serializer = self.RegionSerializer(regions, many=True)
+        output = json.loads(json.dumps(serializer.data))
+        assert_equal(
+            [region['practices'][0]['name'] for region in output],
+            ['First', 'Second']
+        )
+        assert_equal(sorted(self.calls), [[1, 2], [1, 2]])
+
+    def test_batch_method_must_return_a_value_per_object(self):
+        class ProviderSerializer(self.ProviderSerializer):
+            def get_next_slots(self, objs):
+                return []
+
+        serializer = ProviderSerializer([self.Provider(1)], many=True)
+        with assert_raises(ValueError):
+            serializer.data
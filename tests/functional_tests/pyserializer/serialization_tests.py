@@ -2,10 +2,24 @@ from nose.tools import *  # flake8: noqa
 from mock import *  # flake8: noqa
 
 from datetime import date, datetime
+import decimal
 import json
+import threading
+import uuid
+
+import six
+
+# Only test the NumPy export when NumPy is installed
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from pyserializer.serializers import Serializer
+from pyserializer import arrays
+from pyserializer import dateparse
 from pyserializer import fields
+from pyserializer import utils
 
 
 class TestSimpleSerialization:
@@ -379,3 +393,774 @@ class TestSerializationWithAllowBlankSourceAndManyTrue:
         }
         serialized_json = json.loads(json.dumps(serializer.data))
         assert_equal(serialized_json, expected_output)
+
+
+class TestSerializationFromMultipleThreads:
+
+    def setup(self):
+        class UserSerializer(Serializer):
+            username = fields.CharField()
+            greeting = fields.MethodField(method_name='get_greeting')
+
+            def __init__(self, *args, **kwargs):
+                self.salutation = kwargs.pop('salutation')
+                super(UserSerializer, self).__init__(*args, **kwargs)
+
+            def get_greeting(self, obj):
+                return '{0} {1}'.format(self.salutation, obj.username)
+
+        class User:
+            def __init__(self, username):
+                self.username = username
+
+        self.UserSerializer = UserSerializer
+        self.User = User
+
+    def test_serialization_from_multiple_threads(self):
+        users = [self.User(username='foo_%d' % i) for i in range(200)]
+        results = {}
+
+        def serialize(salutation):
+            serializer = self.UserSerializer(
+                users,
+                many=True,
+                salutation=salutation
+            )
+            results[salutation] = serializer.data
+
+        threads = [
+            threading.Thread(target=serialize, args=('hello_%d' % i,))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for salutation, data in results.items():
+            assert_equal(
+                [row['greeting'] for row in data],
+                ['{0} foo_{1}'.format(salutation, i) for i in range(200)]
+            )
+        field = self.UserSerializer.base_fields['greeting']
+        assert_equal(field.parent, None)
+
+
+class TestSerializationWithIterData:
+
+    def setup(self):
+        class UserSerializer(Serializer):
+            email = fields.CharField()
+            username = fields.CharField()
+
+        class User:
+            def __init__(self, email, username):
+                self.email = email
+                self.username = username
+
+        self.UserSerializer = UserSerializer
+        self.User = User
+
+    def users(self):
+        for i in range(3):
+            yield self.User(
+                email='foo_%d@bar.com' % i,
+                username='foo_%d' % i
+            )
+
+    def test_iter_data_with_generator(self):
+        serializer = self.UserSerializer(self.users(), many=True)
+        rows = serializer.iter_data()
+        assert_equal(
+            next(rows),
+            {'email': 'foo_0@bar.com', 'username': 'foo_0'}
+        )
+        assert_equal(len(list(rows)), 2)
+
+    def test_data_with_generator(self):
+        serializer = self.UserSerializer(self.users(), many=True)
+        assert_equal(
+            [row['username'] for row in serializer.data],
+            ['foo_0', 'foo_1', 'foo_2']
+        )
+
+    def test_iter_data_without_many(self):
+        serializer = self.UserSerializer(self.User('foo@bar.com', 'foo'))
+        with assert_raises(ValueError):
+            serializer.iter_data()
+
+
+class TestSerializationToJson:
+
+    def setup(self):
+        class LocationSerializer(Serializer):
+            street = fields.CharField()
+            state = fields.CharField()
+
+        class CommentSerializer(Serializer):
+            content = fields.CharField()
+            rating = fields.IntegerField()
+            tags = fields.RawField()
+            created_time = fields.DateTimeField()
+            location = LocationSerializer(source='user.location')
+            locations = LocationSerializer(many=True)
+
+        class Location:
+            def __init__(self, street='Street "123"', state='LA'):
+                self.street = street
+                self.state = state
+
+        class User:
+            def __init__(self, location):
+                self.location = location
+
+        class Comment:
+            def __init__(self, i):
+                self.user = User(location=Location())
+                self.content = u'Some text content \u2603 %d' % i
+                self.rating = i
+                self.tags = {'foo': [1, 2, None]}
+                self.created_time = datetime(2015, 1, 1, 10, 30)
+                self.locations = [Location(), Location(state='NY')]
+
+        self.CommentSerializer = CommentSerializer
+        self.Comment = Comment
+
+    def test_to_json(self):
+        serializer = self.CommentSerializer(self.Comment(1))
+        assert_equal(
+            serializer.to_json(serializer.instance),
+            json.dumps(serializer.data)
+        )
+
+    def test_dump_json_iter_with_many_true(self):
+        comments = [self.Comment(i) for i in range(50)]
+        serializer = self.CommentSerializer(comments, many=True)
+        chunks = list(serializer.dump_json_iter(chunk_size=1024))
+        assert_true(len(chunks) > 1)
+        assert_equal(''.join(chunks), json.dumps(serializer.data))
+
+    def test_write_json_with_generator(self):
+        comments = (self.Comment(i) for i in range(3))
+        serializer = self.CommentSerializer(comments, many=True)
+        fp = six.StringIO()
+        serializer.write_json(fp)
+        output = json.loads(fp.getvalue())
+        assert_equal(len(output), 3)
+        assert_equal(
+            output[2]['location'],
+            {'street': 'Street "123"', 'state': 'LA'}
+        )
+
+    def test_write_json_with_empty_list(self):
+        serializer = self.CommentSerializer([], many=True)
+        fp = six.StringIO()
+        serializer.write_json(fp)
+        assert_equal(fp.getvalue(), '[]')
+
+    def test_to_json_with_tuple_output_types(self):
+        comments = [self.Comment(i) for i in range(3)]
+        for output_type in ('tuple', 'namedtuple'):
+            serializer = self.CommentSerializer(
+                comments,
+                many=True,
+                output_type=output_type
+            )
+            output = json.dumps(serializer.data)
+            assert_true(output.startswith('[['))
+            assert_equal(serializer.to_json(comments), output)
+            assert_equal(''.join(serializer.dump_json_iter()), output)
+
+
+class TestSerializationToJsonLines:
+
+    def setup(self):
+        class UserSerializer(Serializer):
+            email = fields.CharField()
+            username = fields.CharField()
+
+        class User:
+            def __init__(self, email, username):
+                self.email = email
+                self.username = username
+
+        self.UserSerializer = UserSerializer
+        self.users = (
+            User(email='foo_%d@bar.com' % i, username='foo\n%d' % i)
+            for i in range(5)
+        )
+
+    def test_dump_jsonl(self):
+        fp = Mock()
+        self.UserSerializer.dump_jsonl(self.users, fp, buffer_size=2)
+        assert_equal(fp.write.call_count, 3)
+        output = ''.join(call[0][0] for call in fp.write.call_args_list)
+        lines = output.splitlines()
+        assert_equal(len(lines), 5)
+        assert_equal(
+            json.loads(lines[4]),
+            {'email': 'foo_4@bar.com', 'username': 'foo\n4'}
+        )
+
+
+class TestSerializationWithMetaOutputType:
+
+    def setup(self):
+        class LocationSerializer(Serializer):
+            street = fields.CharField()
+            state = fields.CharField()
+
+        class UserSerializer(Serializer):
+            username = fields.CharField()
+            location = LocationSerializer()
+
+            class Meta:
+                output_type = 'tuple'
+
+        class Location:
+            def __init__(self, street='Street 123', state='LA'):
+                self.street = street
+                self.state = state
+
+        class User:
+            def __init__(self, username='foobar'):
+                self.username = username
+                self.location = Location()
+
+        self.UserSerializer = UserSerializer
+        self.User = User
+
+    def test_serialization_with_meta_output_type(self):
+        serializer = self.UserSerializer([self.User()], many=True)
+        assert_equal(
+            serializer.data,
+            [('foobar', {'street': 'Street 123', 'state': 'LA'})]
+        )
+
+
+class TestSerializationFields:
+
+    def setup(self):
+        class UserSerializer(Serializer):
+            email = fields.CharField()
+            username = fields.CharField()
+
+            class Meta:
+                exclude = (
+                    'username',
+                )
+
+        class ExtraUserSerializer(UserSerializer):
+
+            def get_fields(self):
+                fields = super(ExtraUserSerializer, self).get_fields()
+                fields['username'] = self.base_fields['username']
+                return fields
+
+        class User:
+            def __init__(self,
+                         email='foo@example.com',
+                         username='foobar'):
+                self.email = email
+                self.username = username
+
+        self.User = User
+        self.UserSerializer = UserSerializer
+        self.ExtraUserSerializer = ExtraUserSerializer
+
+    def test_class_fields_are_shared(self):
+        assert_true(
+            self.UserSerializer.get_class_fields() is
+            self.UserSerializer.get_class_fields()
+        )
+        assert_equal(
+            list(self.UserSerializer.get_class_fields().keys()),
+            ['email']
+        )
+
+    def test_modifying_fields_of_an_instance(self):
+        serializer = self.UserSerializer(self.User())
+        serializer.fields['username'] = fields.CharField()
+        assert_equal(
+            serializer.data,
+            {'email': 'foo@example.com', 'username': 'foobar'}
+        )
+        assert_equal(
+            self.UserSerializer(self.User()).data,
+            {'email': 'foo@example.com'}
+        )
+
+    def test_fields_view_sees_modifications(self):
+        serializer = self.UserSerializer(self.User())
+        view = serializer.fields
+        serializer.fields['username'] = fields.CharField()
+        assert_equal(list(view.keys()), ['email', 'username'])
+        del view['username']
+        assert_equal(serializer.data, {'email': 'foo@example.com'})
+        assert_equal(
+            list(self.UserSerializer.get_class_fields().keys()),
+            ['email']
+        )
+
+    def test_overriding_get_fields(self):
+        serializer = self.ExtraUserSerializer(self.User())
+        assert_equal(
+            serializer.data,
+            {'email': 'foo@example.com', 'username': 'foobar'}
+        )
+
+
+class TestColumnarSerialization:
+
+    def setup(self):
+        class LocationSerializer(Serializer):
+            state = fields.CharField()
+
+        class AppointmentSerializer(Serializer):
+            id = fields.UUIDField()
+            starts_at = fields.DateTimeField(format='%Y-%m-%d %H:%M')
+            day = fields.DateField(source='starts_at')
+            price = fields.NumberField()
+            label = fields.MethodField(method_name='get_label')
+            location = LocationSerializer()
+
+            def get_label(self, obj):
+                return 'Appointment %s' % obj.price
+
+        self.AppointmentSerializer = AppointmentSerializer
+        self.appointments = [
+            Mock(
+                id=uuid.UUID(int=i),
+                starts_at=datetime(2015, 1, 1 + i, 10, 30),
+                price=10 * i,
+                location=Mock(state='LA')
+            )
+            for i in range(3)
+        ]
+
+    def test_to_columns(self):
+        serializer = self.AppointmentSerializer(self.appointments, many=True)
+        columns = serializer.to_columns()
+        assert_equal(
+            list(columns.keys()),
+            ['id', 'starts_at', 'day', 'price', 'label', 'location']
+        )
+        assert_equal(columns['id'][1], '00000000-0000-0000-0000-000000000001')
+        assert_equal(
+            columns['starts_at'],
+            ['2015-01-01 10:30', '2015-01-02 10:30', '2015-01-03 10:30']
+        )
+        assert_equal(
+            columns['day'],
+            ['2015-01-01', '2015-01-02', '2015-01-03']
+        )
+        assert_equal(columns['price'], [0, 10, 20])
+        assert_equal(columns['label'][2], 'Appointment 20')
+        assert_equal(columns['location'][0], {'state': 'LA'})
+
+    def test_to_columns_with_objects(self):
+        columns = self.AppointmentSerializer().to_columns(
+            iter(self.appointments[:1])
+        )
+        assert_equal(columns['price'], [0])
+
+    def test_to_columns_without_many(self):
+        with assert_raises(ValueError):
+            self.AppointmentSerializer(self.appointments).to_columns()
+
+    def test_columnar_data_matches_data(self):
+        for output_type in ('dict', 'ordered_dict', 'tuple', 'namedtuple'):
+            data = self.AppointmentSerializer(
+                self.appointments,
+                many=True,
+                output_type=output_type
+            ).data
+            columnar_data = self.AppointmentSerializer(
+                iter(self.appointments),
+                many=True,
+                output_type=output_type,
+                columnar=True
+            ).data
+            assert_equal(columnar_data, data)
+
+    def test_columnar_data_with_none(self):
+        class PriceSerializer(Serializer):
+            price = fields.NumberField()
+            starts_at = fields.DateTimeField()
+
+        objs = [self.appointments[1], None]
+        data = PriceSerializer(objs, many=True).data
+        columnar_data = PriceSerializer(objs, many=True, columnar=True).data
+        assert_equal(columnar_data, data)
+        assert_equal(columnar_data[1], {'price': '', 'starts_at': ''})
+
+
+class TestSerializationToNumpyWithoutNumpy:
+
+    def test_to_numpy_requires_numpy(self):
+        class PriceSerializer(Serializer):
+            price = fields.FloatField()
+
+        with patch.object(arrays, 'numpy', None):
+            with assert_raises(ImportError):
+                PriceSerializer([], many=True).to_numpy()
+
+
+if numpy:
+    class TestSerializationToNumpy:
+
+        def setup(self):
+            class AppointmentSerializer(Serializer):
+                id = fields.IntegerField()
+                price = fields.DecimalField()
+                rating = fields.FloatField()
+                paid = fields.BooleanField()
+                starts_at = fields.DateTimeField()
+                day = fields.DateField(source='starts_at')
+                title = fields.CharField()
+                label = fields.MethodField(method_name='get_label')
+
+                def get_label(self, obj):
+                    return 'Appointment %s' % obj.id
+
+            self.AppointmentSerializer = AppointmentSerializer
+            self.appointments = [
+                Mock(
+                    id=i,
+                    price=decimal.Decimal('10.5'),
+                    rating=None,
+                    paid=bool(i),
+                    starts_at=datetime(2015, 1, 1 + i, 10, 30),
+                    title='foo'
+                )
+                for i in range(3)
+            ]
+
+        def test_get_numpy_dtype(self):
+            dtype = self.AppointmentSerializer().get_numpy_dtype()
+            assert_equal(
+                [dtype[name].str[1:] for name in dtype.names],
+                ['i8', 'f8', 'f8', 'b1', 'M8[us]', 'M8[D]', 'O', 'O']
+            )
+
+        def test_to_numpy(self):
+            array = self.AppointmentSerializer(
+                self.appointments,
+                many=True
+            ).to_numpy()
+            assert_equal(array.shape, (3,))
+            assert_equal(list(array['id']), [0, 1, 2])
+            assert_equal(array['price'][0], 10.5)
+            assert_true(numpy.isnan(array['rating'][0]))
+            assert_equal(list(array['paid']), [False, True, True])
+            assert_equal(
+                array['starts_at'][1],
+                numpy.datetime64('2015-01-02T10:30')
+            )
+            assert_equal(array['day'][2], numpy.datetime64('2015-01-03'))
+            assert_equal(array['title'][0], 'foo')
+            assert_equal(array['label'][1], 'Appointment 1')
+
+        def test_to_numpy_with_aware_datetime(self):
+            class EventSerializer(Serializer):
+                starts_at = fields.DateTimeField()
+
+            tz = dateparse.get_fixed_timezone(60)
+            array = EventSerializer().to_numpy([
+                Mock(starts_at=datetime(2015, 1, 1, 10, 30, tzinfo=tz))
+            ])
+            assert_equal(
+                array['starts_at'][0],
+                numpy.datetime64('2015-01-01T09:30')
+            )
+
+        def test_to_numpy_with_nested_many(self):
+            class TagSerializer(Serializer):
+                title = fields.CharField()
+
+            class PostSerializer(Serializer):
+                tags = TagSerializer(many=True)
+
+            array = PostSerializer().to_numpy([
+                Mock(tags=[Mock(title='foo'), Mock(title='bar')])
+            ])
+            assert_equal(
+                array['tags'][0],
+                [{'title': 'foo'}, {'title': 'bar'}]
+            )
+
+        def test_to_numpy_with_nullable_integer_and_bool(self):
+            for appointment in self.appointments:
+                appointment.paid = True
+            self.appointments[1].id = None
+            self.appointments[2].paid = None
+            array = self.AppointmentSerializer().to_numpy(self.appointments)
+            assert_equal(array.dtype['id'].kind, 'O')
+            assert_equal(list(array['id']), [0, None, 2])
+            assert_equal(array.dtype['paid'].kind, 'O')
+            assert_equal(list(array['paid']), [True, True, None])
+
+        def test_to_numpy_with_none_object(self):
+            class AppointmentSerializer(Serializer):
+                id = fields.IntegerField()
+                price = fields.DecimalField()
+                paid = fields.BooleanField()
+                starts_at = fields.DateTimeField()
+
+            array = AppointmentSerializer().to_numpy([None])
+            assert_equal(array['id'][0], None)
+            assert_equal(array['paid'][0], None)
+            assert_true(numpy.isnan(array['price'][0]))
+            assert_true(numpy.isnat(array['starts_at'][0]))
+
+
+# The serializers and objects of the parallel tests must be defined at the
+# module level to be picklable
+class ParallelUserSerializer(Serializer):
+    email = fields.CharField()
+    username = fields.CharField()
+    created_at = fields.DateField(format='%Y-%m-%d')
+
+
+class ParallelUser(object):
+
+    def __init__(self, index):
+        self.email = 'user%d@example.com' % index
+        self.username = 'user%d' % index
+        self.created_at = date(2015, 1, 1 + index % 28)
+
+
+class TestParallelSerialization:
+
+    def setup(self):
+        self.users = [ParallelUser(index) for index in range(25)]
+        self.expected = ParallelUserSerializer(self.users, many=True).data
+
+    def test_data_is_in_order(self):
+        serializer = ParallelUserSerializer(self.users, many=True, parallel=2)
+        serializer.parallel_chunk_size = 4
+        assert_equal(serializer.data, self.expected)
+
+    def test_iter_data_with_generator(self):
+        serializer = ParallelUserSerializer(
+            (user for user in self.users),
+            many=True,
+            parallel=2
+        )
+        serializer.parallel_chunk_size = 3
+        assert_equal(list(serializer.iter_data()), self.expected)
+
+    def test_executor(self):
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            serializer = ParallelUserSerializer(
+                self.users,
+                many=True,
+                executor=executor
+            )
+            serializer.parallel_chunk_size = 5
+            assert_equal(serializer.data, self.expected)
+
+    def test_namedtuple_output_type(self):
+        serializer = ParallelUserSerializer(
+            self.users,
+            many=True,
+            parallel=2,
+            output_type='namedtuple'
+        )
+        serializer.parallel_chunk_size = 10
+        output = serializer.data
+        assert_equal(len(output), 25)
+        assert_equal(output[3].username, 'user3')
+        assert_equal(type(output[3]), serializer.plan.row_class)
+
+    def test_serializer_must_be_picklable(self):
+        class UserSerializer(Serializer):
+            email = fields.CharField()
+
+        serializer = UserSerializer(self.users, many=True, parallel=2)
+        with assert_raises(ValueError):
+            serializer.data
+
+    def test_objects_must_be_picklable(self):
+        users = [Mock(email='foo@example.com')]
+        serializer = ParallelUserSerializer(users, many=True, parallel=2)
+        with assert_raises(ValueError):
+            serializer.data
+
+    def test_parallel_without_many(self):
+        serializer = ParallelUserSerializer(self.users[0], parallel=2)
+        assert_equal(serializer.data, self.expected[0])
+
+
+class TestSerializerSourcePaths:
+
+    def setup(self):
+        class ProviderSerializer(Serializer):
+            name = fields.CharField(source='profile.name')
+            npi = fields.CharField(source='profile.npi')
+            next_slot = fields.MethodField(method_name='get_next_slot')
+
+            def get_next_slot(self, obj):
+                return None
+
+        class PracticeSerializer(Serializer):
+            name = fields.CharField()
+            phone = fields.CharField()
+            providers = ProviderSerializer(many=True)
+
+            class Meta:
+                exclude = ('phone',)
+
+        class AppointmentSerializer(Serializer):
+            id = fields.IntegerField()
+            start = fields.DateTimeField()
+            notes = fields.CharField()
+            practice = PracticeSerializer(source='location.practice')
+
+            class Meta:
+                fields = ('id', 'start', 'practice')
+
+        self.AppointmentSerializer = AppointmentSerializer
+
+    def test_get_source_paths(self):
+        assert_equal(self.AppointmentSerializer.get_source_paths(), [
+            'id',
+            'location',
+            'location.practice',
+            'location.practice.name',
+            'location.practice.providers',
+            'location.practice.providers.profile',
+            'location.practice.providers.profile.name',
+            'location.practice.providers.profile.npi',
+            'start',
+        ])
+
+    def test_get_source_paths_with_separator(self):
+        paths = self.AppointmentSerializer.get_source_paths(separator='__')
+        assert_true('location__practice__name' in paths)
+
+    def test_get_related_paths(self):
+        assert_equal(self.AppointmentSerializer.get_related_paths(), [
+            'location',
+            'location.practice',
+            'location.practice.providers',
+            'location.practice.providers.profile',
+        ])
+
+    def test_get_related_paths_without_many(self):
+        assert_equal(
+            self.AppointmentSerializer.get_related_paths(
+                many=False,
+                separator='__'
+            ),
+            ['location', 'location__practice']
+        )
+
+    def test_get_related_paths_with_many(self):
+        assert_equal(
+            self.AppointmentSerializer.get_related_paths(many=True),
+            [
+                'location.practice.providers',
+                'location.practice.providers.profile',
+            ]
+        )
+
+
+class TestSerializationWithMemoize:
+
+    def setup(self):
+        calls = []
+
+        class PracticeSerializer(Serializer):
+            name = fields.CharField()
+            label = fields.MethodField(method_name='get_label')
+
+            def get_label(self, obj):
+                calls.append(obj.name)
+                return obj.name.upper()
+
+        class AppointmentSerializer(Serializer):
+            id = fields.IntegerField()
+            practice = PracticeSerializer()
+            practices = PracticeSerializer(many=True)
+
+        class Practice(object):
+            def __init__(self, name):
+                self.name = name
+
+        class Appointment(object):
+            def __init__(self, id, practice, practices):
+                self.id = id
+                self.practice = practice
+                self.practices = practices
+
+        first = Practice('first')
+        second = Practice('second')
+        self.appointments = [
+            Appointment(id, first if id % 2 else second, [first, second])
+            for id in range(10)
+        ]
+        self.calls = calls
+        self.AppointmentSerializer = AppointmentSerializer
+
+    def test_nested_objects_are_serialized_once(self):
+        serializer = self.AppointmentSerializer(
+            self.appointments,
+            many=True,
+            memoize=True
+        )
+        output = serializer.data
+        assert_equal(sorted(self.calls), ['first', 'second'])
+        assert_equal(
+            output,
+            self.AppointmentSerializer(self.appointments, many=True).data
+        )
+        assert_true(output[1]['practice'] is output[3]['practice'])
+        assert_true(output[1]['practice'] is output[2]['practices'][0])
+
+    def test_copy(self):
+        serializer = self.AppointmentSerializer(
+            self.appointments,
+            many=True,
+            memoize='copy'
+        )
+        output = serializer.data
+        assert_equal(sorted(self.calls), ['first', 'second'])
+        assert_equal(output[1]['practice'], output[3]['practice'])
+        assert_false(output[1]['practice'] is output[3]['practice'])
+
+    def test_memo_is_cleared_after_the_call(self):
+        serializer = self.AppointmentSerializer(many=True, memoize=True)
+        serializer.to_native(self.appointments)
+        serializer.to_native(self.appointments)
+        assert_equal(len(self.calls), 4)
+        assert_equal(utils.get_active_memo(), None)
+
+    def test_to_json(self):
+        serializer = self.AppointmentSerializer(many=True, memoize=True)
+        output = serializer.to_json(self.appointments)
+        assert_equal(sorted(self.calls), ['first', 'second'])
+        assert_equal(
+            json.loads(output),
+            json.loads(json.dumps(
+                self.AppointmentSerializer(self.appointments, many=True).data
+            ))
+        )
+
+    def test_columnar(self):
+        serializer = self.AppointmentSerializer(
+            self.appointments,
+            many=True,
+            columnar=True,
+            memoize=True
+        )
+        serializer.data
+        assert_equal(sorted(self.calls), ['first', 'second'])
+
+    def test_without_memoize(self):
+        self.AppointmentSerializer(self.appointments, many=True).data
+        assert_equal(len(self.calls), 30)
+
+    def test_invalid_memoize(self):
+        with assert_raises(ValueError):
+            self.AppointmentSerializer(memoize='deep')
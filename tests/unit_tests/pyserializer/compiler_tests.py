@@ -0,0 +1,251 @@
+from nose.tools import *  # flake8: noqa
+from mock import *  # flake8: noqa
+
+import threading
+from collections import OrderedDict
+
+from pyserializer.compiler import *  # flake8: noqa
+from pyserializer.serializers import Serializer
+from pyserializer import fields
+
+
+class TestSerializationPlan:
+
+    def setup(self):
+        class UserSerializer(Serializer):
+            email = fields.CharField()
+            username = fields.CharField(source='login')
+
+        self.UserSerializer = UserSerializer
+
+    def test_generate_source(self):
+        plan = SerializationPlan(self.UserSerializer().fields)
+        assert_true("'email': value_0" in plan.source)
+        assert_equal(
+            sorted(accessor.source for accessor in plan.accessors.values()),
+            ['email', 'login']
+        )
+
+    def test_bind(self):
+        serializer = self.UserSerializer()
+        serialize = serializer.plan.bind(serializer)
+        user = Mock(email='foo@example.com', login='foobar')
+        output = serialize(user)
+        assert_equal(
+            output,
+            OrderedDict([('email', 'foo@example.com'), ('username', 'foobar')])
+        )
+
+    def test_bind_with_none(self):
+        serializer = self.UserSerializer()
+        serialize = serializer.plan.bind(serializer)
+        output = serialize(None)
+        assert_equal(output, OrderedDict([('email', ''), ('username', '')]))
+
+    def test_bind_sets_parent_and_field_name(self):
+        class ContextField(fields.CharField):
+            def to_native(self, value):
+                return '%s:%s:%s' % (
+                    type(self.parent).__name__, self.field_name, value)
+
+        class U(Serializer):
+            name = ContextField()
+
+        user = Mock()
+        user.name = 'bob'
+        serializer = U(user)
+        assert_equal(serializer.data, {'name': 'U:name:bob'})
+        assert_equal(serializer.to_json(user), '{"name": "U:name:bob"}')
+        assert_equal(
+            U([user], many=True, columnar=True).data,
+            [{'name': 'U:name:bob'}]
+        )
+        # The fields of the class are not modified
+        assert_equal(U.get_class_fields()['name'].parent, None)
+
+    def test_plan_is_cached_per_class(self):
+        assert_true(self.UserSerializer().plan is self.UserSerializer().plan)
+
+    def test_plan_per_allow_blank_source(self):
+        plan = self.UserSerializer().plan
+        blank_plan = self.UserSerializer(allow_blank_source=True).plan
+        assert_false(plan is blank_plan)
+        assert_true(blank_plan.allow_blank_source)
+
+    def test_plan_of_instance_fields_is_not_cached_per_class(self):
+        class CustomSerializer(self.UserSerializer):
+            def get_fields(self):
+                output = super(CustomSerializer, self).get_fields()
+                output['name'] = fields.CharField()
+                return output
+
+        serializer = CustomSerializer()
+        plan = serializer.plan
+        assert_true(serializer.plan is plan)
+        assert_false(CustomSerializer().plan is plan)
+        assert_equal(CustomSerializer._plans, {})
+
+    def test_plan_of_same_instance_fields_is_shared(self):
+        class CustomSerializer(self.UserSerializer):
+            def get_fields(self):
+                output = super(CustomSerializer, self).get_fields()
+                del output['username']
+                return output
+
+        plan = CustomSerializer().plan
+        assert_true(CustomSerializer().plan is plan)
+        assert_equal(list(plan.fields.keys()), ['email'])
+
+    def test_reading_fields_does_not_copy_them(self):
+        serializer = self.UserSerializer()
+        assert_equal(list(serializer.fields.keys()), ['email', 'username'])
+        assert_true('email' in serializer.fields)
+        assert_true(serializer.plan is self.UserSerializer().plan)
+
+
+class TestSerializationPlanWithSharedSourcePrefix:
+
+    def setup(self):
+        class ProviderSerializer(Serializer):
+            name = fields.CharField(source='provider.profile.name')
+            npi = fields.CharField(source='provider.profile.npi')
+            email = fields.CharField()
+
+        class Profile(object):
+            name = 'John Smith'
+            npi = '1234567890'
+
+        class Provider(object):
+            calls = 0
+
+            @property
+            def profile(self):
+                Provider.calls += 1
+                return Profile()
+
+        self.ProviderSerializer = ProviderSerializer
+        self.Provider = Provider
+
+    def test_shared_prefixes(self):
+        plan = self.ProviderSerializer().plan
+        assert_equal(
+            sorted(plan.prefixes.keys()),
+            [('provider',), ('provider', 'profile')]
+        )
+
+    def test_resolves_shared_prefix_once(self):
+        obj = Mock(provider=self.Provider(), email='foo@example.com')
+        output = self.ProviderSerializer(obj).data
+        assert_equal(output['name'], 'John Smith')
+        assert_equal(output['npi'], '1234567890')
+        assert_equal(self.Provider.calls, 1)
+
+    def test_missing_prefix_with_allow_blank_source(self):
+        obj = Mock(provider=None, email='foo@example.com')
+        output = self.ProviderSerializer(obj, allow_blank_source=True).data
+        assert_equal(output['name'], None)
+        assert_equal(output['npi'], None)
+
+    def test_missing_prefix_without_allow_blank_source(self):
+        obj = Mock(provider=None, email='foo@example.com')
+        with assert_raises(AttributeError):
+            self.ProviderSerializer(obj).data
+
+    def test_generate_source_from_threads(self):
+        plan = self.ProviderSerializer().plan
+        sources = []
+
+        def generate():
+            for i in range(50):
+                sources.append(plan.generate_source(as_json=True))
+
+        threads = [threading.Thread(target=generate) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert_equal(len(sources), 400)
+        assert_equal(len(set(sources)), 1)
+        assert_true('prefix_0 = resolve(' in sources[0])
+
+    def test_to_json_from_threads(self):
+        plan = self.ProviderSerializer().plan
+        obj = Mock(provider=self.Provider(), email='foo@example.com')
+        outputs = []
+        barrier = threading.Event()
+
+        def serialize():
+            barrier.wait()
+            outputs.append(self.ProviderSerializer(obj).to_json(obj))
+
+        threads = [threading.Thread(target=serialize) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        barrier.set()
+        for thread in threads:
+            thread.join()
+        assert_equal(len(outputs), 8)
+        assert_equal(len(set(outputs)), 1)
+        assert_true(plan.json_factory is plan.json_factory)
+
+
+class TestSerializationPlanOutputType:
+
+    def setup(self):
+        class UserSerializer(Serializer):
+            email = fields.CharField()
+            username = fields.CharField()
+
+        self.UserSerializer = UserSerializer
+        self.user = Mock(email='foo@example.com', username='foobar')
+
+    def serialize(self, output_type):
+        serializer = self.UserSerializer(output_type=output_type)
+        return serializer.to_native(self.user)
+
+    def test_dict(self):
+        output = self.serialize('dict')
+        assert_equal(type(output), dict)
+        assert_equal(list(output.keys()), ['email', 'username'])
+
+    def test_ordered_dict(self):
+        output = self.serialize('ordered_dict')
+        assert_equal(type(output), OrderedDict)
+        assert_equal(list(output.keys()), ['email', 'username'])
+
+    def test_tuple(self):
+        output = self.serialize('tuple')
+        assert_equal(output, ('foo@example.com', 'foobar'))
+
+    def test_namedtuple(self):
+        output = self.serialize('namedtuple')
+        assert_equal(output.email, 'foo@example.com')
+        assert_equal(output.username, 'foobar')
+        assert_equal(type(output).__name__, 'UserSerializer')
+
+    def test_invalid_output_type(self):
+        with assert_raises(ValueError):
+            self.serialize('list')
+
+
+class TestIterSourcePaths:
+
+    def setup(self):
+        class ProfileSerializer(Serializer):
+            name = fields.CharField()
+
+        class UserSerializer(Serializer):
+            email = fields.CharField(source='contact.email')
+            profiles = ProfileSerializer(many=True)
+            greeting = fields.MethodField(method_name='get_greeting')
+
+        self.UserSerializer = UserSerializer
+
+    def test_paths(self):
+        paths = list(iter_source_paths(self.UserSerializer().fields))
+        assert_equal(paths, [
+            (('contact',), True, False),
+            (('contact', 'email'), False, False),
+            (('profiles',), True, True),
+            (('profiles', 'name'), False, True),
+        ])
@@ -0,0 +1,126 @@
+from nose.tools import *  # flake8: noqa
+from mock import *  # flake8: noqa
+
+import threading
+import time
+
+from pyserializer import concurrency
+from pyserializer.concurrency import *  # flake8: noqa
+
+
+class TestGetThreadPool:
+
+    def test_shared_per_max_workers(self):
+        assert_true(get_thread_pool(3) is get_thread_pool(3))
+        assert_false(get_thread_pool(3) is get_thread_pool(4))
+
+    def test_default_max_workers(self):
+        assert_true(
+            get_thread_pool() is
+            get_thread_pool(concurrency.DEFAULT_MAX_WORKERS)
+        )
+
+    def test_created_again_after_fork(self):
+        pool = get_thread_pool(3)
+        with patch.object(concurrency.os, 'getpid', return_value=-1):
+            assert_false(get_thread_pool(3) is pool)
+        assert_false(get_thread_pool(3) is pool)
+
+
+class TestCallConcurrently:
+
+    def test_results_in_order(self):
+        def func(value):
+            time.sleep(0.01 * (5 - value))
+            return value * 2
+        output = call_concurrently(func, list(range(5)), max_workers=5)
+        assert_equal(output, [0, 2, 4, 6, 8])
+
+    def test_calls_run_concurrently(self):
+        started = []
+        event = threading.Event()
+
+        def func(value):
+            started.append(value)
+            if len(started) == 2:
+                event.set()
+            return event.wait(5)
+        output = call_concurrently(func, [1, 2], max_workers=2)
+        assert_equal(output, [True, True])
+
+    def test_empty(self):
+        assert_equal(call_concurrently(len, []), [])
+
+    def test_exception_is_raised(self):
+        def func(value):
+            if value == 2:
+                raise KeyError(value)
+            return value
+        with assert_raises(KeyError):
+            call_concurrently(func, [1, 2, 3])
+
+    def test_timeout_returns_fallback(self):
+        def func(value):
+            if value == 2:
+                time.sleep(0.5)
+            return value
+        output = call_concurrently(
+            func,
+            [1, 2, 3],
+            max_workers=3,
+            timeout=0.1,
+            fallback='timeout'
+        )
+        assert_equal(output, [1, 'timeout', 3])
+
+    def test_timeout_includes_queued_calls(self):
+        # The calls queued behind the slow calls time out at the same
+        # deadline, instead of waiting for a thread
+        def func(value):
+            time.sleep(2)
+            return value
+        start = time.time()
+        output = call_concurrently(
+            func,
+            list(range(6)),
+            max_workers=2,
+            timeout=0.2,
+            fallback='timeout'
+        )
+        assert_equal(output, ['timeout'] * 6)
+        assert_true(time.time() - start < 1)
+
+    def test_queued_calls_within_timeout(self):
+        def func(value):
+            time.sleep(0.05)
+            return value
+        output = call_concurrently(
+            func,
+            [1, 2],
+            max_workers=1,
+            timeout=1
+        )
+        assert_equal(output, [1, 2])
+
+    def test_pool_is_discarded_after_timeout(self):
+        event = threading.Event()
+        pool = get_thread_pool(2)
+        output = call_concurrently(
+            event.wait,
+            [5, 5],
+            max_workers=2,
+            timeout=0.1
+        )
+        assert_equal(output, [None, None])
+        new_pool = get_thread_pool(2)
+        assert_false(new_pool is pool)
+        event.set()
+        # The discarded pool still accepts the calls of the threads which
+        # got it before it was discarded
+        assert_equal(pool.submit(abs, -1).result(1), 1)
+        assert_equal(call_concurrently(abs, [-1], max_workers=2), [1])
+
+    def test_pool_is_kept_without_timeout(self):
+        pool = get_thread_pool(2)
+        call_concurrently(abs, [-1, -2], max_workers=2, timeout=1)
+        assert_true(get_thread_pool(2) is pool)
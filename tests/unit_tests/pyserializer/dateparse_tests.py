@@ -0,0 +1,158 @@
+from nose.tools import *  # flake8: noqa
+from mock import *  # flake8: noqa
+
+import pickle
+from datetime import datetime, date, timedelta
+
+from pyserializer import dateparse
+from pyserializer.dateparse import *  # flake8: noqa
+
+
+class TestParseIsoDatetime:
+
+    def assert_parses(self, value, expected, offset=None):
+        for fromisoformat in (dateparse.datetime_fromisoformat, None):
+            with patch.object(dateparse, 'datetime_fromisoformat',
+                              fromisoformat):
+                output = parse_iso_datetime(value)
+            assert_equal(output.replace(tzinfo=None), expected)
+            if offset is None:
+                assert_equal(output.tzinfo, None)
+            else:
+                assert_equal(output.utcoffset(), timedelta(minutes=offset))
+
+    def test_naive(self):
+        self.assert_parses(
+            '2014-01-01T10:30:15',
+            datetime(2014, 1, 1, 10, 30, 15)
+        )
+
+    def test_microseconds(self):
+        self.assert_parses(
+            '2014-01-01T10:30:15.123',
+            datetime(2014, 1, 1, 10, 30, 15, 123000)
+        )
+
+    def test_without_seconds(self):
+        self.assert_parses(
+            '2014-01-01T10:30',
+            datetime(2014, 1, 1, 10, 30)
+        )
+
+    def test_date_only(self):
+        self.assert_parses('2014-01-01', datetime(2014, 1, 1))
+
+    def test_utc(self):
+        self.assert_parses(
+            '2014-01-01T10:30:00Z',
+            datetime(2014, 1, 1, 10, 30),
+            offset=0
+        )
+
+    def test_offset(self):
+        self.assert_parses(
+            '2014-01-01T10:30:00+05:30',
+            datetime(2014, 1, 1, 10, 30),
+            offset=330
+        )
+        self.assert_parses(
+            '2014-01-01T10:30:00-0800',
+            datetime(2014, 1, 1, 10, 30),
+            offset=-480
+        )
+
+    def test_invalid(self):
+        for value in ('2014-01-01T', '2014-13-01T10:30:00', 'foo', ''):
+            with patch.object(dateparse, 'datetime_fromisoformat', None):
+                assert_raises(ValueError, parse_iso_datetime, value)
+            assert_raises(ValueError, parse_iso_datetime, value)
+
+    def test_not_a_string(self):
+        assert_raises(TypeError, parse_iso_datetime, 20140101)
+
+
+class TestParseIsoDate:
+
+    def test_parse(self):
+        for fromisoformat in (dateparse.date_fromisoformat, None):
+            with patch.object(dateparse, 'date_fromisoformat', fromisoformat):
+                assert_equal(parse_iso_date('2014-01-31'), date(2014, 1, 31))
+                assert_raises(ValueError, parse_iso_date, '2014-02-31')
+                assert_raises(ValueError, parse_iso_date, '2014-01-01T10:30')
+
+
+class TestFormat:
+
+    def test_format_iso_datetime(self):
+        value = datetime(2014, 1, 1, 10, 30, tzinfo=get_fixed_timezone(0))
+        assert_equal(format_iso_datetime(value), '2014-01-01T10:30:00Z')
+
+    def test_format_iso_datetime_with_offset(self):
+        value = datetime(2014, 1, 1, 10, 30, tzinfo=get_fixed_timezone(-60))
+        assert_equal(format_iso_datetime(value), '2014-01-01T10:30:00-01:00')
+
+    def test_format_iso_date(self):
+        assert_equal(format_iso_date(date(2014, 1, 1)), '2014-01-01')
+
+
+class TestParseWithFormat:
+
+    def test_parse_datetime(self):
+        assert_equal(
+            parse_datetime('2014-01-01T10:30:00', 'iso-8601'),
+            datetime(2014, 1, 1, 10, 30)
+        )
+        assert_equal(
+            parse_datetime('2014/01/01', '%Y/%m/%d'),
+            datetime(2014, 1, 1)
+        )
+
+    def test_parse_date(self):
+        assert_equal(parse_date('2014-01-01', 'ISO-8601'), date(2014, 1, 1))
+        assert_equal(parse_date('2014/01/01', '%Y/%m/%d'), date(2014, 1, 1))
+
+
+class TestFixedOffset:
+
+    def test_fixed_offset(self):
+        tz = dateparse.FixedOffset(-90)
+        assert_equal(tz.utcoffset(None), timedelta(minutes=-90))
+        assert_equal(tz.tzname(None), 'UTC-01:30')
+
+
+class TestCompileStrftime:
+
+    def setup(self):
+        self.value = datetime(2014, 1, 2, 3, 4, 5, 6)
+
+    def test_compiled_format(self):
+        format = '%Y-%m-%dT%H:%M:%S.%fZ (100%%)'
+        formatter = compile_strftime(format)
+        assert_true(formatter.getter is not None)
+        assert_equal(formatter(self.value), self.value.strftime(format))
+
+    def test_date_only(self):
+        formatter = compile_strftime('%Y-%m-%d %H:%M', date_only=True)
+        assert_equal(formatter(date(2014, 1, 2)), '2014-01-02 00:00')
+
+    def test_date_with_time_directives(self):
+        formatter = compile_strftime('%Y-%m-%d %H:%M')
+        assert_equal(formatter(date(2014, 1, 2)), '2014-01-02 00:00')
+
+    def test_year_below_1000_falls_back_to_strftime(self):
+        value = date(999, 1, 2)
+        formatter = compile_strftime('%Y-%m-%d')
+        assert_equal(formatter(value), value.strftime('%Y-%m-%d'))
+        assert_equal(compile_strftime('%m/%d')(value), '01/02')
+
+    def test_without_directives(self):
+        assert_equal(compile_strftime('today')(self.value), 'today')
+
+    def test_unsupported_directive_falls_back_to_strftime(self):
+        formatter = compile_strftime('%a %d %b')
+        assert_equal(formatter.template, None)
+        assert_equal(formatter(self.value), self.value.strftime('%a %d %b'))
+
+    def test_pickle(self):
+        formatter = pickle.loads(pickle.dumps(compile_strftime('%Y/%m')))
+        assert_equal(formatter(self.value), '2014/01')
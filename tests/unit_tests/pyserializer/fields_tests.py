@@ -8,6 +8,69 @@ import uuid
 import six
 
 from pyserializer.fields import *  # flake8: noqa
+from pyserializer import validators
+
+
+class TestField:
+
+    def test_validate_many(self):
+        field = Field(validators=[
+            validators.RequiredValidator(),
+            validators.MaxValueValidator(5),
+        ])
+        errors = field.validate_many([1, None, 6, 2, ''])
+        assert_equal(list(errors.keys()), [1, 2, 4])
+        assert_equal(errors[1][0]['type_name'], 'RequiredValidator')
+        assert_equal(errors[2], field.validate(6))
+
+    def test_restore_with_errors(self):
+        field = IntegerField()
+        assert_equal(field.restore('1', []), (1, []))
+        errors = [{'message': 'foo'}]
+        assert_equal(field.restore('1', errors), (None, errors))
+
+    def test_to_native_many(self):
+        output = Field().to_native_many([1, 'foo', None, lambda: 'bar'])
+        assert_equal(output, [1, 'foo', None, 'bar'])
+
+    def test_to_native_many_with_overridden_to_native(self):
+        class UpperField(Field):
+            def to_native(self, value):
+                return value.upper()
+        assert_equal(UpperField().to_native_many(['foo']), ['FOO'])
+
+    def test_field_to_native_without_initialize(self):
+        user = Mock(username='foobar')
+        output = Field().field_to_native(user, 'username')
+        assert_equal(output, 'foobar')
+
+    def test_bind(self):
+        field = Field()
+        parent = Mock()
+        bound_field = field.bind(
+            parent=parent,
+            field_name='username',
+            allow_blank_source=True
+        )
+        assert_equal(bound_field.parent, parent)
+        assert_equal(bound_field.field_name, 'username')
+        assert_true(bound_field.allow_blank_source)
+        assert_equal(field.parent, None)
+        assert_equal(field.field_name, None)
+        assert_false(field.allow_blank_source)
+
+    def test_validate(self):
+        field = Field(validators=[validators.MaxLengthValidator(3)])
+        assert_equal(field.validate('foo'), [])
+        errors = field.validate('foobar')
+        assert_equal(errors[0]['type_name'], 'MaxLengthValidator')
+
+    def test_restore(self):
+        field = Field(validators=[validators.MaxLengthValidator(3)])
+        assert_equal(field.restore('foo'), ('foo', []))
+        value, errors = field.restore('foobar')
+        assert_equal(value, None)
+        assert_equal(len(errors), 1)
 
 
 class TestCharField:
@@ -19,6 +82,13 @@ class TestCharField:
 
 class TestDateField(object):
 
+    def test_to_native_with_cache(self):
+        field = DateField(format='%d/%m/%Y', cache_size=10)
+        for day in (1, 2, 1, 1):
+            output = field.to_native(date(2014, 1, day))
+        assert_equal(output, '01/01/2014')
+        assert_equal(field.cache.hit_rate, 0.5)
+
     def test_to_native_with_datetime(self):
         value = datetime(2014, 1, 1, 10, 30)
         output = DateField().to_native(value)
@@ -53,6 +123,18 @@ class TestDateField(object):
         output = DateField(format='%Y-%m-%d').to_python('')
         assert_equal(output, None)
 
+    def test_restore_parses_once(self):
+        field = DateField(format='%Y-%m-%d')
+        with patch.object(field.parse_validator, 'is_valid') as is_valid:
+            output = field.restore('2014-01-01')
+        assert_equal(output, (date(2014, 1, 1), []))
+        assert_false(is_valid.called)
+
+    def test_restore_with_invalid_value(self):
+        value, errors = DateField(format='%Y-%m-%d').restore('2014/01/01')
+        assert_equal(value, None)
+        assert_equal(errors[0]['type_name'], 'DateValidator')
+
 
 class TestDateTimeField:
 
@@ -66,12 +148,44 @@ class TestDateTimeField:
         output = DateTimeField(format='%Y-%m-%dT%H:%M:%SZ').to_native(value)
         assert_equal(output, '2014-01-01T10:30:00Z')
 
+    def test_to_native_with_cache(self):
+        field = DateTimeField(cache_size=10)
+        value = datetime(2014, 1, 1, 10, 30)
+        assert_equal(field.to_native(value), '2014-01-01T10:30:00')
+        assert_equal(field.to_native(value), '2014-01-01T10:30:00')
+        assert_equal((field.cache.hits, field.cache.misses), (1, 1))
+
+    def test_cache_is_disabled_by_default(self):
+        assert_equal(DateTimeField().cache, None)
+
+    def test_to_native_many(self):
+        values = [datetime(2014, 1, 1, 10, 30), None]
+        output = DateTimeField(format='%d/%m/%Y %H:%M').to_native_many(values)
+        assert_equal(output, ['01/01/2014 10:30', None])
+
+    def test_to_native_many_with_overridden_to_native(self):
+        class YearField(DateTimeField):
+            def to_native(self, value):
+                return value.year
+
+        output = YearField().to_native_many([datetime(2014, 1, 1, 10, 30)])
+        assert_equal(output, [2014])
+
     def test_to_python(self):
         input_value = '2014-01-01T10:30:00Z'
         output = DateTimeField(format='%Y-%m-%dT%H:%M:%SZ')\
             .to_python(input_value)
         assert_equal(output, datetime(2014, 1, 1, 10, 30))
 
+    def test_to_python_with_iso_8601(self):
+        output = DateTimeField().to_python('2014-01-01T10:30:00')
+        assert_equal(output, datetime(2014, 1, 1, 10, 30))
+
+    def test_to_python_with_iso_8601_utc(self):
+        value = DateTimeField().to_python('2014-01-01T10:30:00Z')
+        assert_equal(value.utcoffset().total_seconds(), 0)
+        assert_equal(DateTimeField().to_native(value), '2014-01-01T10:30:00Z')
+
     def test_to_python_with_datetime_object(self):
         input_value = datetime(2014, 1, 1, 10, 30)
         output = DateTimeField(format='%Y-%m-%dT%H:%M:%SZ')\
@@ -93,6 +207,20 @@ class TestDateTimeField:
 
 class TestUUIDField:
 
+    def test_to_native_many(self):
+        value = uuid.uuid4()
+        output = UUIDField().to_native_many([value, None])
+        assert_equal(output, [six.text_type(value), None])
+
+    def test_to_native_many_with_overridden_to_native(self):
+        class HexUUIDField(UUIDField):
+            def to_native(self, value):
+                return value.hex
+
+        value = uuid.UUID(int=1)
+        output = HexUUIDField().to_native_many([value])
+        assert_equal(output, [value.hex])
+
     def test_to_native(self):
         value = uuid.uuid4()
         output = UUIDField().to_native(value)
@@ -1,6 +1,9 @@
 from nose.tools import *  # flake8: noqa
 from mock import *  # flake8: noqa
 
+import copy
+import threading
+
 from pyserializer.utils import *  # flake8: noqa
 
 
@@ -78,3 +81,167 @@ class TestUtil:
     def test_filter_list(self):
         output = filter_list([1, True, False, None])
         assert_equal(output, [1, True, False])
+
+    def test_get_object_by_source_with_dict_and_obj_and_dot_syntax(self):
+        user = Mock(name='user', username='foo.bar.com')
+        comment = {'user': user}
+        output = get_object_by_source(
+            comment,
+            source='user.username'
+        )
+        assert_equal(output, 'foo.bar.com')
+
+    def test_get_object_by_source_with_allow_blank_source(self):
+        comment = Mock(name='comment', user=None)
+        output = get_object_by_source(
+            comment,
+            source='user.username',
+            allow_blank_source=True
+        )
+        assert_equal(output, None)
+
+    def test_get_object_by_source_without_allow_blank_source(self):
+        comment = Mock(name='comment', user=None)
+        with assert_raises(AttributeError):
+            get_object_by_source(comment, source='user.username')
+
+    def test_get_source_accessor_is_cached(self):
+        accessor = get_source_accessor('user.username')
+        assert_true(accessor is get_source_accessor('user.username'))
+        assert_false(accessor is get_source_accessor('user.username', True))
+
+    def test_get_source_accessor(self):
+        user = Mock(name='user', username='foo.bar.com')
+        accessor = get_source_accessor('user.username')
+        assert_equal(accessor({'user': user}), 'foo.bar.com')
+        assert_equal(accessor(Mock(name='comment', user=user)), 'foo.bar.com')
+
+    def test_is_mapping(self):
+        assert_true(is_mapping({}))
+        assert_false(is_mapping([]))
+
+    def test_is_simple_callable_with_native_types(self):
+        for value in ('foo', 1, 1.5, True, None):
+            assert_false(is_simple_callable(value))
+
+    def test_is_simple_callable_with_bound_method(self):
+        class Foo(object):
+            def bar(self):
+                pass
+
+            def baz(self, name):
+                pass
+        assert_true(is_simple_callable(Foo().bar))
+        assert_false(is_simple_callable(Foo().baz))
+
+    def test_is_simple_callable_with_defaults(self):
+        def foo(name='foo'):
+            pass
+
+        def bar(name):
+            pass
+        assert_true(is_simple_callable(foo))
+        assert_false(is_simple_callable(bar))
+
+
+class TestMakeSlotsClass:
+
+    def setup(self):
+        self.User = make_slots_class('User', ['email', 'username'])
+
+    def test_attributes(self):
+        user = self.User(email='foo@example.com')
+        assert_equal(user.email, 'foo@example.com')
+        assert_equal(user.username, None)
+        assert_false(hasattr(user, '__dict__'))
+
+    def test_repr(self):
+        user = self.User(email='foo@example.com', username='foobar')
+        assert_equal(
+            repr(user),
+            "User(email='foo@example.com', username='foobar')"
+        )
+
+    def test_eq(self):
+        assert_equal(self.User(email='foo'), self.User(email='foo'))
+        assert_not_equal(self.User(email='foo'), self.User(email='bar'))
+
+
+class TestLRUCache:
+
+    def setup(self):
+        self.cache = LRUCache(2)
+
+    def test_get_and_set(self):
+        self.cache.set('foo', 1)
+        assert_equal(self.cache.get('foo'), 1)
+        assert_equal(self.cache.get('bar'), None)
+        assert_equal(self.cache.get('bar', 2), 2)
+
+    def test_discards_least_recently_used(self):
+        self.cache.set('foo', 1)
+        self.cache.set('bar', 2)
+        self.cache.get('foo')
+        self.cache.set('baz', 3)
+        assert_equal(len(self.cache), 2)
+        assert_equal(self.cache.get('bar'), None)
+        assert_equal(self.cache.get('foo'), 1)
+
+    def test_hit_rate(self):
+        assert_equal(self.cache.hit_rate, 0.0)
+        self.cache.set('foo', 1)
+        self.cache.get('foo')
+        self.cache.get('foo')
+        self.cache.get('foo')
+        self.cache.get('bar')
+        assert_equal((self.cache.hits, self.cache.misses), (3, 1))
+        assert_equal(self.cache.hit_rate, 0.75)
+        self.cache.clear()
+        assert_equal((len(self.cache), self.cache.hit_rate), (0, 0.0))
+
+    def test_deepcopy(self):
+        self.cache.set('foo', 1)
+        cache = copy.deepcopy(self.cache)
+        assert_equal(cache.get('foo'), 1)
+
+
+class TestMemo:
+
+    def test_get_and_set(self):
+        memo = Memo()
+        obj = object()
+        output = {'foo': 'bar'}
+        memo.set(id(obj), obj, output)
+        assert_true(id(obj) in memo)
+        assert_true(memo.get(id(obj)) is output)
+        assert_equal(memo.hits, 1)
+        assert_equal(len(memo), 1)
+
+    def test_get_missing_key(self):
+        with assert_raises(KeyError):
+            Memo().get(1)
+
+    def test_copy(self):
+        memo = Memo(copy=True)
+        output = {'foo': ['bar']}
+        memo.set(1, None, output)
+        assert_equal(memo.get(1), output)
+        assert_false(memo.get(1) is output)
+        assert_false(memo.get(1)['foo'] is output['foo'])
+
+    def test_activate_memo(self):
+        memo = Memo()
+        assert_equal(get_active_memo(), None)
+        with activate_memo(memo):
+            assert_true(get_active_memo() is memo)
+        assert_equal(get_active_memo(), None)
+
+    def test_memo_is_per_thread(self):
+        output = []
+        with activate_memo(Memo()):
+            thread = threading.Thread(
+                target=lambda: output.append(get_active_memo())
+            )
+            thread.start()
+            thread.join()
+        assert_equal(output, [None])
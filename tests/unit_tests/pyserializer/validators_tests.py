@@ -113,3 +113,121 @@ class TestEmailValidator:
         value = 'bob@gmail.com'
         validator = validators.EmailValidator()
         assert_equal(validator(value), None)
+
+
+class TestDateTimeValidator:
+
+    def test_valid_iso_8601(self):
+        validator = validators.DateTimeValidator()
+        assert_equal(validator('2014-01-01T10:30:00Z'), None)
+        assert_equal(validator('2014-01-01T10:30:00.123+05:30'), None)
+
+    @raises(ValidationError)
+    def test_invalid_iso_8601_raises(self):
+        validator = validators.DateTimeValidator()
+        validator('2014-01-01 foo')
+
+    def test_valid_with_specified_format(self):
+        validator = validators.DateTimeValidator('%Y/%m/%d')
+        assert_equal(validator('2014/01/01'), None)
+
+
+class TestDateValidator:
+
+    def test_valid_iso_8601(self):
+        validator = validators.DateValidator()
+        assert_equal(validator('2014-01-01'), None)
+
+    @raises(ValidationError)
+    def test_invalid_iso_8601_raises(self):
+        validator = validators.DateValidator()
+        validator('2014-13-01')
+
+
+class TestValidateMany:
+
+    def assert_validate_many(self, validator, values, expected):
+        assert_equal(validator.validate_many(values), expected)
+        # The same result without NumPy
+        with patch.object(validators, 'numpy', None):
+            assert_equal(validator.validate_many(values), expected)
+        # The same result as validating the values one by one
+        mask = []
+        for value in values:
+            try:
+                validator(value)
+                mask.append(False)
+            except ValidationError:
+                mask.append(True)
+        assert_equal(mask, expected)
+
+    def test_required_validator(self):
+        self.assert_validate_many(
+            validators.RequiredValidator(),
+            ['foo', '', None, 0],
+            [False, True, True, False]
+        )
+
+    def test_max_value_validator(self):
+        validator = validators.MaxValueValidator(5)
+        self.assert_validate_many(validator, [1, 5, 7.5], [False, True, True])
+        self.assert_validate_many(
+            validator,
+            [1, '7', None],
+            [False, True, False]
+        )
+
+    def test_min_value_validator(self):
+        validator = validators.MinValueValidator(2)
+        self.assert_validate_many(validator, [1, 2, 3.5], [True, False, False])
+
+    def test_min_value_validator_with_large_integers(self):
+        validator = validators.MinValueValidator(2 ** 53 + 1)
+        self.assert_validate_many(validator, [2 ** 53, 0.5], [True, True])
+        self.assert_validate_many(
+            validator,
+            [2 ** 53 + 1, 2 ** 60],
+            [False, False]
+        )
+        validator = validators.MinValueValidator(2)
+        self.assert_validate_many(
+            validator,
+            [2 ** 53 + 1, 0.5],
+            [False, True]
+        )
+
+    def test_max_value_validator_with_large_integers(self):
+        validator = validators.MaxValueValidator(2 ** 53 + 1)
+        self.assert_validate_many(validator, [2 ** 53 + 1, 1], [True, False])
+
+    def test_integer_validator(self):
+        validator = validators.IntegerValidator()
+        self.assert_validate_many(validator, [1, 2, 3], [False, False, False])
+        self.assert_validate_many(validator, [1.0, 2.5], [True, True])
+        self.assert_validate_many(validator, [1, 2.5], [False, True])
+        self.assert_validate_many(validator, [2.5, 1, 3], [True, False, False])
+        self.assert_validate_many(
+            validator,
+            [1, '2', 'foo', None, 1.5],
+            [False, False, True, False, True]
+        )
+
+    def test_float_validator(self):
+        validator = validators.FloatValidator()
+        self.assert_validate_many(validator, [1, 2.5], [False, False])
+        self.assert_validate_many(
+            validator,
+            ['1.5', 'foo', True],
+            [False, True, True]
+        )
+
+    def test_overridden_is_valid(self):
+        class PositiveValidator(validators.IntegerValidator):
+            def is_valid(self, value):
+                return int(value) > 0
+
+        self.assert_validate_many(
+            PositiveValidator(),
+            [1, -1, 2],
+            [False, True, False]
+        )